@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x (Python 3.11+)
+# 매니페스트 기반 일괄 렌더: 여러 씬 파일/클래스를 프로세스 풀에서 동시에 렌더
+# 사용 예:
+#   python batch_render.py render_manifest.json
+#   python batch_render.py render_manifest.json -j 4 --timings out/timings.json
+#   python batch_render.py render_manifest.json --contact-sheets out/sheets   # 영상 대신 컨택트 시트만 (contact_sheet.py)
+#
+# 매니페스트 형식 (경로는 매니페스트 파일 기준 상대 경로)
+#   {
+#     "defaults": {"quality": "h"},
+#     "jobs": [
+#       {"file": "h_1.py", "scene": "OnboardingFlow", "output": "h1_onboarding"},
+#       {"file": "onb_5.py", "scene": "OnboardingFlow", "quality": "l"}
+#     ]
+#   }
+#
+# - 같은 클래스 이름(OnboardingFlow 등)이 여러 파일에 있어도 파일 경로로 구분해 로딩
+# - 작업마다 새 프로세스(max_tasks_per_child=1): 씬 파일이 바꾼 config 가 다음 작업에 새지 않음
+# - 지난 실행 시간(timings 파일)이 있으면 그 값, 없으면 저장된 timeline(checkpoint.py)의 영상 길이로
+#   긴 작업부터 배치. 둘 다 없으면 씬 파일의 self.play/self.wait 호출 수로 어림한다 (부모에서 드라이런하지 않음)
+# - 끝나면 작업별 소요 시간을 timings 파일(JSON)로 저장
+# - --trace out.json: 작업마다 프로세스 트랙이 나뉜 Chrome 트레이스 저장 (render_trace.py)
+# - --contact-sheets DIR: 작업마다 섹션 끝 화면 PNG (<DIR>/<output 또는 파일_씬>.png) 만 만들어 변형 검토
+# - partial 영상은 공유 세그먼트 캐시(segment_cache.py)를 쓰므로 데이터만 바뀐 변형은 바뀐 play 만 렌더
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from manim import *
+
+import render_trace
+from contact_sheet import export_contact_sheet
+from checkpoint import cached_timeline
+from render_common import apply_quality, load_scene_class
+from segment_cache import CachingRenderer
+
+
+# ===== 매니페스트 =====
+def load_manifest(path):
+    path = Path(path).resolve()
+    with open(path, encoding="utf-8") as fp:
+        data = json.load(fp)
+    defaults = data.get("defaults", {})
+    jobs = []
+    for raw in data["jobs"]:
+        job = {**defaults, **raw}
+        job["file"] = str((path.parent / job["file"]).resolve())
+        job.setdefault("quality", "h")
+        job.setdefault("output", None)
+        job.setdefault("elide", True)
+        job["key"] = "{}::{}::{}::{}".format(job["file"], job["scene"], job["quality"], job["output"])
+        jobs.append(job)
+    return jobs
+
+
+# ===== 작업 순서 =====
+def _load_timings(path):
+    try:
+        with open(path, encoding="utf-8") as fp:
+            return {r["key"]: r for r in json.load(fp)["jobs"] if r.get("ok")}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+_SCENE_CALL = re.compile(r"\bself\.(?:play|wait)\(")
+
+
+def static_cost(path):
+    # 드라이런 없이 씬 파일에서 바로 세는 작업 크기: self.play/self.wait 호출 수
+    # (반복문/헬퍼 안의 호출도 한 번으로 세므로 대략의 순서만 정함)
+    try:
+        return len(_SCENE_CALL.findall(Path(path).read_text(encoding="utf-8")))
+    except OSError:
+        return 0
+
+
+def estimate_costs(jobs, previous):
+    # 지난 실행 시간(초) 우선. 없으면 저장된 timeline 영상 길이 x (지난 실행의 실행시간/영상길이 비율)
+    # 둘 다 없으면 static_cost x (지난 실행의 실행시간/호출 수 비율)
+    # 수백 개 변형을 부모에서 차례로 드라이런하면 그만큼 시작이 늦어지므로 캐시와 소스만 본다
+    counts = {}
+
+    def count(path):
+        if path not in counts:
+            counts[path] = static_cost(path)
+        return counts[path]
+
+    ratios = [r["wall"] / r["duration"] for r in previous.values() if r.get("duration")]
+    ratio = sorted(ratios)[len(ratios) // 2] if ratios else 1.0
+    per_call = [r["wall"] / count(r["file"]) for r in previous.values() if count(r["file"])]
+    per_call = sorted(per_call)[len(per_call) // 2] if per_call else None
+    unknown = []
+    known = []
+    for job in jobs:
+        prev = previous.get(job["key"])
+        index = cached_timeline(job["file"], job["scene"]) if prev is None else None
+        job["static"] = count(job["file"])
+        if prev is not None:
+            job["estimate"] = prev["wall"]
+        elif index is not None:
+            job["estimate"] = index["duration"] * ratio
+        elif per_call is not None:
+            job["estimate"] = job["static"] * per_call
+        else:
+            # 첫 실행: 초 단위로 바꿀 기준이 없으므로 호출 수 순으로 먼저 넣음
+            job["estimate"] = None
+            unknown.append(job)
+            continue
+        known.append(job)
+    unknown.sort(key=lambda j: -j["static"])
+    return unknown + sorted(known, key=lambda j: -j["estimate"])
+
+
+# ===== 워커 =====
+def _run_job(job):
+    t0 = time.perf_counter()
+    result = {"key": job["key"], "file": job["file"], "scene": job["scene"],
+              "quality": job["quality"], "estimate": round(job["estimate"] or 0.0, 2)}
+    render_trace.name_process("{} {}".format(Path(job["file"]).name, job["scene"]))
+    try:
+        apply_quality(job["quality"])
+        cls = load_scene_class(job["file"], job["scene"])
+        if job["output"]:
+            config.output_file = job["output"]
+        if job.get("sheets"):
+            name = job["output"] or "{}_{}".format(Path(job["file"]).stem, job["scene"])
+            result["sheet"] = str(export_contact_sheet(cls, Path(job["sheets"]) / "{}.png".format(name)))
+        else:
+            renderer = CachingRenderer() if job["elide"] else None
+            scene = cls(renderer=renderer)
+            scene.render()
+            result["movie"] = str(scene.renderer.file_writer.movie_file_path)
+            result["duration"] = round(scene.renderer.time, 3)
+        result["ok"] = True
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc(limit=5)
+    result["wall"] = round(time.perf_counter() - t0, 2)
+    return result
+
+
+def run_batch(jobs, workers=None):
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    t0 = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        # 제출 순서 = 예상 시간이 긴 순서
+        futures = [pool.submit(_run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            state = "완료" if result["ok"] else "실패"
+            print("[{}] {} {} ({:.1f}s)".format(state, Path(result["file"]).name, result["scene"], result["wall"]))
+            results.append(result)
+    return {"workers": workers, "wall": round(time.perf_counter() - t0, 2), "jobs": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="매니페스트 일괄 렌더")
+    parser.add_argument("manifest", help="매니페스트 JSON")
+    parser.add_argument("-j", "--jobs", type=int, help="동시 프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--timings", help="작업별 시간 기록 JSON (기본: <매니페스트>.timings.json)")
+    parser.add_argument("--trace", help="Chrome 트레이스 JSON 저장 경로")
+    parser.add_argument("--contact-sheets", metavar="DIR", help="영상 대신 작업별 컨택트 시트 PNG 저장")
+    args = parser.parse_args(argv)
+    if args.trace:
+        render_trace.start(args.trace)
+        render_trace.name_process("batch_render " + Path(args.manifest).name)
+
+    suffix = ".sheets.timings.json" if args.contact_sheets else ".timings.json"
+    timings_path = args.timings or str(Path(args.manifest).with_suffix(suffix))
+    jobs = load_manifest(args.manifest)
+    if args.contact_sheets:
+        for job in jobs:
+            job["sheets"] = str(Path(args.contact_sheets).resolve())
+            job["key"] += "::sheet"  # 영상 렌더와 시간 기록을 섞지 않음
+    jobs = estimate_costs(jobs, _load_timings(timings_path))
+    summary = run_batch(jobs, args.jobs)
+
+    Path(timings_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(timings_path, "w", encoding="utf-8") as fp:
+        json.dump(summary, fp, ensure_ascii=False, indent=2)
+    if args.trace:
+        render_trace.merge(args.trace)
+    busy = sum(r["wall"] for r in summary["jobs"])
+    print("작업 {}개 · 프로세스 {}개 · 전체 {:.1f}s (작업 합계 {:.1f}s) -> {}".format(
+        len(summary["jobs"]), summary["workers"], summary["wall"], busy, timings_path))
+    return 0 if all(r["ok"] for r in summary["jobs"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
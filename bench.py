@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x (Linux/macOS: os.wait4 로 최대 메모리 측정)
+# 렌더 벤치마크: 저장소의 씬들을 품질/렌더러 조합별로 렌더해 시간·fps·메모리·파일 크기를 기록하고 비교
+# 사용 예:
+#   python bench.py run -o bench/baseline.json                 # 전체 (-ql, -qh / plain, fast, full)
+#   python bench.py run -q l --modes plain,full --only onb_5.py -o bench/current.json
+#   python bench.py run --warm --repeat 3 -o bench/current.json
+#   python bench.py compare bench/baseline.json bench/current.json --threshold 0.1
+#
+# - 작업마다 새 파이썬 프로세스에서 렌더 (import/폰트 초기화 포함한 전체 시간과 렌더 시간을 따로 기록)
+# - 최대 메모리(peak RSS)는 자식 프로세스를 os.wait4 로 거둘 때의 ru_maxrss
+# - media_dir / 세그먼트 캐시 / 히어로 캐시는 작업마다 빈 임시 폴더 (항상 콜드 렌더)
+#   --warm 이면 같은 폴더로 한 번 더 렌더해 warm_* 항목으로 기록 (캐시 효과 측정용)
+# - --repeat N 이면 N 번 중 가장 빠른 실행을 기록 (나머지는 runs 에 남김)
+# - 렌더러 모드
+#     plain  : Manim 기본 CairoRenderer
+#     fast   : FastRenderer (중복 프레임 생략, 정지 레이어 재사용)
+#     cached : CachingRenderer (+ 세그먼트 캐시)
+#     full   : CachingRenderer + 페이드 합성 + 아핀 스프라이트
+# - compare: 시간/메모리/크기가 threshold 비율 넘게 늘거나 fps 가 그만큼 줄면 회귀로 표시, 종료 코드 1
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+BENCH_SCENES = [
+    ("h_1.py", "OnboardingFlow"),
+    ("h_2.py", "HDHI_Report_2025H1"),
+    ("h_5.py", "OnboardingFlow"),
+    ("onb_2.py", "SWH_Onboarding"),
+    ("onb_3.py", "ECOCAP_Onboarding"),
+    ("onb_4.py", "OnboardingFlow"),
+    ("onb_5.py", "Intro"),
+    ("onb_5.py", "OnboardingFlow"),
+    ("onb_6.py", "OnboardingFlow"),
+]
+MODES = ("plain", "fast", "cached", "full")
+DEFAULT_MODES = ("plain", "fast", "full")
+
+# 비교 항목: (키, 커질수록 나쁜가)
+METRICS = (
+    ("wall", True),
+    ("render_wall", True),
+    ("fps", False),
+    ("peak_rss_mb", True),
+    ("size_bytes", True),
+)
+
+
+# ===== 작업 프로세스 =====
+def _make_renderer(mode):
+    if mode == "plain":
+        return None
+    if mode == "fast":
+        from fast_renderer import FastRenderer
+        return FastRenderer()
+    from segment_cache import CachingRenderer
+    if mode == "cached":
+        return CachingRenderer()
+    return CachingRenderer(composite_fades=True, affine_sprites=True)
+
+
+def _worker(job, result_path):
+    from manim import config
+
+    from render_common import apply_quality, load_scene_class
+
+    apply_quality(job["quality"])
+    cls = load_scene_class(job["file"], job["scene"])
+    config.media_dir = job["media_dir"]
+    t0 = time.perf_counter()
+    scene = cls(renderer=_make_renderer(job["mode"]))
+    scene.render()
+    render_wall = time.perf_counter() - t0
+    renderer = scene.renderer
+    movie = Path(renderer.file_writer.movie_file_path)
+    result = {
+        "render_wall": render_wall,
+        "duration": renderer.time,
+        "frames": int(round(renderer.time * config.frame_rate)),
+        "movie": str(movie),
+        "size_bytes": movie.stat().st_size if movie.exists() else 0,
+    }
+    with open(result_path, "w", encoding="utf-8") as fp:
+        json.dump(result, fp)
+
+
+# ===== 측정 =====
+def _run_once(job, work_dir, log):
+    result_path = Path(work_dir) / "result.json"
+    env = dict(os.environ)
+    env["SEGMENT_CACHE_DIR"] = str(Path(work_dir) / "segment_cache")
+    env["HERO_CACHE_DIR"] = str(Path(work_dir) / "hero_cache")
+    job = dict(job, media_dir=str(Path(work_dir) / "media"))
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "_worker", json.dumps(job), str(result_path)],
+        cwd=str(Path(job["file"]).parent), env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0 or not result_path.exists():
+        return {"ok": False, "wall": wall, "exit": proc.returncode}
+    with open(result_path, encoding="utf-8") as fp:
+        result = json.load(fp)
+    result_path.unlink()
+    result.update({
+        "ok": True,
+        "wall": wall,
+        "fps": result["frames"] / result["render_wall"] if result["render_wall"] else 0.0,
+        # Linux 는 KB, macOS 는 바이트
+        "peak_rss_mb": usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    })
+    return result
+
+
+def _rounded(result):
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in result.items()}
+
+
+def bench_job(job, repeat=1, warm=False, log=None):
+    runs = []
+    warm_run = None
+    for _ in range(repeat):
+        work_dir = tempfile.mkdtemp(prefix="bench_")
+        try:
+            runs.append(_run_once(job, work_dir, log))
+            if warm and warm_run is None and runs[-1]["ok"]:
+                warm_run = _run_once(job, work_dir, log)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    ok = [r for r in runs if r["ok"]]
+    if not ok:
+        return {"ok": False, "runs": [_rounded(r) for r in runs]}
+    best = dict(min(ok, key=lambda r: r["wall"]))
+    best.pop("movie", None)
+    if len(runs) > 1:
+        best["runs"] = [round(r["wall"], 3) for r in runs]
+    if warm_run is not None and warm_run["ok"]:
+        best["warm_wall"] = warm_run["wall"]
+        best["warm_render_wall"] = warm_run["render_wall"]
+    return _rounded(best)
+
+
+def run(qualities, modes, only=None, repeat=1, warm=False, log_path=None):
+    jobs = []
+    for file, scene in BENCH_SCENES:
+        if only and file not in only and scene not in only:
+            continue
+        for quality in qualities:
+            for mode in modes:
+                jobs.append({"file": str(HERE / file), "scene": scene, "quality": quality, "mode": mode})
+    results = {}
+    log = open(log_path, "a", encoding="utf-8") if log_path else subprocess.DEVNULL
+    try:
+        for i, job in enumerate(jobs, 1):
+            key = "{}::{}::{}::{}".format(Path(job["file"]).name, job["scene"], job["quality"], job["mode"])
+            result = bench_job(job, repeat, warm, log)
+            results[key] = result
+            if result["ok"]:
+                print("[{}/{}] {:<48} {:>7.1f}s  {:>6.1f}fps  {:>6.0f}MB  {:>8.1f}KB".format(
+                    i, len(jobs), key, result["wall"], result["fps"], result["peak_rss_mb"],
+                    result["size_bytes"] / 1024))
+            else:
+                print("[{}/{}] {:<48} 실패".format(i, len(jobs), key))
+    finally:
+        if log_path:
+            log.close()
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": "{} ({}, {} cores)".format(platform.node(), platform.machine(), os.cpu_count()),
+        "results": results,
+    }
+
+
+# ===== 비교 =====
+def compare(baseline, current, threshold=0.1):
+    # [(키, 항목, 기준값, 현재값, 변화율, 회귀 여부)]
+    rows = []
+    for key, cur in sorted(current["results"].items()):
+        base = baseline["results"].get(key)
+        if not base or not base.get("ok") or not cur.get("ok"):
+            continue
+        for metric, higher_is_worse in METRICS:
+            b, c = base.get(metric), cur.get(metric)
+            if not b or c is None:
+                continue
+            change = (c - b) / b
+            worse = change > threshold if higher_is_worse else change < -threshold
+            rows.append((key, metric, b, c, change, worse))
+    return rows
+
+
+def format_compare(rows):
+    lines = ["{:<48} {:<12} {:>12} {:>12} {:>8}".format("작업", "항목", "기준", "현재", "변화")]
+    for key, metric, b, c, change, worse in rows:
+        lines.append("{:<48} {:<12} {:>12.2f} {:>12.2f} {:>+7.1f}%{}".format(
+            key, metric, b, c, change * 100, "  <- 회귀" if worse else ""))
+    regressions = sum(1 for row in rows if row[5])
+    lines.append("회귀 {}건".format(regressions))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="렌더 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_run = sub.add_parser("run", help="벤치마크 실행")
+    p_run.add_argument("-q", "--quality", default="l,h", help="쉼표로 구분 (기본 l,h)")
+    p_run.add_argument("--modes", default=",".join(DEFAULT_MODES), help="plain/fast/cached/full 중 쉼표로 구분")
+    p_run.add_argument("--only", nargs="*", help="씬 파일 또는 클래스 이름으로 거르기")
+    p_run.add_argument("--repeat", type=int, default=1, help="반복 횟수 (가장 빠른 값 기록)")
+    p_run.add_argument("--warm", action="store_true", help="같은 캐시로 한 번 더 렌더해 warm_* 기록")
+    p_run.add_argument("--log", help="렌더 로그 파일")
+    p_run.add_argument("-o", "--output", default="bench/current.json", help="결과 JSON")
+    p_run.add_argument("--compare", help="끝난 뒤 비교할 기준 JSON")
+    p_run.add_argument("--threshold", type=float, default=0.1)
+    p_cmp = sub.add_parser("compare", help="기준과 비교")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 변화율 (기본 0.1 = 10%%)")
+    p_worker = sub.add_parser("_worker")
+    p_worker.add_argument("job")
+    p_worker.add_argument("result")
+    args = parser.parse_args(argv)
+
+    if args.command == "_worker":
+        sys.path.insert(0, str(HERE))
+        _worker(json.loads(args.job), args.result)
+        return 0
+
+    if args.command == "run":
+        modes = [m for m in args.modes.split(",") if m]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            parser.error("알 수 없는 모드: {}".format(", ".join(sorted(unknown))))
+        summary = run(args.quality.split(","), modes, args.only, args.repeat, args.warm, args.log)
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(summary, fp, ensure_ascii=False, indent=2)
+        print("-> {}".format(args.output))
+        if not args.compare:
+            return 0 if all(r["ok"] for r in summary["results"].values()) else 1
+        baseline_path, current = args.compare, summary
+    else:
+        baseline_path = args.baseline
+        with open(args.current, encoding="utf-8") as fp:
+            current = json.load(fp)
+    with open(baseline_path, encoding="utf-8") as fp:
+        baseline = json.load(fp)
+    rows = compare(baseline, current, args.threshold)
+    print(format_compare(rows))
+    return 1 if any(row[5] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 체크포인트 시점 찾기: 섹션 이름/영상 시각으로 play 경계를 찾아 그 지점부터만 렌더
+# 사용 예:
+#   python render.py h_1.py -q h --from-section "Start Here"   # CTA 섹션부터 -> <씬>_from_playNNN.mp4
+#   python render.py h_1.py -q h --from-time 42.0         # 42초가 들어 있는 play 부터
+#   from checkpoint import seek, retarget
+#   entry = seek("h_1.py", "OnboardingFlow", section="Start Here")
+#   scene = OnboardingFlow(); retarget(scene, entry); scene.render()
+#
+# - 체크포인트 = play 경계. 씬 파일의 드라이런(dry_run.py)으로 play 별 시작 시각/길이/섹션 표(timeline)를 만들고
+#   씬 파일 경로 + 씬 파일 폴더의 소스/데이터(.py/.json/.jsonl) 내용 해시를 키로 저장해 둔다
+#   (바뀌지 않으면 다시 돌리지 않음). h_1/h_5/onb_4 처럼 같은 폴더에서 클래스 이름이 같아도 파일마다 따로 저장.
+# - "그 시점의 씬 상태"는 직렬화하지 않는다. Mobject(업데이터/클로저)와 렌더러/파일 쓰기 스레드는
+#   피클로 옮길 수 없으므로 sections.py 와 같이 construct() 를 처음부터 결정적으로 다시 실행하되
+#   config.from_animation_number 로 이전 play 는 건너뛴다 (래스터/인코딩 없음, 드라이런 수준 비용).
+# - 섹션 이름은 next_section 이름 그대로 (h_1.py 등은 update_step 헤더). 정확히 같은 이름이 없으면
+#   대소문자 무시 부분 일치가 하나일 때만 허용. play 가 없는 섹션은 시작점이 될 수 없음.
+# - 시각은 play 단위로 내림: 42.0 이 play 중간이면 그 play 의 시작부터 렌더.
+# - 결과는 <영상>_from_play<번호> 로 저장 (전체 영상을 덮어쓰지 않음). partial 폴더는 전체 렌더와 같아서
+#   세그먼트 캐시(segment_cache.py)를 그대로 나눠 쓴다 -> 고친 뒤 전체 렌더는 바뀐 play 만 다시 그림.
+#
+# 환경변수
+#   CHECKPOINT_DIR : timeline 저장 위치 (기본: <media_dir>/checkpoints)
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from manim import *
+
+from dry_run import dry_run
+from hero_cache import _file_digest
+from render_common import load_scene_class
+
+_KEY_VERSION = 2
+_SOURCE_SUFFIXES = (".py", ".json", ".jsonl")
+
+
+def cache_dir():
+    custom = os.environ.get("CHECKPOINT_DIR")
+    path = Path(custom) if custom else Path(config.media_dir) / "checkpoints"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def source_key(path, scene_name):
+    # 씬 파일과 옆 모듈/데이터(onb_template.py, companies.jsonl 등)가 바뀌면 새 키
+    path = Path(path).resolve()
+    h = hashlib.blake2b(digest_size=12)
+    h.update("{}|{}|{}".format(_KEY_VERSION, path, scene_name).encode("utf-8"))
+    folder = path.parent
+    for f in sorted(p for p in folder.iterdir() if p.suffix in _SOURCE_SUFFIXES and p.is_file()):
+        h.update(f.name.encode("utf-8"))
+        h.update(_file_digest(f).encode("ascii"))
+    return h.hexdigest()
+
+
+# ===== timeline =====
+def _timeline_path(path, scene_name, key):
+    return cache_dir() / "{}_{}_{}.json".format(Path(path).stem, scene_name, key)
+
+
+def cached_timeline(path, scene_name):
+    # 저장된 timeline 만 (드라이런하지 않음, 없으면 None)
+    cached = _timeline_path(path, scene_name, source_key(path, scene_name))
+    try:
+        with open(cached, encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def timeline(path, scene_name):
+    found = cached_timeline(path, scene_name)
+    if found is not None:
+        return found
+    key = source_key(path, scene_name)
+    cached = _timeline_path(path, scene_name, key)
+    report = dry_run(load_scene_class(path, scene_name))
+    index = {
+        "scene": scene_name,
+        "key": key,
+        "duration": report["duration"],
+        "plays": report["plays"],
+        "sections": [{k: s[k] for k in ("name", "first_play", "plays", "start", "duration")}
+                     for s in report["sections"]],
+        "timeline": report["timeline"],
+    }
+    tmp = cached.with_name("{}.{}.tmp".format(cached.name, os.getpid()))
+    with open(tmp, "w", encoding="utf-8") as fp:
+        json.dump(index, fp, ensure_ascii=False, indent=2)
+    os.replace(tmp, cached)
+    return index
+
+
+def find_play(index, section=None, time=None):
+    plays = index["timeline"]
+    if section is not None:
+        sections = [s for s in index["sections"] if s["plays"] and s["first_play"] < len(plays)]
+        names = [s["name"] for s in sections]
+        matches = [s for s in sections if s["name"] == section]
+        if not matches:
+            matches = [s for s in sections if section.lower() in s["name"].lower()]
+        if len(matches) != 1:
+            raise ValueError("{} 에서 섹션 '{}' 를 하나로 정할 수 없음 (섹션: {})".format(
+                index["scene"], section, ", ".join(names)))
+        return plays[matches[0]["first_play"]]
+    if time is None:
+        raise ValueError("section 또는 time 이 필요함")
+    if not 0 <= time < index["duration"]:
+        raise ValueError("{} 의 길이는 {:.2f}s (요청 {:.2f}s)".format(index["scene"], index["duration"], time))
+    found = plays[0]
+    for entry in plays:
+        if entry["start"] > time:
+            break
+        found = entry
+    return found
+
+
+# ===== 시점 지정 =====
+def seek(path, scene_name, section=None, time=None):
+    entry = find_play(timeline(path, scene_name), section=section, time=time)
+    config.from_animation_number = entry["play"]
+    logger.info("%s: play %d (%s, %.2fs) 부터 렌더", scene_name, entry["play"], entry["section"], entry["start"])
+    return entry
+
+
+def retarget(scene, entry):
+    # 최종 영상 이름만 바꿈 (partial 폴더는 그대로 -> 세그먼트 캐시 공유)
+    writer = scene.renderer.file_writer
+    suffix = "_from_play{:03d}".format(entry["play"])
+    for attr in ("movie_file_path", "gif_file_path"):
+        path = getattr(writer, attr, None)
+        if path is not None:
+            path = Path(path)
+            setattr(writer, attr, path.with_name(path.stem + suffix + path.suffix))
+    return writer.movie_file_path
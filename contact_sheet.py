@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 컨택트 시트: 영상 없이 섹션(또는 play) 끝 화면만 래스터해 한 장의 PNG 로 타일링
+# 사용 예:
+#   python render.py h_1.py --contact-sheet out/sheets          # 섹션 끝마다 한 칸 -> out/sheets/OnboardingFlow.png
+#   python render.py h_1.py --contact-sheet out/sheets --sheet-plays   # play 끝마다 한 칸
+#   python batch_render.py render_manifest.json --contact-sheets out/sheets   # 변형 전체 검토용
+#   from contact_sheet import export_contact_sheet
+#   export_contact_sheet(OnboardingFlow, "out/OnboardingFlow.png")
+#
+# - construct() 는 드라이런처럼 끝까지 실행하되 애니메이션 프레임은 그리지 않는다
+#   (fast_renderer.py 의 건너뛰는 play 와 같음: 정지 레이어/보간 프레임/인코딩 없음).
+# - next_section 직전(= update_step 헤더가 바뀌기 직전)과 씬 끝에서만 현재 화면을 그린다.
+#   마지막 칸이 곧 최종 화면. play 가 없는 섹션은 건너뜀.
+# - 섬네일 해상도(기본 가로 480)로 바로 그리므로 원본 해상도 래스터/축소 비용이 없다.
+# - 칸 아래 라벨: 번호, 섹션 이름, 영상 시각. 라벨 폰트는 씬 파일의 FONT (없으면 sans).
+
+import math
+import sys
+from pathlib import Path
+
+from manim import *
+from PIL import Image, ImageDraw, ImageFont
+
+from fast_renderer import FastRenderer
+from text_store import font_file
+
+THUMB_WIDTH = 480
+COLUMNS = 3
+PAD = 12
+LABEL_PX = 18
+SHEET_BG = (24, 24, 24)
+LABEL_COLOR = (235, 235, 235)
+
+
+# ===== 렌더러 =====
+class StillRenderer(FastRenderer):
+    def __init__(self, **kwargs):
+        kwargs["skip_animations"] = True
+        super().__init__(**kwargs)
+        self.stills = []
+
+    def grab(self, scene, label):
+        # play 밖에서 부르므로 건너뛰기와 무관하게 그림
+        self.update_frame(scene, ignore_skipping=True)
+        self.stills.append({
+            "label": label,
+            "play": self.num_plays - 1,
+            "time": round(self.time, 3),
+            "image": self.camera.get_image().convert("RGB"),
+        })
+
+
+def _instrumented(scene_cls, every_play):
+    class StillScene(scene_cls):
+        def __init__(self, *args, **kwargs):
+            self._still_section = "autocreated"
+            self._still_plays = 0
+            super().__init__(*args, **kwargs)
+
+        def _still_grab(self):
+            if self.renderer.num_plays == self._still_plays:
+                return  # 지난 칸 이후 play 없음
+            self._still_plays = self.renderer.num_plays
+            self.renderer.grab(self, self._still_section)
+
+        def next_section(self, name="unnamed", *args, **kwargs):
+            self._still_grab()
+            super().next_section(name, *args, **kwargs)
+            self._still_section = name
+
+        def play(self, *args, **kwargs):
+            super().play(*args, **kwargs)
+            if every_play:
+                self._still_grab()
+
+    StillScene.__name__ = scene_cls.__name__
+    StillScene.__qualname__ = scene_cls.__qualname__
+    return StillScene
+
+
+def capture_stills(scene_cls, every_play=False, width=THUMB_WIDTH):
+    height = int(round(width * config.pixel_height / config.pixel_width / 2)) * 2
+    with tempconfig({"dry_run": True, "disable_caching": True, "pixel_width": width, "pixel_height": height}):
+        scene = _instrumented(scene_cls, every_play)(renderer=StillRenderer())
+        scene.render()
+        scene._still_grab()
+    return scene.renderer.stills
+
+
+# ===== 타일링 =====
+def _label_font(scene_cls):
+    module = sys.modules.get(scene_cls.__module__)
+    found = font_file(getattr(module, "FONT", None))
+    if found is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(found[0], LABEL_PX, index=found[1])
+
+
+def tile_stills(stills, font, columns=COLUMNS):
+    tw, th = stills[0]["image"].size
+    columns = max(1, min(columns, len(stills)))
+    rows = math.ceil(len(stills) / columns)
+    cell_h = th + LABEL_PX + PAD
+    sheet = Image.new("RGB", (PAD + columns * (tw + PAD), PAD + rows * (cell_h + PAD)), SHEET_BG)
+    draw = ImageDraw.Draw(sheet)
+    for i, still in enumerate(stills):
+        x = PAD + (i % columns) * (tw + PAD)
+        y = PAD + (i // columns) * (cell_h + PAD)
+        sheet.paste(still["image"], (x, y))
+        label = "{}. {}  {:.1f}s".format(i + 1, still["label"], still["time"])
+        draw.text((x, y + th + PAD // 2), label, fill=LABEL_COLOR, font=font)
+    return sheet
+
+
+def export_contact_sheet(scene_cls, output, every_play=False, width=THUMB_WIDTH, columns=COLUMNS):
+    stills = capture_stills(scene_cls, every_play=every_play, width=width)
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if not stills:
+        logger.info("%s: play 가 없어 컨택트 시트를 만들지 않음", scene_cls.__name__)
+        return None
+    tile_stills(stills, _label_font(scene_cls), columns).save(output)
+    logger.info("%s (%d칸)", output, len(stills))
+    return output
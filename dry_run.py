@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 드라이런: construct() 의 배치/타이밍 로직만 실행 (래스터/Cairo/인코딩 없음)
+# 사용 예:
+#   python render.py onb_5.py OnboardingFlow --dry-run
+#   python render.py onb_2.py --dry-run --json report.json
+#
+# 결과
+# - 섹션별 길이(영상 타임라인 기준 초) / 실행 시간
+# - 마지막 화면의 최상위 도형 bounding box
+# - 화면(frame) 또는 템플릿 영역(header/left_flow/right_notes)을 벗어난 도형
+# - play 별 시작 시각/길이/섹션 (timeline, checkpoint.py 의 시점 찾기에 사용)
+#
+# 템플릿 영역은 HR_DATA/HR 을 가진 온보딩 씬에만 적용한다.
+# 씬 파일에 LAYOUT_REGIONS = {"이름": ((x0, y0), (x1, y1)), ...} 가 있으면 그것을 쓴다.
+# 도형은 중심점이 들어 있는 영역 기준으로 검사하며, 이미지(배경 등)는 검사하지 않는다.
+#
+# 섹션 경계
+# - 씬 파일의 헤더 함수(update_step 등)는 헤더가 바뀔 때마다 next_section(label) 을 호출한다
+#   (onb_6.py 가 원래 쓰던 방식). 드라이런 섹션 표, checkpoint.py(--from-section),
+#   contact_sheet.py 가 이 경계를 쓴다.
+# - 일반 렌더의 최종 영상은 그대로다. 달라지는 것은 --save_sections 의 섹션 영상이
+#   씬 하나("autocreated") 대신 헤더 단계마다 나온다는 점과, --stream 이 섹션 첫 프레임을
+#   키프레임으로 인코딩한다는 점뿐이다 (stream_writer.py).
+
+import sys
+import time
+
+from manim import *
+
+# ===== 설정 =====
+TEMPLATE_REGIONS = {
+    "header":      ((-7, 3),  (7, 4)),
+    "left_flow":   ((-7, -4), (1.2, 3)),
+    "right_notes": ((1.2, -4), (7, 3)),
+}
+OVERFLOW_TOL = 0.02  # 이 이하로 걸치는 것은 무시 (Manim 단위)
+
+
+# ===== 그리지 않는 카메라 =====
+class NullCamera(Camera):
+    def reset(self):
+        return self
+
+    def set_frame_to_background(self, background):
+        pass
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        pass
+
+
+# ===== 배치 정보 =====
+def layout_regions(scene_cls):
+    module = sys.modules.get(scene_cls.__module__)
+    custom = getattr(module, "LAYOUT_REGIONS", None)
+    if custom is not None:
+        return custom
+    if hasattr(module, "HR_DATA") or hasattr(module, "HR"):
+        return TEMPLATE_REGIONS
+    return {}
+
+
+def bbox(mobj):
+    (x0, y0, _), (x1, y1, _) = mobj.get_corner(DL), mobj.get_corner(UR)
+    return [round(float(v), 3) for v in (x0, y0, x1, y1)]
+
+
+def describe(mobj):
+    # 가장 먼저 나오는 Text 의 문자열, 없으면 클래스 이름
+    for m in mobj.get_family():
+        if isinstance(m, (Text, MarkupText)):
+            return "{}({!r})".format(type(mobj).__name__, m.original_text)
+    return type(mobj).__name__
+
+
+def _checkable(mobj):
+    return not isinstance(mobj, AbstractImageMobject) and len(mobj.family_members_with_points()) > 0
+
+
+def _excess(box, limits):
+    x0, y0, x1, y1 = box
+    (rx0, ry0), (rx1, ry1) = limits
+    sides = {"left": rx0 - x0, "right": x1 - rx1, "bottom": ry0 - y0, "top": y1 - ry1}
+    return {k: round(v, 3) for k, v in sides.items() if v > OVERFLOW_TOL}
+
+
+def _region_of(box, regions):
+    cx, cy = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+    for name, ((rx0, ry0), (rx1, ry1)) in regions.items():
+        if rx0 <= cx <= rx1 and ry0 <= cy <= ry1:
+            return name
+    return None
+
+
+def find_overflows(mobjects, regions):
+    fw, fh = config.frame_width / 2, config.frame_height / 2
+    frame = ((-fw, -fh), (fw, fh))
+    found = []
+    for m in mobjects:
+        if not _checkable(m):
+            continue
+        box = bbox(m)
+        checks = [("frame", frame)]
+        region = _region_of(box, regions)
+        if region is not None:
+            checks.append((region, regions[region]))
+        for name, limits in checks:
+            excess = _excess(box, limits)
+            if excess:
+                found.append({"mobject": m, "region": name, "bbox": box, "excess": excess})
+    return found
+
+
+# ===== 씬 래퍼 =====
+def _instrumented(scene_cls, regions):
+    class DryRunScene(scene_cls):
+        def __init__(self, *args, **kwargs):
+            self._dry_sections = []
+            self._dry_overflows = []
+            self._dry_seen = set()
+            self._dry_timeline = []
+            super().__init__(*args, **kwargs)
+            self._dry_open("autocreated")
+
+        def _dry_open(self, name):
+            self._dry_close()
+            self._dry_sections.append({
+                "name": name,
+                "start": self.renderer.time,
+                "first_play": self.renderer.num_plays,
+                "plays": self.renderer.num_plays,
+                "wall": time.perf_counter(),
+            })
+
+        def _dry_close(self):
+            if not self._dry_sections or "duration" in self._dry_sections[-1]:
+                return
+            sec = self._dry_sections[-1]
+            sec["duration"] = round(self.renderer.time - sec["start"], 3)
+            sec["plays"] = self.renderer.num_plays - sec["plays"]
+            sec["wall"] = round(time.perf_counter() - sec["wall"], 3)
+            sec["start"] = round(sec["start"], 3)
+            if sec["plays"] == 0:
+                self._dry_sections.pop()  # Manim 과 같이 빈 섹션은 버림
+
+        def next_section(self, name="unnamed", *args, **kwargs):
+            super().next_section(name, *args, **kwargs)
+            self._dry_open(name)
+
+        def play(self, *args, **kwargs):
+            start = self.renderer.time
+            super().play(*args, **kwargs)
+            self._dry_timeline.append({
+                "play": self.renderer.num_plays - 1,
+                "section": self._dry_sections[-1]["name"],
+                "start": round(start, 3),
+                "duration": round(self.renderer.time - start, 3),
+            })
+            for hit in find_overflows(self.mobjects, regions):
+                key = (id(hit["mobject"]), hit["region"])
+                if key in self._dry_seen:
+                    continue
+                self._dry_seen.add(key)
+                hit["mobject"] = describe(hit["mobject"])
+                hit["section"] = self._dry_sections[-1]["name"]
+                hit["play"] = self.renderer.num_plays - 1
+                hit["time"] = round(self.renderer.time, 3)
+                self._dry_overflows.append(hit)
+
+    DryRunScene.__name__ = scene_cls.__name__
+    DryRunScene.__qualname__ = scene_cls.__qualname__
+    return DryRunScene
+
+
+def dry_run(scene_cls):
+    regions = layout_regions(scene_cls)
+    with tempconfig({"dry_run": True}):
+        renderer = CairoRenderer(camera_class=NullCamera, skip_animations=True)
+        scene = _instrumented(scene_cls, regions)(renderer=renderer)
+        t0 = time.perf_counter()
+        scene.render()
+        scene._dry_close()
+        wall = time.perf_counter() - t0
+        layout = [
+            {"mobject": describe(m), "bbox": bbox(m)}
+            for m in scene.mobjects if len(m.family_members_with_points()) > 0
+        ]
+    return {
+        "scene": scene_cls.__name__,
+        "duration": round(renderer.time, 3),
+        "plays": renderer.num_plays,
+        "wall": round(wall, 3),
+        "regions": sorted(regions),
+        "sections": scene._dry_sections,
+        "timeline": scene._dry_timeline,
+        "layout": layout,
+        "overflows": scene._dry_overflows,
+    }
+
+
+# ===== 출력 =====
+def format_report(report):
+    lines = ["[{}] 길이 {:.2f}s · play {}회 · 실행 {:.2f}s".format(
+        report["scene"], report["duration"], report["plays"], report["wall"])]
+    lines.append("  섹션:")
+    for sec in report["sections"]:
+        lines.append("    {:<24} {:>7.2f}s ~ {:>7.2f}s  ({:.2f}s, play {}, 실행 {:.2f}s)".format(
+            sec["name"], sec["start"], sec["start"] + sec["duration"],
+            sec["duration"], sec["plays"], sec["wall"]))
+    lines.append("  최종 배치:")
+    for item in report["layout"]:
+        lines.append("    {}  {}".format(item["bbox"], item["mobject"]))
+    if report["overflows"]:
+        lines.append("  영역 초과 {}건:".format(len(report["overflows"])))
+        for hit in report["overflows"]:
+            lines.append("    [{}] {} @ {} (play {}, {:.2f}s) {} {}".format(
+                hit["region"], hit["mobject"], hit["section"], hit["play"],
+                hit["time"], hit["bbox"], hit["excess"]))
+    else:
+        lines.append("  영역 초과 없음")
+    return "\n".join(lines)
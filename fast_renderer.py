@@ -0,0 +1,718 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 정지 구간 중복 프레임 생략 렌더러
+# 사용 예:
+#   from fast_renderer import FastRenderer
+#   OnboardingFlow(renderer=FastRenderer()).render()
+#   (render.py 는 기본으로 사용, --no-elide 로 끔)
+#
+# - 프레임마다 움직이는 도형들의 상태(포인트/색/선 두께/z_index) 해시를 계산하고
+#   직전 프레임과 같으면 래스터화와 프레임 복사 없이 직전 프레임 배열을 그대로 다시 넘긴다.
+# - 인코더 쪽(ElidingFileWriter)은 같은 배열이 연속으로 오면 RGBA->YUV 변환을 한 번만 하고
+#   변환된 평면을 재사용한다. 출력은 일반 고정 프레임레이트 영상과 동일.
+# - 이미지(ImageMobject)가 움직이는 play 는 해시 없이 원래대로 그린다.
+# - 건너뛰는 play(-n 범위 밖, skip 섹션)는 래스터화 자체를 하지 않는다.
+# - partial 영상은 임시 이름으로 쓰고 다 쓴 뒤 교체한다(여러 프로세스가 같은 폴더를 써도 안전,
+#   중간에 죽어도 깨진 파일이 캐시로 남지 않음).
+# - play 의 세그먼트 키(partial 파일 이름)는 segment_key() 에서 정한다. 기본은 Manim 해시.
+# - composite_fades=True (render.py --composite-fades): 이동/크기 변화 없는 FadeIn/FadeOut 만 있는
+#   play 는 사라지거나 나타나는 도형을 처음에 한 번만 투명 레이어로 그려 두고, 프레임마다
+#   배경 위에 불투명도만 곱해 합성한다(Cairo 호출 없음, 도형이 있는 영역만 계산).
+#   도형 전체가 한 덩어리로 흐려지므로 겹친 선/채우기가 있으면 원래와 미세하게 다를 수 있어 기본은 끔.
+# - affine_sprites=True (render.py --affine-sprites): 움직이는 도형 전체가 모양/색은 그대로이고
+#   위치만 아핀 변환(이동/회전/약한 확대)되는 play(Wiggle, .animate.shift 등)는 한 번만
+#   SPRITE_OVERSAMPLE 배 해상도로 그려 두고, 프레임마다 그 스프라이트를 변형(bicubic)·축소해 합성한다.
+#   포인트로 맞춘 아핀 근사 오차가 0.05px 를 넘거나, 색이 바뀌거나(Indicate 의 색 변화 등),
+#   확대로 선 두께가 0.25px 이상 달라지면 그 play 는 원래대로 Cairo 로 그린다.
+# - 정지 레이어 재사용: play 마다 다시 그리던 정지 도형(헤더, 흐름도, 패널 틀, 배경 이미지)을
+#   도형별 상태 해시 목록과 함께 보관해 두고, 다음 play 의 정지 도형 목록이 그 앞부분과 같으면
+#   저장된 이미지에서 시작해 뒤에 붙은 도형만 그린다. 결과 픽셀은 전부 다시 그린 것과 동일.
+#   앞 play 와 공통인 앞부분 지점에도 중간 이미지를 남겨, 오른쪽 패널 항목이 빠져도 그 아래는 재사용.
+# - profile=True (render.py --profile): play 마다 단계별 시간을 재서 씬이 끝나면 표로 출력 (profiler.py)
+# - 인코딩으로 넘기는 프레임은 미리 잡아 둔 버퍼(frame_pool.py, 기본 FRAME_POOL_SIZE 개)에 복사해
+#   돌려 쓴다. 인코더가 밀리면 렌더가 기다리므로 메모리가 고정되고, 래스터화(본 스레드)와
+#   RGBA->YUV 변환/인코딩(파일 쓰기 스레드)이 겹쳐 돈다. frame_pool=0 이면 원래처럼 매번 새 배열.
+#   Cairo 로 그리는 프레임은 그 프레임 동안만 카메라 버퍼를 풀 버퍼로 바꿔 거기에 바로 그린다(복사 없음).
+# - 트레이스가 켜져 있으면(render.py --trace) 씬/play/프레임 단계 구간을 기록 (render_trace.py)
+# - batch_plays=True (render.py --batch-plays): BATCH_PLAY_MAX 초보다 짧은 play/wait 가 이어지면
+#   partial 영상 하나에 이어 쓴다(인코더를 play 마다 열고 닫지 않고, 이어 붙일 파일 수도 줄어듦).
+#   프레임은 play 마다 따로 쓸 때와 같으므로 타이밍도 동일. 묶음은 긴 play, 건너뛰는/캐시된 play,
+#   섹션 경계, BATCH_MAX 초, 씬 끝에서 닫힌다. 묶인 play 는 세그먼트 캐시를 쓰지 않는다.
+
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import av
+import numpy as np
+from manim import *
+from PIL import Image
+from manim.utils.hashing import get_hash_from_play_call
+
+from frame_pool import FRAME_POOL_SIZE, FramePool
+from profiler import PlayProfiler, caller_name
+from render_trace import get_tracer, span
+
+_VM_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+_VM_ATTRS = ("stroke_width", "background_stroke_width", "sheen_factor", "joint_type", "cap_style")
+
+SPRITE_OVERSAMPLE = 2
+_FIT_TOL_PX = 0.05     # 아핀 근사 오차 허용 (출력 픽셀)
+_STROKE_TOL_PX = 0.25  # 확대/축소로 달라지는 선 두께 허용 (출력 픽셀)
+_STATIC_LAYERS = 4     # 보관할 정지 레이어 이미지 수
+BATCH_PLAY_MAX = 1.0   # 이보다 짧은 play 만 묶음 (초)
+BATCH_MAX = 10.0       # 묶음 하나의 최대 길이 (초)
+
+
+# ===== 상태 해시 =====
+def _feed(h, arr):
+    h.update(repr(arr.shape).encode("ascii"))
+    h.update(np.ascontiguousarray(arr).data)
+
+
+def mobject_state_digest(mobjects, images=False, points=True):
+    # 화면에 그려지는 상태가 같으면 같은 값. 판단할 수 없으면 None
+    # images=True 면 이미지 픽셀까지 해시 (프레임마다 쓰기엔 비싸므로 기본은 포기)
+    # points=False 면 모양/위치를 빼고 색/선 스타일만
+    h = hashlib.blake2b(digest_size=16)
+    for mob in mobjects:
+        for m in mob.get_family():
+            if isinstance(m, AbstractImageMobject):
+                if not images:
+                    return None
+                _feed(h, m.pixel_array)
+            _feed_mobject(h, m, points)
+    return h.digest()
+
+
+def member_digest(m):
+    # 도형 하나(하위 도형 제외)의 그리기 상태 해시. 이미지는 픽셀까지 포함
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(m, AbstractImageMobject):
+        _feed(h, m.pixel_array)
+    _feed_mobject(h, m)
+    return h.digest()
+
+
+def _feed_mobject(h, m, points=True):
+    h.update(type(m).__name__.encode("ascii"))
+    _feed(h, m.points if points else np.empty((len(m.points), 0)))
+    for name in _VM_ARRAYS:
+        arr = getattr(m, name, None)
+        if arr is not None:
+            _feed(h, np.asarray(arr))
+    attrs = tuple(getattr(m, name, None) for name in _VM_ATTRS)
+    sheen = getattr(m, "sheen_direction", None)
+    h.update(repr((attrs, m.z_index, None if sheen is None else tuple(sheen))).encode())
+
+
+# ===== 아핀 스프라이트 =====
+def _flat_points(mobjects):
+    arrays = [m.points[:, :2] for m in mobjects if len(m.points)]
+    return np.concatenate(arrays) if arrays else np.empty((0, 2))
+
+
+def _affine_fit(ref, points, px_per_unit):
+    # points ~= ref @ A.T + b 이면 (A, b), 아니면 None
+    X = np.hstack([ref, np.ones((len(ref), 1))])
+    M, _, rank, _ = np.linalg.lstsq(X, points, rcond=None)
+    if rank < 3 or np.abs(X @ M - points).max() * px_per_unit > _FIT_TOL_PX:
+        return None
+    return M[:2].T, M[2]
+
+
+def _max_stroke_px(mobjects, camera):
+    width = 0.0
+    for m in mobjects:
+        if not isinstance(m, VMobject) or not len(m.points):
+            continue
+        if m.get_stroke_opacity() > 0:
+            width = max(width, m.get_stroke_width())
+        if m.get_stroke_opacity(background=True) > 0:
+            width = max(width, m.get_stroke_width(background=True))
+    return width * camera.cairo_line_width_multiple * camera.pixel_width / camera.frame_width
+
+
+def _pixel_matrix(camera, scale):
+    # 프레임 좌표 -> scale 배 해상도의 픽셀 좌표 (3x3)
+    kx = scale * camera.pixel_width / camera.frame_width
+    ky = scale * camera.pixel_height / camera.frame_height
+    cx, cy = camera.frame_center[0], camera.frame_center[1]
+    return np.array([
+        [kx, 0.0, scale * camera.pixel_width / 2 - cx * kx],
+        [0.0, -ky, scale * camera.pixel_height / 2 + cy * ky],
+        [0.0, 0.0, 1.0],
+    ])
+
+
+# ===== 인코더 =====
+class ElidingFileWriter(SceneFileWriter):
+    def open_partial_movie_stream(self, file_path=None):
+        self._plane_src = None
+        self._plane = None
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        path = Path(file_path)
+        self._final_partial = path
+        tmp = path.with_name("{}.{}{}".format(path.stem, os.getpid(), path.suffix))
+        self._open_stream(str(tmp))
+
+    def close_partial_movie_stream(self):
+        self._close_stream()
+        self._release(self._plane_src)
+        self._plane_src = None
+        os.replace(self.partial_movie_file_path, self._final_partial)
+
+    def _open_stream(self, file_path):
+        # 실제 인코더 열기/닫기 (shm_ring.py 는 인코더 프로세스로 바꿈)
+        SceneFileWriter.open_partial_movie_stream(self, file_path=file_path)
+
+    def _close_stream(self):
+        SceneFileWriter.close_partial_movie_stream(self)
+
+    def _release(self, frame):
+        pool = getattr(self.renderer, "frame_pool", None)
+        if pool is not None:
+            pool.release(frame)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        # 큐에 들어간 프레임은 인코딩이 끝날 때까지 풀로 돌아가지 않게
+        pool = getattr(self.renderer, "frame_pool", None)
+        profiler = getattr(self.renderer, "profiler", None)
+        if write_to_movie():
+            if pool is not None:
+                pool.retain(frame_or_renderer)
+            if profiler is not None:
+                profiler.queued()
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        profiler = getattr(self.renderer, "profiler", None)
+        tracer = getattr(self.renderer, "tracer", None)
+        t0 = time.perf_counter()
+        self._encode_frame(frame, num_frames)
+        self._release(frame)
+        t1 = time.perf_counter()
+        if profiler is not None:
+            profiler.encoded(t1 - t0)
+        if tracer is not None:
+            tracer.complete("encode", t0, t1, "frame", {"frames": num_frames})
+
+    def _encode_frame(self, frame, num_frames):
+        if self.video_stream.pix_fmt != "yuv420p":
+            # 투명/웹엠 출력은 원래 경로 (RGBA 그대로)
+            for _ in range(num_frames):
+                self._mux_frame(av.VideoFrame.from_ndarray(frame, format="rgba"))
+            return
+        if frame is not self._plane_src:
+            rgba = av.VideoFrame.from_ndarray(frame, format="rgba")
+            self._plane = rgba.reformat(format="yuv420p").to_ndarray()
+            # 같은 버퍼가 다른 내용으로 재사용되지 않도록 비교 기준인 동안 잡아 둠
+            pool = getattr(self.renderer, "frame_pool", None)
+            if pool is not None:
+                pool.retain(frame)
+            self._release(self._plane_src)
+            self._plane_src = frame
+        for _ in range(num_frames):
+            # 프레임 객체는 재사용하면 안 되므로(인코더가 pts 를 덮어씀) 평면만 공유
+            self._mux_frame(av.VideoFrame.from_ndarray(self._plane, format="yuv420p"))
+
+    def _mux_frame(self, av_frame):
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+
+
+# ===== 렌더러 =====
+class FastRenderer(CairoRenderer):
+    def __init__(self, file_writer_class=ElidingFileWriter, composite_fades=False, affine_sprites=False,
+                 profile=False, batch_plays=False, frame_pool=FRAME_POOL_SIZE, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+        self.frame_pool = FramePool(frame_pool) if frame_pool else None
+        if self.frame_pool is not None:
+            self.frame_pool.check = self._check_writer
+        self.profiler = PlayProfiler() if profile else None
+        self.tracer = get_tracer()
+        self._scene_t0 = self._play_end = time.perf_counter()
+        self.composite_fades = composite_fades
+        self.affine_sprites = affine_sprites
+        self.batch_plays = batch_plays
+        self._batch = None  # 열린 묶음 {"section", "duration", "plays"}
+        self.plays_batched = 0
+        self.batches = 0
+        self.frames_warped = 0
+        self._sprite = None
+        self._sprite_camera = None
+        self.static_drawn = 0
+        self.static_reused = 0
+        self._static_layers = []  # [(도형별 해시 튜플, 이미지, 배경)] 최근 사용 순
+        self._static_prev = ()
+        self.frames_rendered = 0
+        self.frames_elided = 0
+        self.frames_composited = 0
+        self._fades = None
+        self._last_digest = None
+        self._last_frame = None
+        self._in_play = False
+
+    def play(self, scene, *args, **kwargs):
+        # CairoRenderer.play 와 같은 순서. 세그먼트 키 계산만 segment_key() 로 분리
+        # 정적 배경(static_image)은 play 마다 바뀌므로 비교 기준도 초기화
+        self._last_digest = None
+        self._release_frame(self._last_frame)
+        self._last_frame = None
+        self._in_play = True
+        if self.profiler is not None or self.tracer is not None:
+            self._profile_scene(scene)
+        if self.profiler is not None:
+            self.profiler.on_play_begin(scene, self.num_plays)
+        index = self.num_plays
+        caller = caller_name(scene) if self.tracer is not None else None
+        t_play = time.perf_counter()
+        if self.tracer is not None:
+            # 직전 play 이후 construct 코드 (도형 생성 등)
+            self.tracer.complete("construct", self._play_end, t_play, "build", {"caller": caller})
+        try:
+            self.skip_animations = self._original_skipping_status
+            self.update_skipping_status()
+            with self._phase("build"):
+                scene.compile_animation_data(*args, **kwargs)
+            batched = self._batch_play(scene)
+            if batched:
+                # 열린 묶음 파일에 이어 씀 (첫 play 만 파일 이름을 가짐)
+                key = "batch_{:05}".format(self.num_plays) if batched == "open" else None
+            elif self.skip_animations:
+                key = None
+                self.time += scene.duration
+            else:
+                with self._phase("hash"):
+                    key = self.segment_key(scene)
+                # uncached_ 이름은 play 번호일 뿐이라 예전 렌더의 파일을 캐시로 쓰면 안 됨
+                if not key.startswith("uncached_") and self.file_writer.is_already_cached(key):
+                    logger.info("Animation %d : Using cached data (hash : %s)", self.num_plays, key)
+                    self.skip_animations = True
+                    self.time += scene.duration
+            self.file_writer.add_partial_movie_file(key)
+            self.animations_hashes.append(key)
+            if batched != "join":
+                self.file_writer.begin_animation(not self.skip_animations)
+            with self._phase("build"):
+                scene.begin_animations()
+            with self._phase("raster"):
+                self.save_static_frame_data(scene, scene.static_mobjects)
+                if self.composite_fades and not self.skip_animations:
+                    self._fades = self._prepare_fades(scene)
+            if scene.is_current_animation_frozen_frame():
+                with self._phase("raster"):
+                    self.update_frame(scene, mobjects=scene.moving_mobjects)
+                self.freeze_current_frame(scene.duration)
+            else:
+                scene.play_internal()
+            if not batched:
+                self.file_writer.end_animation(not self.skip_animations)
+            self.num_plays += 1
+        finally:
+            self._in_play = False
+            self._fades = None
+            self._sprite = None
+            if self.profiler is not None:
+                self.profiler.on_play_end(scene)
+            if self.tracer is not None:
+                anims = ", ".join(type(a).__name__ for a in scene.animations or [])
+                self.tracer.complete("play #{}".format(index), t_play, time.perf_counter(), "play", {
+                    "caller": caller, "animations": anims, "skipped": bool(self.skip_animations),
+                })
+                self._play_end = time.perf_counter()
+
+    # ===== play 묶기 =====
+    def _batch_play(self, scene):
+        # 이 play 를 묶음으로 쓸지: "open"(새 묶음 시작), "join"(열린 묶음에 이어 씀), None(따로)
+        short = (self.batch_plays and not self.skip_animations and write_to_movie()
+                 and scene.duration < BATCH_PLAY_MAX)
+        batch = self._batch
+        if batch is not None and (not short or batch["section"] != len(self.file_writer.sections)
+                                  or batch["duration"] + scene.duration > BATCH_MAX):
+            self._close_batch()
+            batch = None
+        if not short:
+            return None
+        state = "join"
+        if batch is None:
+            batch = self._batch = {"section": len(self.file_writer.sections), "duration": 0.0, "plays": 0}
+            self.batches += 1
+            state = "open"
+        batch["duration"] += scene.duration
+        batch["plays"] += 1
+        self.plays_batched += 1
+        return state
+
+    def _close_batch(self):
+        if self._batch is None:
+            return
+        self._batch = None
+        self.file_writer.end_animation(True)
+
+    # ===== 프로파일 =====
+    @contextmanager
+    def _phase(self, name):
+        if self.profiler is None and self.tracer is None:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            t1 = time.perf_counter()
+            if self.profiler is not None:
+                self.profiler.record(name, t0, t1)
+            if self.tracer is not None:
+                self.tracer.complete(name, t0, t1, "frame")
+
+    def _profile_scene(self, scene):
+        # 프레임마다 부르는 보간(update_to_time)을 한 번만 감싸 둠
+        if "update_to_time" in vars(scene):
+            return
+        update_to_time = scene.update_to_time
+
+        def timed_update_to_time(t):
+            with self._phase("interp"):
+                update_to_time(t)
+
+        scene.update_to_time = timed_update_to_time
+
+    def init_scene(self, scene):
+        self._scene_t0 = self._play_end = time.perf_counter()
+        super().init_scene(scene)
+
+    def add_frame(self, frame, num_frames=1):
+        if self.profiler is not None:
+            self.profiler.add_frames(num_frames)
+        super().add_frame(frame, num_frames)
+
+    def render_variant(self):
+        # 결과 픽셀이 달라질 수 있는 옵션 (세그먼트 캐시 키에 포함)
+        names = ("composite_fades", "affine_sprites")
+        return tuple(name for name in names if getattr(self, name))
+
+    def segment_key(self, scene):
+        if config["disable_caching"]:
+            return "uncached_{:05}".format(self.num_plays)
+        key = get_hash_from_play_call(scene, self.camera, scene.animations, scene.mobjects)
+        return "_".join((key,) + self.render_variant())
+
+    def _drawing_skipped(self):
+        # 건너뛰는 play(-n, 섹션 skip 등)는 어차피 인코딩되지 않으므로 그리지 않음
+        return self._in_play and self.skip_animations
+
+    def update_frame(self, scene, *args, **kwargs):
+        if self._drawing_skipped():
+            return
+        super().update_frame(scene, *args, **kwargs)
+
+    def get_frame(self):
+        if self._drawing_skipped():
+            return self.camera.pixel_array
+        return super().get_frame()
+
+    # ===== 프레임 버퍼 =====
+    def _frame_buffer(self, src):
+        # 인코딩으로 넘길 src 복사본 (참조 1, 다 쓰면 _release_frame)
+        if self.frame_pool is None:
+            return np.array(src)
+        return self.frame_pool.acquire(src)
+
+    def _check_writer(self):
+        # 풀이 비어 기다리는 중: 버퍼를 돌려줄 파일 쓰기 스레드가 없거나 죽었으면 멈추지 말고 실패
+        thread = getattr(self.file_writer, "writer_thread", None)
+        if thread is None or not thread.is_alive():
+            raise RuntimeError("파일 쓰기 스레드가 종료되어 프레임 버퍼를 돌려받을 수 없음")
+
+    def _release_frame(self, frame):
+        if self.frame_pool is not None:
+            self.frame_pool.release(frame)
+
+    def _draw_frame(self, scene, mobjects):
+        # 카메라가 빈 풀 버퍼에 바로 그리게 함. 카메라 자체 버퍼는 그대로 두므로 인코딩 중인
+        # 버퍼에 다른 그리기(정지 레이어, 멈춘 프레임 등)가 덮어쓰는 일은 없음
+        if self.frame_pool is None:
+            self.update_frame(scene, mobjects)
+            return np.array(self.camera.pixel_array)
+        canvas = self.camera.pixel_array
+        frame = self.frame_pool.acquire(canvas, copy=False)
+        self.camera.pixel_array = frame
+        try:
+            self.update_frame(scene, mobjects)
+        finally:
+            self.camera.pixel_array = canvas
+        return frame
+
+    def freeze_current_frame(self, duration):
+        if self._drawing_skipped():
+            return super().freeze_current_frame(duration)
+        frame = self._frame_buffer(self.camera.pixel_array)
+        self.add_frame(frame, num_frames=int(duration / (1 / self.camera.frame_rate)))
+        self._release_frame(frame)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if self._drawing_skipped():
+            self.static_image = None
+            return None
+        self.static_image = None
+        if not static_mobjects:
+            return None
+        # update_frame(include_submobjects=True) 가 그리는 순서 그대로 펼친 목록
+        members = self.camera.get_mobjects_to_display(static_mobjects)
+        digests = tuple(member_digest(m) for m in members)
+        background = self.camera.background
+
+        start = 0
+        for i, (keys, image, bg) in enumerate(self._static_layers):
+            if bg is background and len(keys) > start and digests[:len(keys)] == keys:
+                start, best = len(keys), i
+        if start:
+            layer = self._static_layers.pop(best)
+            self._static_layers.insert(0, layer)
+            self.camera.set_frame_to_background(layer[1])
+        else:
+            self.camera.reset()
+        self.static_reused += start
+
+        # 앞 play 와 공통인 앞부분까지 그린 상태도 보관 (그 뒤 도형만 바뀌는 경우가 대부분)
+        common = 0
+        for a, b in zip(digests, self._static_prev):
+            if a != b:
+                break
+            common += 1
+        if start < common < len(digests):
+            self.camera.capture_mobjects(members[start:common], include_submobjects=False)
+            self._keep_static_layer(digests[:common], np.array(self.camera.pixel_array), background)
+            self.static_drawn += common - start
+            start = common
+        self.camera.capture_mobjects(members[start:], include_submobjects=False)
+        self.static_drawn += len(members) - start
+        self.static_image = self.get_frame()
+        if start < len(digests):
+            self._keep_static_layer(digests, self.static_image, background)
+        self._static_prev = digests
+        return self.static_image
+
+    def _keep_static_layer(self, keys, image, background):
+        self._static_layers = [layer for layer in self._static_layers if layer[0] != keys]
+        self._static_layers.insert(0, (keys, image, background))
+        del self._static_layers[_STATIC_LAYERS:]
+
+    # ===== 페이드 합성 =====
+    def _prepare_fades(self, scene):
+        # 이 play 가 순수 FadeIn/FadeOut 이면 합성용 데이터, 아니면 None
+        if config.transparent or scene.updaters:
+            return None
+        fading = set()
+        sources = []
+        for anim in scene.animations:
+            if type(anim) not in (FadeIn, FadeOut) or anim.lag_ratio != 0:
+                return None
+            if np.any(anim.shift_vector) or anim.scale_factor != 1:
+                return None
+            family = anim.mobject.get_family()
+            if any(m.updaters or isinstance(m, (AbstractImageMobject, PMobject)) for m in family):
+                return None
+            fading.update(id(m) for m in family)
+            # 완전히 보이는 상태의 복사본
+            sources.append((anim, anim.target_copy if isinstance(anim, FadeIn) else anim.starting_mobject))
+        if not sources or any(id(m) not in fading for m in scene.moving_mobjects):
+            return None  # 페이드 도형 위에 다른 움직이는 도형이 겹쳐 있으면 원래대로
+
+        # 도형별 레이어: 투명 배경 위에 Cairo 로 한 번 그린 premultiplied RGBA
+        order = {id(m): i for i, m in enumerate(scene.moving_mobjects)}
+        sources.sort(key=lambda s: order.get(id(s[0].mobject), 0))
+        canvas = self.camera.pixel_array
+        layers = []
+        try:
+            for anim, source in sources:
+                layer = np.zeros_like(canvas)
+                self.camera.pixel_array = layer
+                self.camera.capture_mobjects([source])
+                self.camera.pixel_array_to_cairo_context.pop(id(layer), None)
+                layers.append((anim, layer))
+        finally:
+            self.camera.pixel_array = canvas
+
+        base = self.static_image if self.static_image is not None else self.camera.background
+        covered = np.zeros(base.shape[:2], dtype=bool)
+        for _, layer in layers:
+            covered |= layer[:, :, 3] > 0
+        rows = np.flatnonzero(covered.any(axis=1))
+        cols = np.flatnonzero(covered.any(axis=0))
+        if not len(rows):
+            return base, np.s_[0:0, 0:0], np.zeros((0, 0, 4), np.float32), []
+        region = np.s_[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        crop = base[region].astype(np.float32)
+        prepared = []
+        for anim, layer in layers:
+            color = layer[region].astype(np.float32)
+            prepared.append((anim, isinstance(anim, FadeIn), color, color[:, :, 3:] / 255.0))
+        # 첫 레이어는 배경이 고정이므로 차이를 미리 계산: 프레임 = 배경 + a * 차이
+        anim, fade_in, color, alpha = prepared[0]
+        prepared[0] = (anim, fade_in, color - crop * alpha, None)
+        return base, region, crop, prepared
+
+    def _composite_frame(self, t):
+        base, region, crop, layers = self._fades
+        out = crop
+        for anim, fade_in, color, alpha in layers:
+            a = anim.get_sub_alpha(t / anim.run_time, 0, 1)
+            if not fade_in:
+                a = 1.0 - a
+            out = out + a * color if alpha is None else color * a + out * (1.0 - a * alpha)
+        frame = self._frame_buffer(base)
+        frame[region] = out + 0.5
+        return frame
+
+    # ===== 아핀 스프라이트 =====
+    def _sprite_frame(self, mobjects):
+        # 움직이는 도형 전체가 기준 상태의 아핀 변환이면 스프라이트를 변형해 만든 프레임, 아니면 None
+        # self._sprite: None(play 시작) -> 첫 프레임 기록 -> 스프라이트 준비, False 면 이 play 는 포기
+        state = self._sprite
+        if state is False or config.transparent:
+            return None
+        points = _flat_points(mobjects)
+        style = mobject_state_digest(mobjects, points=False)
+        if state is None:
+            # 첫 프레임은 그대로 그리고 비교 기준만 남김
+            self._sprite = {"points": points, "style": style, "stroke": _max_stroke_px(mobjects, self.camera)}
+            return None
+        px = self.camera.pixel_width / self.camera.frame_width
+        if style is None or style != state["style"] or points.shape != state["points"].shape or not len(points):
+            self._sprite = False
+            return None
+        fit = _affine_fit(state["points"], points, px)
+        if fit is not None:
+            stretch = np.abs(np.linalg.svd(fit[0], compute_uv=False) - 1).max()
+            if state["stroke"] * stretch > _STROKE_TOL_PX:
+                fit = None
+        if fit is None:
+            self._sprite = False
+            return None
+        if "layer" not in state:
+            # 아핀으로 움직이는 것이 확인된 두 번째 프레임에서 현재 상태를 기준으로 한 번 래스터화
+            if not self._rasterize_sprite(state, mobjects):
+                self._sprite = False
+                return None
+            state["points"] = points
+            fit = (np.eye(2), np.zeros(2))
+        return self._warp_sprite(state, *fit)
+
+    def _rasterize_sprite(self, state, mobjects):
+        s = SPRITE_OVERSAMPLE
+        cam = self._sprite_camera
+        size = (self.camera.pixel_width * s, self.camera.pixel_height * s)
+        if cam is None or (cam.pixel_width, cam.pixel_height) != size:
+            cam = self._sprite_camera = Camera(
+                pixel_width=size[0], pixel_height=size[1],
+                frame_width=self.camera.frame_width, frame_height=self.camera.frame_height,
+                frame_center=self.camera.frame_center,
+            )
+        layer = np.zeros((cam.pixel_height, cam.pixel_width, 4), dtype=np.uint8)
+        cam.pixel_array = layer
+        cam.capture_mobjects(mobjects)
+        cam.pixel_array_to_cairo_context.pop(id(layer), None)
+        alpha = layer[:, :, 3] > 0
+        rows = np.flatnonzero(alpha.any(axis=1))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        if not len(rows):
+            return False
+        # premultiplied 그대로 보간되도록 RGBa 모드
+        state["layer"] = Image.frombuffer("RGBa", size, layer.tobytes(), "raw", "RGBa", 0, 1)
+        state["corners"] = np.array([
+            [cols[0], rows[0], 1], [cols[-1] + 1, rows[0], 1],
+            [cols[0], rows[-1] + 1, 1], [cols[-1] + 1, rows[-1] + 1, 1],
+        ], dtype=float).T
+        state["pixel"] = _pixel_matrix(self.camera, s)
+        return True
+
+    def _warp_sprite(self, state, A, b):
+        s = SPRITE_OVERSAMPLE
+        T = state["pixel"]
+        affine = np.eye(3)
+        affine[:2, :2] = A
+        affine[:2, 2] = b
+        forward = T @ affine @ np.linalg.inv(T)  # 스프라이트 픽셀 -> 출력(s 배) 픽셀
+        corners = forward @ state["corners"]
+        # 변형된 스프라이트가 덮는 영역만 계산 (s 의 배수로 맞춰 1배 픽셀 경계와 일치)
+        x0 = max(int(np.floor(corners[0].min() / s)) - 1, 0)
+        y0 = max(int(np.floor(corners[1].min() / s)) - 1, 0)
+        x1 = min(int(np.ceil(corners[0].max() / s)) + 1, self.camera.pixel_width)
+        y1 = min(int(np.ceil(corners[1].max() / s)) + 1, self.camera.pixel_height)
+        base = self.static_image if self.static_image is not None else self.camera.background
+        frame = self._frame_buffer(base)
+        if x1 <= x0 or y1 <= y0:
+            return frame
+        inverse = np.linalg.inv(forward) @ np.array([[1.0, 0.0, x0 * s], [0.0, 1.0, y0 * s], [0.0, 0.0, 1.0]])
+        warped = state["layer"].transform(
+            ((x1 - x0) * s, (y1 - y0) * s), Image.AFFINE, data=tuple(inverse[:2].ravel()), resample=Image.BICUBIC,
+        )
+        sprite = np.asarray(warped, dtype=np.float32).reshape(y1 - y0, s, x1 - x0, s, 4).mean(axis=(1, 3))
+        # bicubic 오버슈트로 색이 알파보다 커질 수 있음 -> premultiplied 범위로 되돌린 뒤 합성 (uint8 wrap 방지)
+        np.minimum(sprite[:, :, :3], sprite[:, :, 3:], out=sprite[:, :, :3])
+        under = base[y0:y1, x0:x1].astype(np.float32)
+        frame[y0:y1, x0:x1] = np.clip(sprite + under * (1.0 - sprite[:, :, 3:] / 255.0) + 0.5, 0, 255)
+        return frame
+
+    def render(self, scene, time, moving_mobjects):
+        if self._drawing_skipped():
+            return
+        if self._fades is not None:
+            self.frames_composited += 1
+            with self._phase("raster"):
+                frame = self._composite_frame(time)
+            self.add_frame(frame)
+            self._release_frame(frame)
+            return
+        with self._phase("hash"):
+            digest = mobject_state_digest(moving_mobjects)
+        if digest is not None and digest == self._last_digest:
+            self.frames_elided += 1
+            self.add_frame(self._last_frame)
+            return
+        with self._phase("raster"):
+            frame = self._sprite_frame(moving_mobjects) if self.affine_sprites else None
+            if frame is None:
+                frame = self._draw_frame(scene, moving_mobjects)
+                self.frames_rendered += 1
+            else:
+                self.frames_warped += 1
+        self._last_digest = digest
+        self._release_frame(self._last_frame)
+        self._last_frame = frame
+        self.add_frame(frame)
+
+    def scene_finished(self, scene):
+        self._release_frame(self._last_frame)
+        self._last_frame = None
+        self._close_batch()
+        with span("combine", "io", scene=type(scene).__name__):
+            super().scene_finished(scene)
+        if self.tracer is not None:
+            self.tracer.complete("scene " + type(scene).__name__, self._scene_t0, time.perf_counter(), "scene")
+            self.tracer.flush()
+        total = self.frames_rendered + self.frames_elided + self.frames_composited + self.frames_warped
+        if total:
+            logger.info(
+                "%s: 프레임 %d개 중 %d개 생략 (%.1f%%), %d개 페이드 합성, %d개 스프라이트 변형",
+                type(scene).__name__, total, self.frames_elided, 100.0 * self.frames_elided / total,
+                self.frames_composited, self.frames_warped,
+            )
+        if self.static_drawn + self.static_reused:
+            logger.info(
+                "%s: 정지 레이어 도형 %d개 재사용, %d개 새로 그림",
+                type(scene).__name__, self.static_reused, self.static_drawn,
+            )
+        pool = self.frame_pool
+        if pool is not None and pool.waits:
+            logger.info("%s: 프레임 버퍼 %d개, 인코더 대기 %d회 (%.1fs)",
+                        type(scene).__name__, pool.size, pool.waits, pool.wait_time)
+        if self.batches:
+            logger.info("%s: play %d개를 묶음 %d개로 인코딩", type(scene).__name__, self.plays_batched, self.batches)
+        if self.profiler is not None:
+            print(self.profiler.format_report(type(scene).__name__))
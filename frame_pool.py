@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 프레임 버퍼 풀: 렌더(본 스레드)와 인코딩(파일 쓰기 스레드) 사이를 오가는 프레임 배열을 미리 잡아 두고 돌려 씀
+# 사용 예:
+#   pool = FramePool(8)
+#   frame = pool.acquire(camera.pixel_array)   # 복사본 (참조 1, 빈 버퍼가 없으면 인코더가 돌려줄 때까지 대기)
+#   pool.retain(frame)                         # 인코딩 큐에 넣을 때
+#   pool.release(frame)                        # 인코딩이 끝났을 때 / 렌더러가 더 이상 안 쓸 때
+#
+# - 프레임마다 새 배열을 만들지 않고, 인코더가 밀리면 렌더가 기다리므로 메모리가 버퍼 수만큼으로 고정된다.
+#   (원래는 큐 길이 제한이 없어 인코더가 느리면 프레임 복사본이 계속 쌓임)
+# - 참조 수가 0 이 되면 빈 목록으로 돌아감. 풀에서 나오지 않은 배열은 retain/release 가 무시한다.
+# - acquire(like, copy=False) 는 내용을 채우지 않은 버퍼 -> 카메라가 거기에 바로 그림 (fast_renderer.py)
+# - 최소 3개: 렌더러의 직전 프레임 + 인코더가 변환해 둔 프레임 + 새로 그릴 프레임
+# - 빈 버퍼를 기다리는 동안 FRAME_WAIT_POLL 초마다 pool.check() 를 부른다. 렌더러가 "버퍼를 돌려줄
+#   쪽(파일 쓰기 스레드/인코더 프로세스)이 살아 있는지" 검사를 넣어 두면, 그쪽이 죽었을 때 영원히
+#   멈추지 않고 예외로 끝난다. check 가 없으면 FRAME_WAIT_TIMEOUT 초 뒤 RuntimeError.
+# - shm_ring.py 의 SharedFrameRing 은 같은 방식으로 버퍼를 공유 메모리에 잡는다
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+FRAME_POOL_SIZE = 8
+FRAME_WAIT_POLL = 1.0
+FRAME_WAIT_TIMEOUT = 300.0
+
+
+class FramePool:
+    def __init__(self, size=FRAME_POOL_SIZE):
+        self.size = max(int(size), 3)
+        self.waits = 0
+        self.wait_time = 0.0
+        self._free = queue.Queue()
+        self._refs = {}     # id(버퍼) -> 참조 수
+        self._owned = {}    # id(버퍼) -> 버퍼
+        self._stamps = {}   # id(버퍼) -> 마지막으로 꺼낸 순번 (같은 버퍼의 다른 내용 구분)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._layout = None
+        self.check = None  # 대기 중 호출 (버퍼를 돌려줄 쪽이 죽었으면 예외)
+
+    def _allocate(self, shape, dtype):
+        # 해상도가 바뀌면 새로 잡음 (사용 중인 이전 버퍼는 release 때 버려짐)
+        self._layout = (tuple(shape), np.dtype(dtype))
+        self._free = queue.Queue()
+        with self._lock:
+            self._refs = {}
+            self._owned = {}
+            for buf in self._buffers(shape, dtype):
+                self._owned[id(buf)] = buf
+                self._free.put(buf)
+
+    def _buffers(self, shape, dtype):
+        return [np.empty(shape, dtype) for _ in range(self.size)]
+
+    def reserve(self, shape, dtype):
+        if self._layout != (tuple(shape), np.dtype(dtype)):
+            self._allocate(shape, dtype)
+
+    def owns(self, buf):
+        return self._owned.get(id(buf)) is buf
+
+    def stamp(self, buf):
+        # 풀 버퍼면 (id, 순번), 아니면 None
+        with self._lock:
+            if self._owned.get(id(buf)) is not buf:
+                return None
+            return id(buf), self._stamps.get(id(buf))
+
+    def acquire(self, like, copy=True):
+        self.reserve(like.shape, like.dtype)
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            buf = self._wait()
+        with self._lock:
+            self._refs[id(buf)] = 1
+            self._count += 1
+            self._stamps[id(buf)] = self._count
+        if copy:
+            np.copyto(buf, like)
+        return buf
+
+    def _wait(self):
+        t0 = time.perf_counter()
+        self.waits += 1
+        try:
+            while True:
+                try:
+                    return self._free.get(timeout=FRAME_WAIT_POLL)
+                except queue.Empty:
+                    pass
+                if self.check is not None:
+                    self.check()
+                elif time.perf_counter() - t0 > FRAME_WAIT_TIMEOUT:
+                    raise RuntimeError("프레임 버퍼를 {:.0f}초 동안 돌려받지 못함".format(FRAME_WAIT_TIMEOUT))
+        finally:
+            self.wait_time += time.perf_counter() - t0
+
+    def retain(self, buf):
+        with self._lock:
+            if id(buf) in self._refs:
+                self._refs[id(buf)] += 1
+
+    def release(self, buf):
+        if buf is None:
+            return
+        with self._lock:
+            key = id(buf)
+            if key not in self._refs or self._owned.get(key) is not buf:
+                return
+            self._refs[key] -= 1
+            if self._refs[key]:
+                return
+            del self._refs[key]
+        self._free.put(buf)
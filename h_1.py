@@ -3,6 +3,7 @@
 # 빠른 미리보기:  manim -pqh hhi_overview.py OnboardingFlow
 
 from manim import *
+from text_cache import cached_text
 
 config.pixel_width = 1400
 config.pixel_height = 800
@@ -53,11 +54,11 @@ class OnboardingFlow(Scene):
 
         # 인트로
         self.update_step(HR_DATA["company_name"])
-        intro_msg = Text(HR_DATA["mission"], font=FONT, color=BRAND_TEXT)
+        intro_msg = cached_text(HR_DATA["mission"], font=FONT, color=BRAND_TEXT)
         self.push_right(intro_msg)
-        addr = Text(HR_DATA["address"], font=FONT, color=BRAND_ACCENT).scale(0.55)
+        addr = cached_text(HR_DATA["address"], font=FONT, color=BRAND_ACCENT).scale(0.55)
         self.push_right(addr)
-        subs = Text(HR_DATA["subs"], font=FONT, color=BRAND_TEXT).scale(0.55)
+        subs = cached_text(HR_DATA["subs"], font=FONT, color=BRAND_TEXT).scale(0.55)
         self.push_right(subs)
 
         self.play(
@@ -70,7 +71,7 @@ class OnboardingFlow(Scene):
         # Values
         self.update_step("핵심가치")
         for v in HR_DATA["values"]:
-            msg = Text(v, font=FONT, color=BRAND_TEXT)
+            msg = cached_text(v, font=FONT, color=BRAND_TEXT)
             if ("친환경" in v) or ("혁신" in v) or ("안전" in v) or ("품질" in v) or ("고객" in v):
                 msg.set_color(BRAND_PRIMARY)
             self.push_right(msg)
@@ -80,30 +81,30 @@ class OnboardingFlow(Scene):
         self.update_step("회사 흐름")
         for idx, step in enumerate(HR_DATA["flow"]):
             self.link_left(nodes, edges, idx)
-            desc = Text(step["desc"], font=FONT, color=BRAND_TEXT)
+            desc = cached_text(step["desc"], font=FONT, color=BRAND_TEXT)
             self.push_right(desc)
             self.wait(0.1)
 
         # 사업 요약 + 신용평가
         self.update_step("성장 & 지원")
-        g1 = Text("조선: 일반상선·가스선·해양/군함·수소·암모니아 추진선 개발", font=FONT, color=BRAND_TEXT).scale(0.6)
-        g2 = Text("해양플랜트: 원유 생산·저장설비, 발전/화공플랜트 프로젝트", font=FONT, color=BRAND_TEXT).scale(0.6)
-        g3 = Text("엔진기계: 대형/힘센엔진·발전설비 공급, 친환경 제품 자체개발", font=FONT, color=BRAND_TEXT).scale(0.6)
+        g1 = cached_text("조선: 일반상선·가스선·해양/군함·수소·암모니아 추진선 개발", font=FONT, color=BRAND_TEXT).scale(0.6)
+        g2 = cached_text("해양플랜트: 원유 생산·저장설비, 발전/화공플랜트 프로젝트", font=FONT, color=BRAND_TEXT).scale(0.6)
+        g3 = cached_text("엔진기계: 대형/힘센엔진·발전설비 공급, 친환경 제품 자체개발", font=FONT, color=BRAND_TEXT).scale(0.6)
         self.push_right(g1)
         self.push_right(g2)
         self.push_right(g3)
-        credit = Text("신용등급(회사채): 2025년 A+ (정기평가 상향)", font=FONT, color=BRAND_PRIMARY).scale(0.62)
+        credit = cached_text("신용등급(회사채): 2025년 A+ (정기평가 상향)", font=FONT, color=BRAND_PRIMARY).scale(0.62)
         self.push_right(credit)
 
         # CTA
         self.update_step("Start Here")
-        cta = Text(HR_DATA["cta"], font=FONT, color=BRAND_PRIMARY).scale(0.7)
+        cta = cached_text(HR_DATA["cta"], font=FONT, color=BRAND_PRIMARY).scale(0.7)
         self.push_right(cta)
         self._pulse_all(nodes)
         self.wait(0.6)
 
         # 엔드 카드(법무)
-        legal = Text(HR_DATA["legal"], font=FONT, color=BRAND_TEXT).scale(0.45)
+        legal = cached_text(HR_DATA["legal"], font=FONT, color=BRAND_TEXT).scale(0.45)
         legal.to_corner(DR).shift(0.3 * UP + 0.3 * LEFT)
         self.play(FadeIn(legal), run_time=0.6)
         self.wait(0.6)
@@ -150,7 +151,7 @@ class OnboardingFlow(Scene):
             fill_color="#000000",
             fill_opacity=0.0,
         )
-        text = Text(label, font=FONT, color=BRAND_TEXT).scale(0.6)
+        text = cached_text(label, font=FONT, color=BRAND_TEXT).scale(0.6)
         group = VGroup(box, text)
         text.move_to(box.get_center())
         return (box, text)
@@ -164,13 +165,14 @@ class OnboardingFlow(Scene):
             max_tip_length_to_length_ratio=0.12,
         )
         if label:
-            t = Text(label, font=FONT, color=BRAND_TEXT).scale(0.45)
+            t = cached_text(label, font=FONT, color=BRAND_TEXT).scale(0.45)
             t.next_to(a, UP, buff=0.1)
             return VGroup(a, t)
         return a
 
     def update_step(self, label):
-        new_header = Text(label, font=FONT, color=BRAND_TEXT, weight="BOLD")
+        self.next_section(label)  # 헤더가 바뀌는 곳을 섹션 경계로
+        new_header = cached_text(label, font=FONT, color=BRAND_TEXT, weight="BOLD")
         new_header.scale_to_fit_height(0.6 * self.header_area.height)
         new_header.move_to(self.header_area.get_center()).align_to(self.header_area, LEFT).shift(0.2 * RIGHT)
         if self._header is None:
@@ -6,6 +6,7 @@
 from manim import *
 import numpy as np
 import math
+from text_cache import cached_text
 
 # ===== 폰트/테마 =====
 FONT = "Malgun Gothic"  # mac/Linux는 Noto Sans CJK KR 등으로 교체
@@ -81,12 +82,12 @@ def make_kpi_box(title, value, subtitle=None, width=3.6, height=1.6):
         stroke_color=GRID, stroke_width=2,
         fill_color="#161A33", fill_opacity=1.0
     )
-    t1 = Text(title, font=FONT, weight="MEDIUM", color=MUTED).scale(0.36)
+    t1 = cached_text(title, font=FONT, weight="MEDIUM", color=MUTED).scale(0.36)
     t1.move_to(box.get_top()).shift(DOWN * 0.35)
-    t2 = Text(value, font=FONT, weight="BOLD", color=PRIMARY).scale(0.6)
+    t2 = cached_text(value, font=FONT, weight="BOLD", color=PRIMARY).scale(0.6)
     t2.next_to(t1, DOWN, buff=0.15).align_to(t1, LEFT)
     if subtitle:
-        t3 = Text(subtitle, font=FONT, weight="MEDIUM", color=FG).scale(0.32)
+        t3 = cached_text(subtitle, font=FONT, weight="MEDIUM", color=FG).scale(0.32)
         t3.next_to(t2, DOWN, buff=0.1).align_to(t1, LEFT)
         grp = VGroup(box, t1, t2, t3)
     else:
@@ -114,7 +115,7 @@ def donut(values, labels, colors, inner_ratio=0.55, r=1.6):
         p_out = np.array([math.cos(mid), math.sin(mid), 0.0]) * (r + 0.3)
         line = Line(p_in, p_out, color=colors[i], stroke_width=2)
         percent = v / total * 100.0
-        lab = Text(f"{labels[i]} {percent:.1f}%", font=FONT, weight="BOLD", color=FG).scale(0.36)
+        lab = cached_text(f"{labels[i]} {percent:.1f}%", font=FONT, weight="BOLD", color=FG).scale(0.36)
         if math.cos(mid) >= 0:
             lab.next_to(p_out, RIGHT, buff=0.08).align_to(p_out, UP)
         else:
@@ -135,9 +136,9 @@ def hor_bar(values, labels, width=4.6, bar_h=0.28, colors=None):
         bg = Rectangle(width=width, height=h, stroke_width=1, stroke_color=GRID, fill_color="#11142B", fill_opacity=1.0)
         fg = Rectangle(width=w, height=h, stroke_width=0, fill_color=c, fill_opacity=1.0).align_to(bg, LEFT)
         row = VGroup(bg, fg)
-        lab = Text(labels[i], font=FONT, weight="MEDIUM", color=MUTED).scale(0.34)
+        lab = cached_text(labels[i], font=FONT, weight="MEDIUM", color=MUTED).scale(0.34)
         lab.next_to(row, LEFT, buff=0.28)
-        val = Text(fmt_krw_billion(v), font=FONT, weight="BOLD", color=FG).scale(0.34)
+        val = cached_text(fmt_krw_billion(v), font=FONT, weight="BOLD", color=FG).scale(0.34)
         val.next_to(row, RIGHT, buff=0.15)
         grp = VGroup(row, lab, val)
         grp.move_to(np.array([0.0, -y, 0.0]))
@@ -155,15 +156,15 @@ def price_axes(title, xlabels, xmin=0, xmax=2, ymin=800_000, ymax=1_200_000, wid
     )
     xlabs = VGroup()
     for i, s in enumerate(xlabels):
-        tx = Text(s, font=FONT, weight="MEDIUM", color=MUTED).scale(0.3)
+        tx = cached_text(s, font=FONT, weight="MEDIUM", color=MUTED).scale(0.3)
         tx.next_to(ax.c2p(i, ymin), DOWN, buff=0.15)
         xlabs.add(tx)
     ylabs = VGroup()
     for val in range(ymin, ymax + 1, 100_000):
-        ty = Text(f"{val//1000}k", font=FONT, weight="MEDIUM", color=GRID).scale(0.26)
+        ty = cached_text(f"{val//1000}k", font=FONT, weight="MEDIUM", color=GRID).scale(0.26)
         ty.next_to(ax.c2p(xmin, val), LEFT, buff=0.15)
         ylabs.add(ty)
-    title_text = Text(title, font=FONT, weight="BOLD", color=FG).scale(0.4)
+    title_text = cached_text(title, font=FONT, weight="BOLD", color=FG).scale(0.4)
     return ax, xlabs, ylabs, title_text
 
 # ===== 메인 씬 =====
@@ -173,11 +174,11 @@ class HDHI_Report_2025H1(Scene):
         config.frame_height = 8
         self.camera.background_color = BG
 
-        header = Text(
+        header = cached_text(
             f"{DATA['company']} — {DATA['period']} 주요 재무지표 & 사업내용",
             font=FONT, weight="BOLD", color=FG
         ).scale(0.6).to_edge(UP).shift(DOWN * 0.2)
-        sub = Text("단위: 백만원(₩) · 표시는 조원 환산", font=FONT, weight="MEDIUM", color=MUTED).scale(0.32)
+        sub = cached_text("단위: 백만원(₩) · 표시는 조원 환산", font=FONT, weight="MEDIUM", color=MUTED).scale(0.32)
         sub.next_to(header, DOWN, buff=0.12)
         line = Line(LEFT * 6.4, RIGHT * 6.4, color=GRID, stroke_width=2).next_to(sub, DOWN, buff=0.18)
         self.play(FadeIn(header, shift=UP * 0.2), FadeIn(sub), Create(line), run_time=0.9)
@@ -196,7 +197,7 @@ class HDHI_Report_2025H1(Scene):
         seg_labels = [s["label"] for s in DATA["segment_sales"]]
         seg_colors = [PRIMARY, ACCENT, ACCENT2, ACCENT3]
         d = donut(seg_values, seg_labels, seg_colors, inner_ratio=0.60, r=1.8)
-        d_title = Text("사업부문별 매출 구성", font=FONT, weight="BOLD", color=FG).scale(0.4)
+        d_title = cached_text("사업부문별 매출 구성", font=FONT, weight="BOLD", color=FG).scale(0.4)
         d_grp = VGroup(d_title, d).arrange(DOWN, buff=0.25).move_to(np.array([-4.4, -0.6, 0.0]))
         self.play(GrowFromCenter(d[0]), run_time=0.9)
         for i in range(len(seg_values)):
@@ -206,7 +207,7 @@ class HDHI_Report_2025H1(Scene):
         reg_values = [DATA["export_sales"], DATA["domestic_sales"]]
         reg_labels = ["수출", "국내"]
         bars = hor_bar(reg_values, reg_labels, width=4.2, bar_h=0.26, colors=[ACCENT, ACCENT3])
-        bars_title = Text("지역별 매출", font=FONT, weight="BOLD", color=FG).scale(0.4).next_to(bars, UP, buff=0.25)
+        bars_title = cached_text("지역별 매출", font=FONT, weight="BOLD", color=FG).scale(0.4).next_to(bars, UP, buff=0.25)
         bars_grp = VGroup(bars_title, bars).move_to(np.array([-4.4, -2.8, 0.0]))
         self.play(FadeIn(bars_title, shift=UP * 0.2))
         for row in bars:
@@ -215,19 +216,19 @@ class HDHI_Report_2025H1(Scene):
         bl_values = [b["value"] for b in DATA["backlog_by_item"]]
         bl_labels = [b["label"] for b in DATA["backlog_by_item"]]
         bl_bars = hor_bar(bl_values, bl_labels, width=5.3, bar_h=0.24, colors=[PRIMARY, ACCENT, ACCENT3])
-        bl_title = Text("수주잔고 구성", font=FONT, weight="BOLD", color=FG).scale(0.4).next_to(bl_bars, UP, buff=0.22)
-        bl_note = Text(f"합계: {fmt_krw_billion(DATA['backlog_total'])}", font=FONT, weight="MEDIUM", color=MUTED).scale(0.34)
+        bl_title = cached_text("수주잔고 구성", font=FONT, weight="BOLD", color=FG).scale(0.4).next_to(bl_bars, UP, buff=0.22)
+        bl_note = cached_text(f"합계: {fmt_krw_billion(DATA['backlog_total'])}", font=FONT, weight="MEDIUM", color=MUTED).scale(0.34)
         bl_note.next_to(bl_bars, DOWN, buff=0.18)
         right_top = VGroup(bl_title, bl_bars, bl_note).move_to(np.array([3.9, 0.4, 0.0]))
         self.play(FadeIn(bl_title), *[GrowFromEdge(r[0][1], LEFT) for r in bl_bars], run_time=0.6)
         self.play(FadeIn(bl_note), run_time=0.3)
 
         bullets = VGroup(*[
-            VGroup(Dot(radius=0.04, color=PRIMARY), Text(s, font=FONT, weight="MEDIUM", color=FG).scale(0.36)).arrange(RIGHT, buff=0.18)
+            VGroup(Dot(radius=0.04, color=PRIMARY), cached_text(s, font=FONT, weight="MEDIUM", color=FG).scale(0.36)).arrange(RIGHT, buff=0.18)
             for s in DATA["highlights"]
         ])
         bullets.arrange(DOWN, aligned_edge=LEFT, buff=0.20)
-        bullets_title = Text("사업 하이라이트", font=FONT, weight="BOLD", color=FG).scale(0.4).next_to(bullets, UP, buff=0.2)
+        bullets_title = cached_text("사업 하이라이트", font=FONT, weight="BOLD", color=FG).scale(0.4).next_to(bullets, UP, buff=0.2)
         right_mid = VGroup(bullets_title, bullets).move_to(np.array([3.9, -1.7, 0.0]))
         self.play(FadeIn(bullets_title, shift=UP * 0.2))
         for row in bullets:
@@ -237,11 +238,11 @@ class HDHI_Report_2025H1(Scene):
             corner_radius=0.15, width=5.6, height=1.8, stroke_color=GRID, stroke_width=2,
             fill_color="#161A33", fill_opacity=1.0
         )
-        cap_title = Text("생산능력(2025H1)", font=FONT, weight="BOLD", color=FG).scale(0.36)
+        cap_title = cached_text("생산능력(2025H1)", font=FONT, weight="BOLD", color=FG).scale(0.36)
         cap_title.move_to(cap_box.get_top()).shift(DOWN * 0.35)
         cap_lines = VGroup()
         for c in DATA["capacity"]:
-            t = Text(f"{c['label']}: {c['value']}", font=FONT, weight="MEDIUM", color=FG).scale(0.32)
+            t = cached_text(f"{c['label']}: {c['value']}", font=FONT, weight="MEDIUM", color=FG).scale(0.32)
             cap_lines.add(t)
         cap_lines.arrange(DOWN, aligned_edge=LEFT, buff=0.10).next_to(cap_title, DOWN, buff=0.12)
         cap_lines.align_to(cap_box.get_left(), LEFT).shift(RIGHT * 0.35)
@@ -264,11 +265,11 @@ class HDHI_Report_2025H1(Scene):
         hbeam_graph = ax.plot_line_graph(
             x_values=[0, 1, 2], y_values=hb, add_vertex_dots=True, stroke_width=3
         )
-        steel_lbl = Text("후판(SS275 20T)", font=FONT, weight="BOLD", color=FG).scale(0.28)
-        hbeam_lbl = Text("형강(앵글 SS400)", font=FONT, weight="BOLD", color=FG).scale(0.28)
+        steel_lbl = cached_text("후판(SS275 20T)", font=FONT, weight="BOLD", color=FG).scale(0.28)
+        hbeam_lbl = cached_text("형강(앵글 SS400)", font=FONT, weight="BOLD", color=FG).scale(0.28)
         steel_lbl.next_to(ax, UP, buff=0.05).align_to(ax.get_left(), LEFT)
         hbeam_lbl.next_to(steel_lbl, RIGHT, buff=0.5)
-        note = Text(DATA["raw_material_prices"]["note"], font=FONT, color=MUTED).scale(0.26)
+        note = cached_text(DATA["raw_material_prices"]["note"], font=FONT, color=MUTED).scale(0.26)
         note.next_to(ax, DOWN, buff=0.05).align_to(ax.get_left(), LEFT)
 
         self.play(Create(steel_graph), run_time=0.6)
@@ -276,8 +277,8 @@ class HDHI_Report_2025H1(Scene):
         self.play(FadeIn(steel_lbl), FadeIn(hbeam_lbl), FadeIn(note), run_time=0.4)
 
         safety = VGroup(
-            Text("재무 스냅샷", font=FONT, weight="BOLD", color=FG).scale(0.36),
-            Text(
+            cached_text("재무 스냅샷", font=FONT, weight="BOLD", color=FG).scale(0.36),
+            cached_text(
                 f"부채비율 {DATA['debt_ratio_pct']:.2f}% | 현금성 {fmt_krw_billion(DATA['cash_like'])} "
                 f"vs 차입금 {fmt_krw_billion(DATA['borrowings'])} | 이자보상배율 {DATA['interest_coverage']:.2f}배",
                 font=FONT, weight="MEDIUM", color=MUTED
@@ -288,7 +289,7 @@ class HDHI_Report_2025H1(Scene):
         focus_arc = donut(seg_values, seg_labels, seg_colors, inner_ratio=0.60, r=1.8)[0][0]
         self.play(Indicate(focus_arc, color=PRIMARY, scale_factor=1.03), run_time=0.8)
 
-        foot = Text("ⓒ HD현대중공업 2025H1 사업보고서 기반 요약 시각화(내부 참고용)", font=FONT, weight="MEDIUM", color=MUTED).scale(0.28)
+        foot = cached_text("ⓒ HD현대중공업 2025H1 사업보고서 기반 요약 시각화(내부 참고용)", font=FONT, weight="MEDIUM", color=MUTED).scale(0.28)
         foot.to_edge(DOWN).shift(UP * 0.08)
         self.play(FadeIn(foot), run_time=0.4)
         self.wait(1.0)
@@ -10,6 +10,7 @@
 # 글꼴이 없으면 다른 한글 폰트로 대체될 수 있음.
 
 from manim import *
+from text_cache import cached_text
 
 # ===== Manim 전역 해상도 및 프레임 =====
 config.pixel_width = 1400
@@ -170,7 +171,7 @@ class OnboardingFlow(Scene):
     # ===== 헬퍼들 =====
     def make_text(self, s, size=0.42, color=BRAND_TEXT, highlight=False):
         # 중요 키워드 색 강조(간단 규칙: 숫자/퍼센트/천원/백만원 토큰)
-        t = Text(s, font=FONT, weight="MEDIUM", color=color)
+        t = cached_text(s, font=FONT, weight="MEDIUM", color=color)
         t.set_height(size)
         if highlight:
             # 간단 하이라이트: 숫자/퍼센트/단위 포함 토큰
@@ -194,7 +195,7 @@ class OnboardingFlow(Scene):
             fill_opacity=1.0,
             stroke_width=2
         )
-        txt = Text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
+        txt = cached_text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
         txt.set_height(0.44)
         g = VGroup(box, txt)
         txt.move_to(box.get_center())
@@ -228,7 +229,8 @@ class OnboardingFlow(Scene):
         obj.move_to(target_box.get_center())
 
     def update_step(self, header_area_box, label):
-        new_header = Text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
+        self.next_section(label)  # 헤더가 바뀌는 곳을 섹션 경계로
+        new_header = cached_text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
         new_header.scale_to_fit_height(0.6)
         new_header.move_to(header_area_box.get_center()).align_to(header_area_box.get_left(), LEFT).shift(RIGHT * 0.3)
         if self._header is None:
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 히어로 배경 이미지 캐시: 출력 해상도로 줄이고 배경색 위에 합성까지 끝낸 프레임을 디스크에 보관
+# 사용 예:
+#   from hero_cache import hero_background
+#   self.camera.background_color = BRAND_BG   # (배경색을 바꾸면 camera.background 가 다시 만들어지므로 먼저)
+#   self.camera.background = hero_background(ASSET_HERO, BRAND_BG, opacity=0.10, width_ratio=1.05)
+#
+# - 기존 방식(ImageMobject + set_opacity + set_width, z_index -10)과 같은 결과를
+#   카메라의 "프레임 지우기" 배경 배열로 만든다. 그러면 원본 이미지를 매번 읽고
+#   줄여서 합성하는 과정이 없고, 정지 레이어/프레임 초기화가 배열 복사 한 번으로 끝난다.
+# - 키: 원본 파일 내용 해시 + 출력 해상도/프레임 크기 + 불투명도 + 폭 비율 + 배경색
+# - 값: <키>.npy (np.load(mmap_mode="r") 로 열어 여러 렌더 프로세스가 페이지 캐시를 공유)
+# - segment_cache.py 는 배경 배열의 파일 경로(키 포함)를 세그먼트 키에 넣는다.
+#
+# 환경변수
+#   HERO_CACHE_DIR : 저장 위치 (기본: <media_dir>/hero_cache)
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from PIL import Image
+
+_KEY_VERSION = 1
+_digests = {}  # (경로, 수정 시각, 크기) -> 원본 내용 해시
+
+
+def cache_dir():
+    custom = os.environ.get("HERO_CACHE_DIR")
+    path = Path(custom) if custom else Path(config.media_dir) / "hero_cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _file_digest(path):
+    st = os.stat(path)
+    memo = (str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+    if memo not in _digests:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as fp:
+            for chunk in iter(lambda: fp.read(1 << 20), b""):
+                h.update(chunk)
+        _digests[memo] = h.hexdigest()
+    return _digests[memo]
+
+
+# ===== 합성 =====
+def compose_hero(path, bg_color, opacity, width_ratio):
+    # Camera.display_image_mobject 와 같은 순서: RGBA 로 읽고 알파를 불투명도로 덮어쓴 뒤
+    # bicubic 으로 줄여 화면 가운데에 붙이고 배경색 위에 alpha_composite
+    pw, ph = config.pixel_width, config.pixel_height
+    fw, fh = config.frame_width, config.frame_height
+    src = Image.open(path).convert("RGBA")
+    pixels = np.array(src)
+    pixels[:, :, 3] = int(255 * opacity)
+
+    width = fw * width_ratio
+    height = width * src.height / src.width
+    # 모서리 좌표를 points_to_pixel_coords 처럼 정수 픽셀로
+    left = int(-width / 2 * pw / fw + pw / 2)
+    right = int(width / 2 * pw / fw + pw / 2)
+    top = int(-height / 2 * -ph / fh + ph / 2)
+    bottom = int(height / 2 * -ph / fh + ph / 2)
+    size = (max(right - left, 1), max(abs(bottom - top), 1))
+    sub = Image.fromarray(pixels).resize(size, resample=Image.BICUBIC)
+    layer = Image.new("RGBA", (pw, ph), (0, 0, 0, 0))
+    center = np.array([(left + right) / 2, (top + bottom) / 2])
+    ul = (center - np.array(sub.size) / 2).astype(int)
+    layer.paste(sub, box=(ul[0], ul[1], ul[0] + sub.size[0], ul[1] + sub.size[1]))
+
+    base = Image.new("RGBA", (pw, ph), tuple(int(v) for v in color_to_int_rgba(ManimColor(bg_color), 1.0)))
+    return np.array(Image.alpha_composite(base, layer), dtype=np.uint8)
+
+
+def hero_background(path, bg_color, opacity=0.10, width_ratio=1.05):
+    # camera.background 로 쓸 (pixel_height, pixel_width, 4) uint8 읽기 전용 배열
+    key = hashlib.blake2b(repr((
+        _KEY_VERSION, _file_digest(path),
+        config.pixel_width, config.pixel_height, config.frame_width, config.frame_height,
+        round(float(opacity), 4), round(float(width_ratio), 4), ManimColor(bg_color).to_hex(),
+    )).encode("utf-8"), digest_size=16).hexdigest()
+    target = cache_dir() / "hero_{}.npy".format(key)
+    if not target.exists():
+        tmp = target.with_name("{}.{}.npy".format(target.stem, os.getpid()))
+        np.save(tmp, compose_hero(path, bg_color, opacity, width_ratio))
+        os.replace(tmp, target)
+    return np.load(target, mmap_mode="r")
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 다중 출력 렌더: construct/보간/래스터화는 한 번, 같은 프레임을 여러 해상도 인코더에 동시에 넣음
+# 사용 예:
+#   python render.py onb_5.py -q h --outputs 720,270     # 원본(1400x800) + 720p 웹용 + 270p 미리보기
+#   python render.py onb_5.py -q h --outputs 720:libvpx-vp9,270:libx264   # 출력마다 코덱 지정
+#   from multi_output import MultiOutputRenderer
+#   OnboardingFlow(renderer=MultiOutputRenderer(outputs=(720, (270, "libvpx-vp9")))).render()
+#
+# - 원본 해상도로 그린 프레임을 파일 쓰기 스레드에서 높이별로 축소(swscale AREA)해 각 인코더로 보낸다.
+#   가로는 원본 비율에 맞춘 짝수 (yuv420p 는 가로세로가 짝수여야 함).
+# - 출력은 "높이" 또는 "높이:코덱". 코덱을 생략하면 원본과 같은 코덱/옵션/컨테이너,
+#   지정하면 OUTPUT_CODECS 의 컨테이너/옵션으로 yuv420p 인코딩 (투명 배경은 원본 출력에만).
+# - partial 영상도 출력별로 <partial>_<높이>p[_<코덱>].<확장자> 에 쓰고, 씬이 끝나면 각각 이어 붙여
+#   <영상>_<높이>p[_<코덱>].<확장자> 를 만든다 (예: OnboardingFlow_720p_vp9.webm).
+#   세그먼트 캐시는 모든 출력이 있을 때만 적중으로 본다 (코덱이 파일 이름에 있으므로 섞이지 않음).
+# - 소리/섹션 영상/gif 는 원본 출력에만 적용.
+
+import os
+from pathlib import Path
+
+import av
+from manim import *
+from manim.scene.scene_file_writer import to_av_frame_rate
+from manim.utils.file_ops import is_gif_format
+
+from segment_cache import CachingFileWriter, CachingRenderer
+
+# 코덱 -> (파일 이름 표기, 컨테이너 확장자, 인코더 옵션)
+OUTPUT_CODECS = {
+    "libx264": ("h264", ".mp4", {"crf": "23"}),
+    "libx265": ("hevc", ".mp4", {"crf": "28", "x265-params": "log-level=error"}),
+    "libvpx-vp9": ("vp9", ".webm", {"crf": "31", "b": "0", "row-mt": "1"}),
+}
+
+
+def parse_outputs(text):
+    # "720,270" / "720:libvpx-vp9,270:libx264" -> ((720, "libvpx-vp9"), (270, "libx264")), 코덱 생략은 None
+    outputs = []
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        height, _, codec = item.partition(":")
+        try:
+            height = int(height)
+        except ValueError:
+            raise ValueError("출력 높이가 숫자가 아님: {}".format(item)) from None
+        codec = codec.strip() or None
+        if codec is not None and codec not in OUTPUT_CODECS:
+            raise ValueError("지원하지 않는 코덱 {} (가능: {})".format(codec, ", ".join(OUTPUT_CODECS)))
+        if (height, codec) in outputs:
+            raise ValueError("같은 출력이 두 번 있음: {}".format(item))
+        outputs.append((height, codec))
+    return tuple(outputs)
+
+
+def output_size(height):
+    height = int(height) // 2 * 2
+    width = int(round(config.pixel_width * height / config.pixel_height / 2)) * 2
+    return width, height
+
+
+def output_path(path, height, codec=None):
+    path = Path(path)
+    if codec is None:
+        return path.with_name("{}_{}p{}".format(path.stem, height, path.suffix))
+    tag, suffix, _ = OUTPUT_CODECS[codec]
+    return path.with_name("{}_{}p_{}{}".format(path.stem, height, tag, suffix))
+
+
+class MultiOutputFileWriter(CachingFileWriter):
+    def _targets(self):
+        # [(높이, 코덱 또는 None)]
+        return getattr(self.renderer, "outputs", ())
+
+    def is_already_cached(self, hash_invocation):
+        if not super().is_already_cached(hash_invocation):
+            return False
+        base = self._partial_path(hash_invocation)
+        for height, codec in self._targets():
+            path = output_path(base, height, codec)
+            if not path.exists():
+                return False
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return True
+
+    def _cache_keep(self):
+        keep = super()._cache_keep()
+        return keep | {str(output_path(p, h, c)) for p in keep for h, c in self._targets()}
+
+    # ===== 인코더 =====
+    def _open_stream(self, file_path):
+        super()._open_stream(file_path)
+        ctx = self.video_stream.codec_context
+        same = dict(getattr(ctx, "options", None) or {"crf": "23"})
+        self._outputs = []
+        for height, codec in self._targets():
+            width, even_height = output_size(height)
+            tmp = output_path(file_path, height, codec)
+            container = av.open(str(tmp), mode="w")
+            options = dict(OUTPUT_CODECS[codec][2]) if codec else same
+            stream = container.add_stream(codec or ctx.name, rate=to_av_frame_rate(config.frame_rate),
+                                          options=options)
+            stream.pix_fmt = "yuv420p" if codec else self.video_stream.pix_fmt
+            stream.width = width
+            stream.height = even_height
+            self._outputs.append({
+                "container": container, "stream": stream, "tmp": tmp,
+                "final": output_path(self._final_partial, height, codec),
+                "format": "yuv420p" if stream.pix_fmt == "yuv420p" else "rgba", "plane": None,
+            })
+
+    def _encode_frame(self, frame, num_frames):
+        changed = frame is not self._plane_src
+        super()._encode_frame(frame, num_frames)
+        if not self._outputs:
+            return
+        if changed or self._outputs[0]["plane"] is None:
+            rgba = av.VideoFrame.from_ndarray(frame, format="rgba")
+            for out in self._outputs:
+                stream = out["stream"]
+                out["plane"] = rgba.reformat(width=stream.width, height=stream.height, format=out["format"],
+                                             interpolation="AREA").to_ndarray()
+        for out in self._outputs:
+            for _ in range(num_frames):
+                for packet in out["stream"].encode(av.VideoFrame.from_ndarray(out["plane"], format=out["format"])):
+                    out["container"].mux(packet)
+
+    def _close_stream(self):
+        super()._close_stream()
+        # 원본 partial 보다 먼저 교체 (원본이 있으면 다른 출력도 있도록)
+        for out in self._outputs:
+            for packet in out["stream"].encode():
+                out["container"].mux(packet)
+            out["container"].close()
+            os.replace(out["tmp"], out["final"])
+        self._outputs = []
+
+    # ===== 이어 붙이기 =====
+    def combine_to_movie(self):
+        super().combine_to_movie()
+        files = [p for p in self.partial_movie_files if p is not None]
+        if not files or is_gif_format():
+            return
+        for height, codec in self._targets():
+            movie = output_path(self.movie_file_path, height, codec)
+            self.combine_files([str(output_path(p, height, codec)) for p in files], movie)
+            logger.info("%s (%dx%d)", movie, *output_size(height))
+
+
+class MultiOutputRenderer(CachingRenderer):
+    def __init__(self, outputs=(), file_writer_class=MultiOutputFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+        # 높이만 주면 원본과 같은 코덱
+        self.outputs = tuple((int(o), None) if isinstance(o, (int, str)) else (int(o[0]), o[1]) for o in outputs)
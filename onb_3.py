@@ -1,5 +1,7 @@
 from manim import *
 import os
+from hero_cache import hero_background
+from text_cache import cached_text
 
 # ============================================================
 # MANIM_VERSION: 0.19.x (Community)
@@ -13,6 +15,13 @@ config.pixel_height = 800
 config.frame_width  = 14
 config.frame_height = 8
 
+# 드라이런 영역 검사용 (construct 의 레이아웃 박스와 같게 유지)
+LAYOUT_REGIONS = {
+    "header":      ((-7, 3),  (7, 4)),
+    "left_flow":   ((-7, -4), (1.3, 3)),
+    "right_notes": ((1.3, -4), (7, 3)),
+}
+
 # ---------- Brand Tokens (에코캡 톤앤매너: 네이비/시안/그린) ----------
 BRAND_BG       = "#0C1424"  # 다크 네이비
 BRAND_PANEL    = "#121A2D"  # 패널
@@ -157,7 +166,7 @@ class ECOCAP_Onboarding(Scene):
         self.play(FadeOut(hl), run_time=0.4)
 
         # Legal
-        legal = Text(HR["legal"], font=FONT, weight="MEDIUM", color=BRAND_MUTED).scale(0.35)
+        legal = cached_text(HR["legal"], font=FONT, weight="MEDIUM", color=BRAND_MUTED).scale(0.35)
         legal.to_edge(DR, buff=0.3)
         self.play(FadeIn(legal), run_time=0.4)
         self.wait(0.6)
@@ -166,11 +175,8 @@ class ECOCAP_Onboarding(Scene):
     def _maybe_hero_bg(self):
         if isinstance(ASSET_HERO, str) and os.path.exists(ASSET_HERO):
             try:
-                hero = ImageMobject(ASSET_HERO)
-                hero.set_opacity(0.10)
-                hero.set_width(config.frame_width * 1.05)
-                hero.set_z_index(-10)
-                self.add(hero)
+                # 출력 해상도로 줄이고 배경색과 합성해 둔 캐시 이미지를 프레임 배경으로 (hero_cache.py)
+                self.camera.background = hero_background(ASSET_HERO, BRAND_BG, opacity=0.10, width_ratio=1.05)
             except Exception:
                 pass
 
@@ -185,7 +191,7 @@ class ECOCAP_Onboarding(Scene):
         obj.move_to(box.get_center())
 
     def _text(self, s, size=36, weight="MEDIUM", color=BRAND_TEXT, t2c=None):
-        t = Text(s, font=FONT, weight=weight, color=color, t2c=t2c)
+        t = cached_text(s, font=FONT, weight=weight, color=color, t2c=t2c)
         t.scale(size / 36.0)
         return t
 
@@ -237,6 +243,7 @@ class ECOCAP_Onboarding(Scene):
             self.add(mobj)
 
     def _set_header(self, header_box, label):
+        self.next_section(label)  # 헤더가 바뀌는 곳을 섹션 경계로
         new_h = self._text(label, size=54, weight="BOLD",
                            t2c={"안전": "#FFD54F", "품질": "#FFD54F"})
         new_h.move_to(header_box.get_center())
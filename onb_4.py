@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from text_cache import cached_text
 
 # ===== Config & Brand =====
 config.pixel_width  = 1400
@@ -49,7 +50,7 @@ class OnboardingFlow(Scene):
 
         # ===== 회사명/로고 (텍스트 대체) =====
         brand_label = (
-            Text(HR_DATA["company_name"], font=FONT, weight="BOLD", color=BRAND_PRIMARY)
+            cached_text(HR_DATA["company_name"], font=FONT, weight="BOLD", color=BRAND_PRIMARY)
             .scale_to_fit_height(0.6)
             .move_to(header_area.get_left() + RIGHT * 0.4)
         )
@@ -70,7 +71,7 @@ class OnboardingFlow(Scene):
         for i, n in enumerate(nodes):
             if i < len(HR_DATA["values"]):
                 t = (
-                    Text(HR_DATA["values"][i], font=FONT, color=BRAND_ACCENT)
+                    cached_text(HR_DATA["values"][i], font=FONT, color=BRAND_ACCENT)
                     .scale(0.35)
                     .next_to(n, DOWN, buff=0.18)
                 )
@@ -95,13 +96,13 @@ class OnboardingFlow(Scene):
             FadeIn(tags, run_time=0.7),
         )
         self.clear_right(right_notes)
-        self.push_right(Text(HR_DATA["mission"], font=FONT, color=BRAND_TEXT), right_notes, RIGHT_BASE_SCALE)
+        self.push_right(cached_text(HR_DATA["mission"], font=FONT, color=BRAND_TEXT), right_notes, RIGHT_BASE_SCALE)
 
         # ===== 섹션 2: Values (핵심가치) =====
         self.update_step("핵심가치", header_area)
         self.clear_right(right_notes)
         for v in HR_DATA["values"]:
-            line = Text(v, font=FONT, color=BRAND_TEXT)
+            line = cached_text(v, font=FONT, color=BRAND_TEXT)
             self.push_right(line, right_notes, RIGHT_BASE_SCALE)
             self.play(line.animate.set_color(BRAND_PRIMARY), run_time=0.2)
             self.play(line.animate.set_color(BRAND_TEXT), run_time=0.2)
@@ -115,7 +116,7 @@ class OnboardingFlow(Scene):
         self.play(*[m.animate.set_opacity(1.0) for m in left_group], run_time=0.4)
 
         for idx, step in enumerate(HR_DATA["flow"]):
-            self.push_right(Text(step["desc"], font=FONT, color=BRAND_TEXT), right_notes, RIGHT_BASE_SCALE)
+            self.push_right(cached_text(step["desc"], font=FONT, color=BRAND_TEXT), right_notes, RIGHT_BASE_SCALE)
             self.link_left(nodes, edges, idx, created_edge)
             self.wait(0.2)
 
@@ -128,7 +129,7 @@ class OnboardingFlow(Scene):
             "역량개발: 사내교육 · 직무 교육 · 세미나",
         ]
         for g in growth_lines:
-            self.push_right(Text(g, font=FONT, color=BRAND_TEXT), right_notes, RIGHT_BASE_SCALE)
+            self.push_right(cached_text(g, font=FONT, color=BRAND_TEXT), right_notes, RIGHT_BASE_SCALE)
             self.wait(0.1)
 
         # 보조 서브노드(점선)로 마지막 노드 주변 표시
@@ -146,15 +147,15 @@ class OnboardingFlow(Scene):
             sub2.set_fill("#000000", opacity=0.0)
             sub1.next_to(last, UP + RIGHT, buff=0.25)
             sub2.next_to(last, DOWN + RIGHT, buff=0.25)
-            s1t = Text("멘토링", font=FONT, color=BRAND_TEXT).scale(0.35).move_to(sub1.get_center())
-            s2t = Text("사내교육", font=FONT, color=BRAND_TEXT).scale(0.35).move_to(sub2.get_center())
+            s1t = cached_text("멘토링", font=FONT, color=BRAND_TEXT).scale(0.35).move_to(sub1.get_center())
+            s2t = cached_text("사내교육", font=FONT, color=BRAND_TEXT).scale(0.35).move_to(sub2.get_center())
             dotted = VGroup(sub1, sub2, s1t, s2t)
             self.play(FadeIn(dotted, run_time=0.5))
 
         # ===== 섹션 5: CTA =====
         self.update_step("시작할까요?", header_area)
         self.clear_right(right_notes)
-        cta = Text(HR_DATA["cta"], font=FONT, color=BRAND_PRIMARY)
+        cta = cached_text(HR_DATA["cta"], font=FONT, color=BRAND_PRIMARY)
         self.push_right(cta, right_notes, RIGHT_BASE_SCALE)
         self.play(*[n[0].animate.set_stroke(color=BRAND_TEXT, width=2) for n in nodes], run_time=0.3)
         if len(nodes) > 0:
@@ -165,7 +166,7 @@ class OnboardingFlow(Scene):
             )
 
         # ===== 법무(엔드카드) =====
-        legal = Text(HR_DATA["legal"], font=FONT, color="#AAAAAA").scale(0.35)
+        legal = cached_text(HR_DATA["legal"], font=FONT, color="#AAAAAA").scale(0.35)
         legal.to_corner(DR, buff=0.25)
         self.play(FadeIn(legal), run_time=0.6)
         self.wait(0.6)
@@ -191,7 +192,7 @@ class OnboardingFlow(Scene):
             stroke_color=BRAND_TEXT, stroke_width=2,
             fill_color="#000000", fill_opacity=0.0
         )
-        txt = Text(label, font=FONT, color=BRAND_TEXT).scale(0.45)
+        txt = cached_text(label, font=FONT, color=BRAND_TEXT).scale(0.45)
         grp = VGroup(box, txt).arrange(DOWN, buff=0.0)
         txt.move_to(box.get_center())
         return grp
@@ -201,14 +202,15 @@ class OnboardingFlow(Scene):
         end   = n2[0].get_left()
         arr = Arrow(start, end, buff=0.2, stroke_color=BRAND_TEXT, stroke_width=2, max_tip_length_to_length_ratio=0.08)
         if label:
-            t = Text(label, font=FONT, color=BRAND_TEXT).scale(0.35)
+            t = cached_text(label, font=FONT, color=BRAND_TEXT).scale(0.35)
             t.next_to(arr, UP, buff=0.05)
             return VGroup(arr, t)
         return arr
 
     def update_step(self, label, header_area):
+        self.next_section(label)  # 헤더가 바뀌는 곳을 섹션 경계로
         new_header = (
-            Text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
+            cached_text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
             .scale_to_fit_height(0.6)
             .move_to(header_area.get_center())
         )
@@ -4,6 +4,8 @@
 # 2) 본편 실행   : manim -pql onb_5.py OnboardingFlow
 
 from manim import *
+from text_cache import cached_text
+from text_metrics import wrap_text
 
 # ===== Config & Brand =====
 config.pixel_width  = 1400
@@ -53,8 +55,8 @@ def fit_to_width(mobj: Mobject, max_w: float):
 class Intro(Scene):
     def construct(self):
         self.camera.background_color = BRAND_BG
-        title = Text("NOVATEK Onboarding", font=FONT, color=BRAND_TEXT).scale(0.9)
-        subtitle = Text("테스트 렌더씬 (Intro)", font=FONT, color=BRAND_ACCENT).scale(0.6)
+        title = cached_text("NOVATEK Onboarding", font=FONT, color=BRAND_TEXT).scale(0.9)
+        subtitle = cached_text("테스트 렌더씬 (Intro)", font=FONT, color=BRAND_ACCENT).scale(0.6)
         subtitle.next_to(title, DOWN, buff=0.4)
         g = VGroup(title, subtitle).move_to(ORIGIN)
         self.play(FadeIn(g, shift=0.3*UP), run_time=0.8)
@@ -76,7 +78,8 @@ class OnboardingFlow(Scene):
 
         # ---- Header updater ----
         def update_step(label):
-            new_h = Text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
+            self.next_section(label)  # 헤더가 바뀌는 곳을 섹션 경계로
+            new_h = cached_text(label, font=FONT, weight="BOLD", color=BRAND_TEXT)
             new_h.scale_to_fit_height(0.6)
             new_h.move_to(header_area.get_center()).align_to(header_area.get_left(), LEFT)
             if self.header_label is None:
@@ -120,7 +123,7 @@ class OnboardingFlow(Scene):
 
         # ---- Left flow (nodes + edges) ----
         def make_node(label_text):
-            label = Text(label_text, font=FONT, color=BRAND_TEXT, weight="BOLD").scale(0.5)
+            label = cached_text(label_text, font=FONT, color=BRAND_TEXT, weight="BOLD").scale(0.5)
             pad = 0.4
             rr = RoundedRectangle(corner_radius=0.2, width=label.width + 1.0, height=label.height + pad)
             rr.set_stroke(color="#5A5A5A", width=2)
@@ -175,20 +178,20 @@ class OnboardingFlow(Scene):
         # Intro
         update_step(HR_DATA["company_name"])
         clear_right()
-        intro_line = Text(HR_DATA["mission"], font=FONT, color=BRAND_TEXT)
+        intro_line = cached_text(HR_DATA["mission"], font=FONT, color=BRAND_TEXT)
         push_right(intro_line)
 
         # Values
         update_step("핵심가치")
         for v in HR_DATA["values"]:
-            t = Text(v, font=FONT, color=BRAND_TEXT, weight="BOLD")
+            t = cached_text(v, font=FONT, color=BRAND_TEXT, weight="BOLD")
             push_right(t)
 
         # Flow walkthrough
         update_step("온보딩 흐름")
         clear_right()
         for i, step in enumerate(HR_DATA["flow"]):
-            msg = Text(f"{step['id']}: {step['desc']}", font=FONT, color=BRAND_TEXT)
+            msg = cached_text(f"{step['id']}: {step['desc']}", font=FONT, color=BRAND_TEXT)
             push_right(msg)
             link_left(i)
             self.wait(0.2)
@@ -201,14 +204,15 @@ class OnboardingFlow(Scene):
             "업무툴/보안정책 준수로 품질과 안전 강화",
             "커리어 프레임 기반 역량 성장",
         ]:
-            t = Text(m, font=FONT, color=BRAND_TEXT)
+            t = cached_text(m, font=FONT, color=BRAND_TEXT)
             push_right(t)
 
         # CTA
         update_step("시작하기")
         clear_right()
-        cta = Text(HR_DATA["cta"], font=FONT, color=BRAND_TEXT, weight="BOLD")
-        fit_to_width(cta, right_notes.width - 0.6)
+        # 조판 전에 우측 폭 기준으로 줄바꿈(측정만, 도형 생성 없음)
+        cta_lines = wrap_text(HR_DATA["cta"], right_notes.width - 0.6, font=FONT, weight="BOLD", scale=RIGHT_BASE_SCALE)
+        cta = cached_text("\n".join(cta_lines), font=FONT, color=BRAND_TEXT, weight="BOLD")
         push_right(cta)
 
         # Left flow highlight & final node focus
@@ -216,7 +220,7 @@ class OnboardingFlow(Scene):
         link_left(len(HR_DATA["flow"]) - 1)
 
         # Legal (end card)
-        legal = Text(HR_DATA["legal"], font=FONT, color="#BDBDBD").scale(0.35)
+        legal = cached_text(HR_DATA["legal"], font=FONT, color="#BDBDBD").scale(0.35)
         legal.to_edge(DOWN).to_edge(RIGHT)
         self.play(FadeIn(legal), run_time=0.6)
         self.wait(0.5)
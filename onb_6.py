@@ -3,6 +3,8 @@
 
 from manim import *
 import numpy as np
+from text_cache import cached_text
+from text_metrics import wrap_text
 
 # ===== 환경/버전 & 폰트 가이드 =====
 MANIM_VERSION = "0.19.x"
@@ -77,7 +79,7 @@ class OnboardingFlow(Scene):
         header_label = VGroup()
         def update_step(label):
             nonlocal header_label
-            new_label = Text(str(label), font=TITLE_FONT, weight="BOLD", color=BRAND_TEXT)
+            new_label = cached_text(str(label), font=TITLE_FONT, weight="BOLD", color=BRAND_TEXT)
             new_label.scale_to_fit_height(0.6 * header_area.height)
             new_label.move_to(header_area.get_center())
             if len(header_label) > 0:
@@ -123,7 +125,7 @@ class OnboardingFlow(Scene):
                 stroke_color=NEUTRAL_STROKE, stroke_width=2,
                 fill_color=NEUTRAL_FILL, fill_opacity=1.0,
             )
-            txt = Text(str(label), font=BODY_FONT, weight="BOLD", color=BRAND_TEXT)
+            txt = cached_text(str(label), font=BODY_FONT, weight="BOLD", color=BRAND_TEXT)
             txt.scale_to_fit_height(0.45 * box.height)
             grp = VGroup(box, txt).arrange(DOWN, buff=0.0)
             txt.move_to(box.get_center())
@@ -132,7 +134,7 @@ class OnboardingFlow(Scene):
         def make_edge(n1, n2, label=None):
             a = Arrow(n1.get_right(), n2.get_left(), stroke_width=2.5, buff=0.25)
             if label:
-                t = Text(str(label), font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale(0.35)
+                t = cached_text(str(label), font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale(0.35)
                 t.next_to(a, UP, buff=0.1)
                 return VGroup(a, t)
             return a
@@ -165,7 +167,7 @@ class OnboardingFlow(Scene):
         try: self.next_section("Intro")
         except Exception: pass
         update_step(HR_DATA["company_name"])
-        intro_line = Text(HR_DATA["mission"], font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT)
+        intro_line = cached_text(HR_DATA["mission"], font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT)
         push_right(intro_line)
         self.wait(0.2)
 
@@ -175,8 +177,8 @@ class OnboardingFlow(Scene):
         update_step("핵심가치")
         clear_right()
         for v in HR_DATA["values"]:
-            line = Text(str(v), font=BODY_FONT, weight="BOLD", color=BRAND_TEXT)
-            bullet = Text("•", font=BODY_FONT, weight="BOLD", color=BRAND_PRIMARY).scale(0.65)
+            line = cached_text(str(v), font=BODY_FONT, weight="BOLD", color=BRAND_TEXT)
+            bullet = cached_text("•", font=BODY_FONT, weight="BOLD", color=BRAND_PRIMARY).scale(0.65)
             group = VGroup(bullet, line).arrange(RIGHT, buff=0.25)
             push_right(group)
             self.wait(0.2)
@@ -188,8 +190,8 @@ class OnboardingFlow(Scene):
         clear_right()
         for idx, step in enumerate(HR_DATA["flow"]):
             link_left(idx)
-            push_right(Text(f"[{step['id']}]", font=BODY_FONT, weight="BOLD", color=BRAND_PRIMARY))
-            desc = Text(step["desc"], font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT)
+            push_right(cached_text(f"[{step['id']}]", font=BODY_FONT, weight="BOLD", color=BRAND_PRIMARY))
+            desc = cached_text(step["desc"], font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT)
             push_right(desc)
             self.wait(0.6)
 
@@ -199,7 +201,7 @@ class OnboardingFlow(Scene):
         update_step("성장 & 지원")
         clear_right()
         for line in HR_DATA.get("growth_support", []):
-            push_right(Text(line, font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT))
+            push_right(cached_text(line, font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT))
             self.wait(0.2)
 
         # 보조노드(점선) — ✅ DashedVMobject 사용
@@ -210,8 +212,8 @@ class OnboardingFlow(Scene):
             fill_color=NEUTRAL_FILL, fill_opacity=1.0,
         )
         sub2 = sub1.copy()
-        t1 = Text("멘토십", font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale_to_fit_height(0.4 * sub1.height)
-        t2 = Text("교육/자격", font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale_to_fit_height(0.4 * sub2.height)
+        t1 = cached_text("멘토십", font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale_to_fit_height(0.4 * sub1.height)
+        t2 = cached_text("교육/자격", font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale_to_fit_height(0.4 * sub2.height)
         t1.move_to(sub1.get_center())
         t2.move_to(sub2.get_center())
 
@@ -231,10 +233,10 @@ class OnboardingFlow(Scene):
         except Exception: pass
         update_step("첫 주, 이렇게 시작하세요")
         clear_right()
-        cta = Text(HR_DATA["cta"], font=BODY_FONT, weight="BOLD", color=BRAND_TEXT)
+        # 조판 전에 우측 폭 기준으로 줄바꿈(측정만, 도형 생성 없음)
         max_w = right_notes.width - 0.6
-        if cta.width > max_w:
-            cta.scale_to_fit_width(max_w)
+        cta_lines = wrap_text(HR_DATA["cta"], max_w, font=BODY_FONT, weight="BOLD", scale=RIGHT_BASE_SCALE)
+        cta = cached_text("\n".join(cta_lines), font=BODY_FONT, weight="BOLD", color=BRAND_TEXT)
         push_right(cta)
 
         self.play(*[grp[0].animate.set_stroke(color=BRAND_PRIMARY, width=3.5) for grp in left_nodes], run_time=0.5)
@@ -242,7 +244,7 @@ class OnboardingFlow(Scene):
         self.wait(1.0)
 
         # ===== 법무 엔드카드 =====
-        legal = Text(HR_DATA["legal"], font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale(0.35)
+        legal = cached_text(HR_DATA["legal"], font=BODY_FONT, weight="MEDIUM", color=BRAND_TEXT).scale(0.35)
         legal.move_to(np.array([right_notes.get_right()[0] - 0.1, -3.7, 0])).align_to(right_notes.get_right(), RIGHT)
         self.play(FadeIn(legal), run_time=0.6)
         self.wait(1.0)
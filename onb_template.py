@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 데이터 기반 온보딩 템플릿: 회사 레코드(JSON Lines / CSV)마다 같은 구성으로 렌더
+# 실행 예:
+#   python onb_template.py companies.jsonl -q h             # 전체 회사를 한 프로세스에서 연속 렌더
+#   python onb_template.py companies.jsonl -q h -j 4        # 프로세스 4개로 나눠 렌더
+#   python onb_template.py companies.jsonl --only swh_onboarding --dry-run
+#   manim -pql onb_template.py OnboardingTemplate           # 내장 예시 레코드로 미리보기
+#
+# 레코드 필드
+#   slug            : 출력 파일 이름 (없으면 company_001 ...)
+#   company_name, mission, values[], flow[{id, desc}]  (onboarding_flow 도 허용, 비면 흐름도/흐름 단계 생략)
+#   sections[{title, subtitle, lines[], chips[]}]      : 흐름 다음 단계들 (선택)
+#   cta_title, cta, legal
+#   hero            : 배경 이미지 경로 (선택, 레코드 파일 기준 상대 경로)
+#   brand           : {bg, primary, accent, text, panel, stroke, dimmed} 일부만 바꿔도 됨
+# CSV 는 목록을 "|" 로 구분하고 flow 는 "입사:첫날 환영|교육:안전 교육" 형식,
+# sections/brand 는 JSON 문자열로 넣는다.
+#
+# 데이터와 무관한 도형(레이아웃 박스, 우측 패널, 노드 수별 흐름도 뼈대)은 프로세스당
+# 한 번만 만들고 레코드마다 복사해 쓴다. Text 는 text_cache 로 회사 간에도 재사용된다.
+
+from manim import *
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from pathlib import Path
+from hero_cache import hero_background
+from text_cache import cached_text
+from text_metrics import wrap_text
+
+# ===== Canvas =====
+CANVAS = {"pixel_width": 1400, "pixel_height": 800, "frame_width": 14, "frame_height": 8}
+config.update(CANVAS)
+
+FONT = "Malgun Gothic"
+
+# ===== 기본 브랜드 (레코드의 brand 로 덮어씀) =====
+BRAND = {
+    "bg":      "#1E1E1E",
+    "primary": "#FFD54F",
+    "accent":  "#4FC3F7",
+    "text":    "#FFFFFF",
+    "panel":   "#252525",
+    "stroke":  "#3A3A3A",
+    "dimmed":  "#1A1A1A",
+}
+
+# ===== 레이아웃 =====
+LAYOUT_REGIONS = {
+    "header":      ((-7, 3),  (7, 4)),
+    "left_flow":   ((-7, -4), (1.2, 3)),
+    "right_notes": ((1.2, -4), (7, 3)),
+}
+RIGHT_BASE_SCALE = 0.6
+RIGHT_MAX_ITEMS = 5
+
+SAMPLE_RECORD = {
+    "slug": "sample_onboarding",
+    "company_name": "샘플 컴퍼니",
+    "mission": "미션/비전 문장 한 줄로 요약해 주세요.",
+    "values": ["고객집착", "주인의식", "협업", "성장"],
+    "flow": [
+        {"id": "입사", "desc": "첫날 환영 · 계정 발급 · 필수 서류"},
+        {"id": "교육", "desc": "안전/품질/제품/보안/문화 교육"},
+        {"id": "고객 가치 창출", "desc": "현장 문제해결 · 피드백 루프 운영"},
+        {"id": "성장", "desc": "역량 개발 · 커리어 프레임 · 멘토십"},
+    ],
+    "sections": [
+        {"title": "성장 & 지원", "lines": ["멘토십 · 피어 러닝 · 정기 피드백", "커리어 프레임 기반 역량 성장"]},
+    ],
+    "cta": "지금 팀 채널에 첫 주 목표를 공유하고, 궁금한 점을 질문하세요.",
+    "legal": "ⓒ SAMPLE. 내부용 온보딩 영상. 무단배포 금지.",
+}
+
+
+# ===== 레코드 읽기 =====
+def normalize_record(raw, index=0, base_dir=None):
+    rec = dict(raw)
+    if "flow" not in rec and "onboarding_flow" in rec:
+        rec["flow"] = rec.pop("onboarding_flow")
+    rec["slug"] = re.sub(r"[^\w.-]+", "_", str(rec.get("slug") or "company_{:03d}".format(index + 1)))
+    for key in ("values", "flow", "sections"):
+        rec.setdefault(key, [])
+    for key in ("mission", "cta", "legal"):
+        rec.setdefault(key, "")
+    rec.setdefault("cta_title", "첫 주, 이렇게 시작하세요")
+    rec["brand"] = {**BRAND, **(rec.get("brand") or {})}
+    if rec.get("hero") and base_dir is not None:
+        rec["hero"] = str(Path(base_dir) / rec["hero"])
+    return rec
+
+
+def _csv_record(row):
+    rec = {k: v for k, v in row.items() if v not in (None, "")}
+    if "values" in rec:
+        rec["values"] = [v.strip() for v in rec["values"].split("|") if v.strip()]
+    if "flow" in rec:
+        steps = [item.partition(":") for item in rec["flow"].split("|") if item.strip()]
+        rec["flow"] = [{"id": step.strip(), "desc": desc.strip()} for step, _, desc in steps]
+    for key in ("sections", "brand"):
+        if key in rec:
+            rec[key] = json.loads(rec[key])
+    return rec
+
+
+def iter_records(path):
+    # 한 줄(한 행)씩 읽어서 바로 넘김 (수백 개여도 전체를 메모리에 올리지 않음)
+    path = Path(path)
+    with open(path, encoding="utf-8-sig", newline="") as fp:
+        if path.suffix.lower() == ".csv":
+            raws = (_csv_record(row) for row in csv.DictReader(fp))
+        else:
+            raws = (json.loads(line) for line in fp if line.strip())
+        for i, raw in enumerate(raws):
+            yield normalize_record(raw, i, path.parent)
+
+
+# ===== 데이터와 무관한 도형 (프로세스당 1회) =====
+def _box(p1, p2):
+    (x1, y1), (x2, y2) = p1, p2
+    r = Rectangle(width=abs(x2 - x1), height=abs(y2 - y1), stroke_width=0, fill_opacity=0)
+    return r.move_to(((x1 + x2) / 2, (y1 + y2) / 2, 0))
+
+
+@lru_cache(maxsize=None)
+def _layout():
+    return {name: _box(*corners) for name, corners in LAYOUT_REGIONS.items()}
+
+
+@lru_cache(maxsize=None)
+def _right_panel():
+    right = _layout()["right_notes"]
+    panel = RoundedRectangle(corner_radius=0.22, width=right.width * 0.96, height=right.height * 0.96)
+    return panel.move_to(right.get_center())
+
+
+@lru_cache(maxsize=None)
+def _flow_skeleton(count):
+    # 노드 상자 크기를 고정(onb_6 방식)해 라벨과 무관하게 노드 수만으로 배치가 정해짐
+    boxes = VGroup(*[RoundedRectangle(corner_radius=0.25, width=3.4, height=1.1) for _ in range(count)])
+    boxes.arrange(RIGHT, buff=0.6)
+    edges = VGroup(*[
+        Arrow(boxes[i].get_right(), boxes[i + 1].get_left(), stroke_width=2.5, buff=0.25)
+        for i in range(count - 1)
+    ])
+    group = VGroup(boxes, edges)
+    left = _layout()["left_flow"]
+    s = min((left.width * 0.97) / group.width, (left.height * 0.97) / group.height)
+    group.scale(s).move_to(left.get_center())
+    return group
+
+
+# ===== 템플릿 씬 =====
+class OnboardingTemplate(Scene):
+    record = normalize_record(SAMPLE_RECORD)
+
+    @classmethod
+    def for_record(cls, record):
+        # 레코드를 고정한 하위 클래스 (드라이런/섹션 병렬 등 클래스를 받는 도구와 함께 쓰기 위함)
+        return type(cls.__name__, (cls,), {"record": record, "__module__": cls.__module__})
+
+    def construct(self):
+        rec = self.record
+        self.brand = rec["brand"]
+        self.layout = _layout()
+        self.camera.background_color = self.brand["bg"]
+        self._header = None
+        self._right_stack = []
+
+        self._maybe_hero_bg(rec.get("hero"))
+        panel = _right_panel().copy()
+        panel.set_fill(self.brand["panel"], opacity=0.92).set_stroke(self.brand["stroke"], width=2)
+        self.add(panel)
+
+        # 흐름이 없는 레코드는 흐름도/흐름 단계/마지막 강조를 모두 건너뜀
+        nodes = edges = None
+        if rec["flow"]:
+            nodes, edges = self._build_flow([step["id"] for step in rec["flow"]])
+            self.play(GrowFromCenter(nodes), run_time=0.6)
+            if len(edges) > 0:
+                self.play(*[Create(e) for e in edges], run_time=0.6)
+
+        # Intro
+        self._set_header(rec["company_name"])
+        self._push(self._text(rec["mission"], weight="MEDIUM"))
+        self.wait(0.2)
+
+        # Values
+        if rec["values"]:
+            self._set_header("핵심가치")
+            self._clear()
+            for v in rec["values"]:
+                self._push(self._bullet(v))
+                self.wait(0.2)
+
+        # Flow
+        if rec["flow"]:
+            self._set_header("온보딩 흐름")
+            self._clear()
+            for idx, step in enumerate(rec["flow"]):
+                self._focus(nodes, edges, idx)
+                self._push(self._text("[{}]".format(step["id"]), weight="BOLD", color=self.brand["primary"]))
+                self._push(self._text(step["desc"], weight="MEDIUM"))
+                self.wait(0.6)
+
+        # 추가 단계 (R&D, 고객사, 성장 & 지원 등)
+        for sec in rec["sections"]:
+            self._set_header(sec["title"])
+            self._clear()
+            if sec.get("subtitle"):
+                self._push(self._text(sec["subtitle"], weight="BOLD"))
+            for line in sec.get("lines", []):
+                self._push(self._bullet(line))
+                self.wait(0.2)
+            if sec.get("chips"):
+                self._push(self._chips(sec["chips"]))
+            self.wait(0.3)
+
+        # CTA
+        if rec["cta"]:
+            self._set_header(rec["cta_title"])
+            self._clear()
+            # 조판 전에 우측 폭 기준으로 줄바꿈
+            lines = wrap_text(rec["cta"], self._right_max_width(), font=FONT, weight="BOLD", scale=RIGHT_BASE_SCALE)
+            self._push(self._text("\n".join(lines), weight="BOLD"))
+        if nodes is not None:
+            self.play(*[n[0].animate.set_stroke(color=self.brand["primary"], width=3.5) for n in nodes], run_time=0.5)
+        self.wait(1.0)
+
+        # Legal
+        if rec["legal"]:
+            right = self.layout["right_notes"]
+            legal = self._text(rec["legal"], weight="MEDIUM").scale(0.35)
+            legal.move_to([0, -3.7, 0]).align_to(right.get_right() + LEFT * 0.1, RIGHT)
+            self.play(FadeIn(legal), run_time=0.6)
+            self.wait(1.0)
+
+    # ===================== Helpers =====================
+    def _maybe_hero_bg(self, path):
+        if path and os.path.exists(path):
+            try:
+                # 출력 해상도로 줄이고 배경색과 합성해 둔 캐시 이미지를 프레임 배경으로 (hero_cache.py)
+                self.camera.background = hero_background(path, self.brand["bg"], opacity=0.10, width_ratio=1.05)
+            except Exception:
+                pass
+
+    def _text(self, s, weight="MEDIUM", color=None):
+        return cached_text(str(s), font=FONT, weight=weight, color=color or self.brand["text"])
+
+    def _bullet(self, s):
+        dot = cached_text("•", font=FONT, weight="BOLD", color=self.brand["primary"]).scale(0.65)
+        return VGroup(dot, self._text(s)).arrange(RIGHT, buff=0.25)
+
+    def _chips(self, items, cols=3):
+        chips = VGroup()
+        for s in items:
+            t = self._text(s, weight="BOLD").scale(0.8)
+            rr = RoundedRectangle(corner_radius=0.2, width=t.width + 0.45, height=t.height + 0.3)
+            rr.set_fill(self.brand["panel"], opacity=1.0).set_stroke(self.brand["stroke"], width=2)
+            t.move_to(rr.get_center())
+            chips.add(VGroup(rr, t))
+        chips.arrange_in_grid(rows=(len(items) - 1) // cols + 1, cols=cols, buff=0.25, cell_alignment=LEFT)
+        return chips
+
+    def _build_flow(self, labels):
+        boxes, edges = _flow_skeleton(len(labels)).copy()
+        nodes = VGroup()
+        for box, label in zip(boxes, labels):
+            box.set_stroke(self.brand["stroke"], width=2).set_fill(self.brand["panel"], opacity=1.0)
+            txt = self._text(label, weight="BOLD")
+            txt.scale_to_fit_height(0.45 * box.height)
+            if txt.width > box.width * 0.85:
+                txt.scale_to_fit_width(box.width * 0.85)
+            txt.move_to(box.get_center())
+            nodes.add(VGroup(box, txt))
+        edges.set_color(self.brand["stroke"])
+        return nodes, edges
+
+    def _focus(self, nodes, edges, idx):
+        for i, node in enumerate(nodes):
+            box = node[0]
+            if i < idx:
+                box.set_stroke(color=self.brand["stroke"], width=2.0).set_fill(self.brand["panel"], opacity=1.0)
+            elif i == idx:
+                box.set_stroke(color=self.brand["primary"], width=4.0).set_fill(self.brand["panel"], opacity=1.0)
+            else:
+                box.set_stroke(color=self.brand["stroke"], width=1.5).set_fill(self.brand["dimmed"], opacity=1.0)
+        for j, e in enumerate(edges):
+            e.set_color(self.brand["primary"] if j < idx else self.brand["stroke"])
+        self.play(Wiggle(nodes[idx], scale_value=1.02), run_time=0.35)
+
+    def _set_header(self, label):
+        self.next_section(label)  # 헤더가 바뀌는 곳을 섹션 경계로
+        header = self.layout["header"]
+        new_h = self._text(label, weight="BOLD")
+        new_h.scale_to_fit_height(0.6 * header.height)
+        if new_h.width > header.width - 0.6:
+            new_h.scale_to_fit_width(header.width - 0.6)
+        new_h.move_to(header.get_center())
+        if self._header is not None:
+            self.play(FadeOut(self._header), run_time=0.3)
+        self._header = new_h
+        self.play(FadeIn(new_h), run_time=0.35)
+
+    def _right_max_width(self):
+        return self.layout["right_notes"].width - 0.9
+
+    def _clear(self):
+        if self._right_stack:
+            self.play(*[FadeOut(m) for m in self._right_stack], run_time=0.3)
+        self._right_stack = []
+
+    def _push(self, mobj):
+        right = self.layout["right_notes"]
+        left_x = right.get_left() + RIGHT * 0.45
+        mobj.scale(RIGHT_BASE_SCALE)
+        if mobj.width > self._right_max_width():
+            mobj.scale_to_fit_width(self._right_max_width())
+        if self._right_stack:
+            mobj.next_to(self._right_stack[-1], DOWN, buff=0.35).align_to(left_x, LEFT)
+        else:
+            mobj.next_to(right.get_top(), DOWN, buff=0.6).align_to(left_x, LEFT)
+        if len(self._right_stack) >= RIGHT_MAX_ITEMS:
+            # 오래된 줄을 밀어 올림
+            oldest = self._right_stack.pop(0)
+            shift = self._right_stack[0].get_top()[1] - oldest.get_top()[1]
+            mobj.shift(DOWN * shift)
+            self.play(FadeOut(oldest), *[m.animate.shift(DOWN * shift) for m in self._right_stack], run_time=0.25)
+        self._right_stack.append(mobj)
+        self.play(FadeIn(mobj, shift=RIGHT * 0.15), run_time=0.35)
+
+
+# ===== 일괄 렌더 =====
+def _render_record(record, quality, dry):
+    # 한 프로세스에서 여러 레코드를 연달아 렌더해도 되도록 매번 설정을 다시 맞춤
+    from dry_run import dry_run
+    from render_common import apply_quality
+    from segment_cache import CachingRenderer
+
+    apply_quality(quality)
+    config.update(CANVAS)
+    config.input_file = Path(__file__).resolve()
+    cls = OnboardingTemplate.for_record(record)
+    if dry:
+        return dry_run(cls)
+    config.output_file = record["slug"]
+    scene = cls(renderer=CachingRenderer())
+    scene.render()
+    return {"slug": record["slug"], "movie": str(scene.renderer.file_writer.movie_file_path)}
+
+
+def _render_job(job):
+    # 레코드 하나가 실패해도 나머지는 계속 렌더
+    slug = job[0]["slug"]
+    try:
+        return {"slug": slug, "ok": True, "result": _render_record(*job)}
+    except Exception:
+        return {"slug": slug, "ok": False, "error": traceback.format_exc(limit=5)}
+
+
+def main(argv=None):
+    from dry_run import format_report
+
+    parser = argparse.ArgumentParser(description="데이터 기반 온보딩 템플릿 렌더")
+    parser.add_argument("records", help="회사 레코드 파일 (.jsonl / .csv)")
+    parser.add_argument("-q", "--quality", default="l", help="l/m/h/p/k (기본 l)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="동시 프로세스 수 (기본 1)")
+    parser.add_argument("--only", nargs="*", help="이 slug 들만 렌더")
+    parser.add_argument("--dry-run", action="store_true", help="래스터/인코딩 없이 배치와 타이밍만 검사")
+    args = parser.parse_args(argv)
+
+    records = (r for r in iter_records(args.records) if not args.only or r["slug"] in args.only)
+    jobs = ((r, args.quality, args.dry_run) for r in records)
+
+    def report(outcome):
+        # 실패(예외 또는 드라이런 넘침)면 True
+        if not outcome["ok"]:
+            print("[실패] {}\n{}".format(outcome["slug"], outcome["error"].rstrip()), file=sys.stderr)
+            return True
+        result = outcome["result"]
+        if args.dry_run:
+            print(format_report(result))
+            return bool(result["overflows"])
+        print("[완료] {} -> {}".format(result["slug"], result["movie"]))
+        return False
+
+    failed = 0
+    if args.jobs > 1:
+        # pool.map 은 레코드 생성기를 처음에 다 읽으므로, 프로세스 수의 두 배까지만 미리 넣음
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            pending = set()
+            for job in jobs:
+                if len(pending) >= args.jobs * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    failed += sum(report(f.result()) for f in done)
+                pending.add(pool.submit(_render_job, job))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                failed += sum(report(f.result()) for f in done)
+    else:
+        for job in jobs:
+            failed += report(_render_job(job))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
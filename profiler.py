@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# play 단위 렌더 프로파일러: self.play / self.wait 마다 호출한 헬퍼와 단계별 시간을 표로 출력
+# 사용 예:
+#   python render.py h_2.py -q h --profile
+#   FastRenderer(profile=True)  # scene_finished 에서 표 출력, renderer.profiler.rows 로 원자료 접근
+#
+# 단계 (초)
+#   build  : 직전 play 이후 construct 코드(도형 생성, Text/Axes 등) + 애니메이션 준비(begin)
+#   interp : 프레임마다 애니메이션 보간 (scene.update_to_time)
+#   raster : 정지 레이어 + 프레임 래스터화 (Cairo, 페이드 합성, 스프라이트 변형 포함)
+#   hash   : 세그먼트 키, 프레임 생략용 상태 해시
+#   encode : RGBA -> YUV 변환 + 인코딩 (파일 쓰기 스레드에서 측정, 본 스레드와 겹칠 수 있음)
+#            프레임을 큐에 넣을 때의 play 에 더함 (인코딩은 play 보다 늦게 끝날 수 있음)
+#   other  : play 전체에서 위를 뺀 나머지 (인코더 열기/닫기 대기 등, 표를 만들 때 계산)
+
+import os
+import sys
+import time
+from collections import defaultdict, deque
+
+from manim import *
+
+PHASES = ("build", "interp", "raster", "hash", "encode")
+_MANIM_DIR = os.path.dirname(sys.modules["manim"].__file__)
+
+
+def _scene_files(scene):
+    files = set()
+    for klass in type(scene).__mro__:
+        module = sys.modules.get(klass.__module__)
+        path = getattr(module, "__file__", None)
+        if path and not path.startswith(_MANIM_DIR):
+            files.add(os.path.abspath(path))
+    return files
+
+
+def caller_name(scene):
+    # 씬 파일 안에서 play 를 부른 가장 안쪽 함수 (헬퍼 이름, 없으면 construct)
+    files = _scene_files(scene)
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if os.path.abspath(code.co_filename) in files:
+            return "{} ({}:{})".format(code.co_name, os.path.basename(code.co_filename), frame.f_lineno)
+        frame = frame.f_back
+    return "?"
+
+
+class PlayProfiler:
+    def __init__(self):
+        self.rows = []
+        self._current = None
+        self._mark = time.perf_counter()  # 직전 play 가 끝난 시각
+        self._queued = deque()  # 인코딩 큐에 넣은 순서대로 그때의 play 행
+
+    def on_play_begin(self, scene, index):
+        now = time.perf_counter()
+        row = {"index": index, "caller": caller_name(scene), "anims": "", "frames": 0, "start": now}
+        row.update({phase: 0.0 for phase in PHASES})
+        row["build"] = now - self._mark
+        self.rows.append(row)
+        self._current = row
+
+    def record(self, phase, t0, t1):
+        row = self._current
+        if row is not None:
+            row[phase] += t1 - t0
+
+    def queued(self):
+        # 본 스레드: 인코딩 큐에 프레임을 넣을 때마다 (play 밖이면 직전 play)
+        row = self._current if self._current is not None else (self.rows[-1] if self.rows else None)
+        self._queued.append(row)
+
+    def encoded(self, seconds):
+        # 파일 쓰기 스레드/인코더 응답 스레드: 큐 순서대로 인코딩이 끝남
+        try:
+            row = self._queued.popleft()
+        except IndexError:
+            return
+        if row is not None:
+            row["encode"] += seconds
+
+    def add_frames(self, count):
+        if self._current is not None:
+            self._current["frames"] += count
+
+    def on_play_end(self, scene):
+        row = self._current
+        if row is None:
+            return
+        now = time.perf_counter()
+        names = [type(a).__name__ for a in scene.animations or []]
+        row["anims"] = ", ".join(names[:3]) + (" +{}".format(len(names) - 3) if len(names) > 3 else "")
+        row["total"] = row["build"] + now - row["start"]
+        self._current = None
+        self._mark = now
+
+    # ===== 출력 =====
+    def by_caller(self):
+        groups = defaultdict(lambda: {"plays": 0, "frames": 0, "total": 0.0, **{p: 0.0 for p in PHASES}})
+        for row in self.rows:
+            name = row["caller"].split(" (")[0]
+            g = groups[name]
+            g["plays"] += 1
+            g["frames"] += row["frames"]
+            g["total"] += row.get("total", 0.0)
+            for phase in PHASES:
+                g[phase] += row[phase]
+        return sorted(groups.items(), key=lambda kv: -kv[1]["total"])
+
+    def format_report(self, title=""):
+        cols = PHASES + ("other", "total")
+        for row in self.rows:
+            if "total" in row:
+                row["other"] = max(row["total"] - sum(row[p] for p in PHASES), 0.0)
+        head = "{:>4}  {:<34} {:<26} {:>6} ".format("#", "호출 위치", "애니메이션", "프레임")
+        head += " ".join("{:>7}".format(c) for c in cols)
+        lines = ["[프로파일] " + title, head, "-" * len(head)]
+        for row in self.rows:
+            if "total" not in row:
+                continue
+            line = "{:>4}  {:<34} {:<26} {:>6} ".format(
+                row["index"], row["caller"][:34], row["anims"][:26], row["frames"])
+            lines.append(line + " ".join("{:>7.3f}".format(row[c]) for c in cols))
+        done = [r for r in self.rows if "total" in r]
+        totals = {c: sum(r[c] for r in done) for c in cols}
+        lines.append("-" * len(head))
+        lines.append("{:>4}  {:<34} {:<26} {:>6} ".format(
+            "", "합계", "", sum(r["frames"] for r in done)) + " ".join("{:>7.3f}".format(totals[c]) for c in cols))
+
+        lines.append("")
+        lines.append("{:<24} {:>5} {:>6} ".format("헬퍼별", "play", "프레임") + " ".join(
+            "{:>7}".format(c) for c in PHASES + ("total",)))
+        for name, g in self.by_caller():
+            lines.append("{:<24} {:>5} {:>6} ".format(name[:24], g["plays"], g["frames"]) + " ".join(
+                "{:>7.3f}".format(g[c]) for c in PHASES + ("total",)))
+        return "\n".join(lines)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 씬 렌더 실행기
+# 사용 예:
+#   python render.py onb_5.py OnboardingFlow -q h        # 일반 렌더 (manim -qh 와 동일한 출력 위치)
+#   python render.py h_2.py -q h --no-elide              # 중복 프레임 생략 없이 원래 렌더러로
+#   python render.py onb_5.py -q h --no-cache            # 세그먼트 캐시(segment_cache.py) 없이
+#   python render.py h_5.py -q h --composite-fades       # FadeIn/FadeOut 을 레이어 합성으로 (fast_renderer.py)
+#   python render.py onb_6.py -q h --affine-sprites      # Wiggle/shift 를 스프라이트 변형으로 (fast_renderer.py)
+#   python render.py h_2.py -q h --profile               # play 별 단계 시간 표 출력 (profiler.py)
+#   python render.py onb_4.py -q h --batch-plays         # 짧은 play 를 이어서 한 partial 로 인코딩
+#   python render.py h_2.py -q h --stream                # 씬 전체를 인코더 하나로 (stream_writer.py)
+#   python render.py onb_5.py -q h --shm-encoder         # 공유 메모리 링 + 인코더 프로세스 (shm_ring.py)
+#   python render.py onb_5.py -q h --outputs 720,270     # 한 번 렌더해 720p/270p 도 함께 저장 (multi_output.py)
+#   python render.py onb_6.py -q h --parallel --trace t.json  # Chrome/Perfetto 트레이스 저장 (render_trace.py)
+#   python render.py onb_6.py -q h --parallel            # 섹션별로 프로세스를 나눠 렌더 (코어 수만큼)
+#   python render.py h_1.py -q h --from-section "Start Here"  # 마지막(CTA) 섹션부터만 렌더 (checkpoint.py)
+#   python render.py h_1.py -q h --from-time 42.0        # 42초가 들어 있는 play 부터만 렌더
+#   python render.py h_1.py --contact-sheet out/sheets   # 섹션 끝 화면만 그려 PNG 한 장으로 (contact_sheet.py)
+#   python render.py onb_5.py --svg out/svg              # 애니메이션 SVG 로 내보내기 (vector_export.py)
+#   python render.py onb_5.py --dry-run                  # 파일 안 모든 씬 드라이런(배치/타이밍 검사만)
+#   python render.py onb_2.py --dry-run --json out.json  # 드라이런 결과를 JSON 으로 저장
+#
+# 드라이런에서 영역 초과가 하나라도 있으면 종료 코드 1 (변형 데이터 일괄 검사용)
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from manim import *
+
+import render_trace
+from checkpoint import retarget, seek
+from contact_sheet import export_contact_sheet
+from dry_run import dry_run, format_report
+from fast_renderer import FastRenderer
+from multi_output import MultiOutputRenderer, parse_outputs
+from render_common import apply_quality, load_scene_classes
+from sections import render_sections_parallel
+from segment_cache import CachingRenderer
+from shm_ring import SharedRingRenderer
+from stream_writer import StreamRenderer
+from vector_export import export_svg
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manim 씬 렌더/드라이런")
+    parser.add_argument("file", help="씬 파일 (.py)")
+    parser.add_argument("scenes", nargs="*", help="씬 클래스 이름 (생략 시 전부)")
+    parser.add_argument("-q", "--quality", default="l", help="l/m/h/p/k (기본 l)")
+    parser.add_argument("--no-elide", action="store_true", help="정지 구간 중복 프레임 생략 끄기")
+    parser.add_argument("--no-cache", action="store_true", help="세그먼트 캐시 끄기 (모든 play 를 다시 렌더)")
+    parser.add_argument("--composite-fades", action="store_true", help="단순 FadeIn/FadeOut 을 레이어 합성으로 렌더")
+    parser.add_argument("--affine-sprites", action="store_true", help="아핀 이동만 있는 play 를 스프라이트 변형으로 렌더")
+    parser.add_argument("--profile", action="store_true", help="play 별 호출 위치와 단계별 시간 표 출력")
+    parser.add_argument("--batch-plays", action="store_true", help="이어지는 짧은 play 를 한 세그먼트로 인코딩")
+    parser.add_argument("--stream", action="store_true", help="partial 영상 없이 씬 전체를 인코더 하나로 인코딩")
+    parser.add_argument("--shm-encoder", action="store_true", help="공유 메모리 링 버퍼로 인코더 프로세스에 프레임 전달")
+    parser.add_argument("--outputs", help="함께 저장할 출력 높이[:코덱], 쉼표로 구분 (예: 720,270 / 1080:libvpx-vp9,480:libx264)")
+    parser.add_argument("--from-section", metavar="NAME", help="이 섹션 첫 play 부터만 렌더")
+    parser.add_argument("--from-time", type=float, metavar="SECONDS", help="이 시각이 들어 있는 play 부터만 렌더")
+    parser.add_argument("--trace", help="Chrome 트레이스(JSON) 저장 경로")
+    parser.add_argument("--parallel", type=int, nargs="?", const=0, metavar="N",
+                        help="섹션 병렬 렌더 (N 생략 시 코어 수)")
+    parser.add_argument("--svg", metavar="DIR", help="영상 대신 씬별 애니메이션 SVG 저장")
+    parser.add_argument("--contact-sheet", metavar="DIR", help="영상 대신 섹션 끝 화면을 모은 씬별 PNG 저장")
+    parser.add_argument("--sheet-plays", action="store_true", help="--contact-sheet 에서 play 끝마다 한 칸")
+    parser.add_argument("--dry-run", action="store_true", help="래스터/인코딩 없이 배치와 타이밍만 검사")
+    parser.add_argument("--json", help="드라이런 결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    # 렌더러는 하나만 고를 수 있으므로 함께 줄 수 없는 플래그는 조용히 버리지 않고 거부
+    if args.stream and args.parallel is not None:
+        parser.error("--stream 은 --parallel 과 함께 쓸 수 없음")
+    if args.stream and args.shm_encoder:
+        parser.error("--stream 은 --shm-encoder 와 함께 쓸 수 없음")
+    if args.parallel is not None and (args.shm_encoder or args.no_elide or args.no_cache):
+        parser.error("--parallel 은 --shm-encoder/--no-elide/--no-cache 와 함께 쓸 수 없음")
+    if args.no_cache and (args.shm_encoder or args.outputs):
+        parser.error("--shm-encoder/--outputs 는 항상 세그먼트 캐시를 씀 (--no-cache 와 함께 쓸 수 없음)")
+    if args.no_elide and (args.composite_fades or args.affine_sprites or args.batch_plays
+                          or args.stream or args.shm_encoder or args.profile):
+        parser.error("--no-elide 는 원래 렌더러 -> --composite-fades/--affine-sprites/--batch-plays/"
+                     "--stream/--shm-encoder/--profile 과 함께 쓸 수 없음")
+    seeking = args.from_section is not None or args.from_time is not None
+    if args.from_section is not None and args.from_time is not None:
+        parser.error("--from-section 과 --from-time 은 하나만")
+    if seeking and (args.parallel is not None or args.svg or args.contact_sheet or args.dry_run):
+        parser.error("--from-section/--from-time 은 --parallel/--svg/--contact-sheet/--dry-run 과 함께 쓸 수 없음")
+
+    apply_quality(args.quality)
+    try:
+        outputs = parse_outputs(args.outputs) if args.outputs else ()
+    except ValueError as e:
+        parser.error("--outputs: {}".format(e))
+    if outputs and (args.parallel is not None or args.stream or args.shm_encoder or args.no_elide):
+        parser.error("--outputs 는 --parallel/--stream/--shm-encoder/--no-elide 와 함께 쓸 수 없음")
+    options = {"composite_fades": args.composite_fades, "affine_sprites": args.affine_sprites,
+               "profile": args.profile, "batch_plays": args.batch_plays}
+    classes = load_scene_classes(args.file, args.scenes)
+    # 씬 파일 상단의 config.pixel_height 지정까지 적용된 원본 높이로 검사 (품질 프리셋 높이가 아님)
+    if any(h <= 0 or h > config.pixel_height for h, _ in outputs):
+        parser.error("--outputs 높이는 원본 높이({}) 이하".format(config.pixel_height))
+
+    if args.svg:
+        for cls in classes:
+            export_svg(cls, Path(args.svg) / "{}.svg".format(cls.__name__))
+        return 0
+
+    if args.contact_sheet:
+        for cls in classes:
+            export_contact_sheet(cls, Path(args.contact_sheet) / "{}.png".format(cls.__name__),
+                                 every_play=args.sheet_plays)
+        return 0
+
+    if not args.dry_run:
+        if args.trace:
+            render_trace.start(args.trace)
+            render_trace.name_process("render.py " + Path(args.file).name)
+        for cls in classes:
+            if args.parallel is not None:
+                render_sections_parallel(args.file, cls.__name__, args.parallel, **options)
+                continue
+            if args.no_elide:
+                renderer = None
+            elif args.stream:
+                renderer = StreamRenderer(**options)
+            elif args.shm_encoder:
+                renderer = SharedRingRenderer(**options)
+            elif outputs:
+                renderer = MultiOutputRenderer(outputs=outputs, **options)
+            elif args.no_cache:
+                renderer = FastRenderer(**options)
+            else:
+                renderer = CachingRenderer(**options)
+            if not seeking:
+                cls(renderer=renderer).render()
+                continue
+            entry = seek(args.file, cls.__name__, section=args.from_section, time=args.from_time)
+            scene = cls(renderer=renderer)
+            retarget(scene, entry)
+            try:
+                scene.render()
+            finally:
+                config.from_animation_number = 0
+        if args.trace:
+            render_trace.merge(args.trace)
+        return 0
+
+    reports = [dry_run(cls) for cls in classes]
+    for report in reports:
+        print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fp:
+            json.dump(reports, fp, ensure_ascii=False, indent=2)
+    return 1 if any(r["overflows"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 씬 파일 로딩/품질 설정 공용 함수 (render.py, dry_run.py 등에서 사용)
+# 사용 예:
+#   from render_common import apply_quality, load_scene_classes
+#   apply_quality("h")
+#   for cls in load_scene_classes("onb_5.py", ["OnboardingFlow"]):
+#       cls().render()
+#
+# manim CLI 와 같은 순서를 따른다: 품질 플래그를 먼저 적용하고 씬 파일을 import 하므로
+# 씬 파일 상단의 config.pixel_width/height 지정이 그대로 우선한다.
+
+import hashlib
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from manim import *
+
+_modules = {}
+
+
+# ===== 품질 =====
+def apply_quality(flag):
+    # "l"/"m"/"h"/"p"/"k" 또는 "high_quality" 같은 이름 모두 허용
+    for name, q in QUALITIES.items():
+        if flag in (name, q["flag"]):
+            config.quality = name
+            return name
+    raise ValueError("알 수 없는 품질: {}".format(flag))
+
+
+# ===== 씬 파일 로딩 =====
+def load_module(path, reload=False):
+    # 경로마다 고유한 모듈 이름으로 한 번만 import (같은 이름의 파일이 여러 폴더에 있어도 안전)
+    # reload=True 면 파일을 다시 실행 (상단 config 지정 재적용, 수정된 내용 반영)
+    path = Path(path).resolve()
+    config.input_file = path  # 출력 경로(media/videos/<파일명>/...) 기준
+    if path in _modules and not reload:
+        return _modules[path]
+    folder = str(path.parent)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)  # text_cache 등 옆 모듈 import 용
+    digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:10]
+    name = "scene_{}_{}".format(path.stem, digest)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    _modules[path] = module
+    return module
+
+
+def scene_classes(module):
+    return [
+        obj for _, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, Scene) and obj is not Scene and obj.__module__ == module.__name__
+    ]
+
+
+def load_scene_classes(path, names=None, reload=False):
+    # names 가 비어 있으면 파일 안의 모든 씬
+    module = load_module(path, reload=reload)
+    found = {cls.__name__: cls for cls in scene_classes(module)}
+    if not names:
+        return list(found.values())
+    missing = [n for n in names if n not in found]
+    if missing:
+        raise ValueError("{} 에 없는 씬: {}".format(path, ", ".join(missing)))
+    return [found[n] for n in names]
+
+
+def load_scene_class(path, name, reload=False):
+    return load_scene_classes(path, [name], reload=reload)[0]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x (Linux/macOS 전용: Unix 소켓 + fork)
+# 상주 렌더 서버: manim/폰트/Pango 를 미리 올려 둔 부모에서 작업마다 fork
+# 사용 예:
+#   python render_daemon.py serve --preload onb_5.py onb_6.py      # 서버 시작
+#   python render_daemon.py submit onb_5.py OnboardingFlow -q l     # 렌더 요청
+#   python render_daemon.py submit onb_6.py OnboardingFlow --dry-run
+#
+# - 부모는 시작 시 manim/PyAV/PIL import, 지정한 씬 파일 드라이런(폰트 탐색, Pango 초기화,
+#   Text 캐시 채우기)까지 마친 뒤 대기한다. 자식은 이 상태를 copy-on-write 로 그대로 쓴다.
+# - 자식은 시작 시 config 를 부모의 초기값으로 되돌리고 씬 파일을 다시 실행하므로
+#   작업끼리 설정이 섞이지 않고, 수정한 씬 파일도 바로 반영된다.
+# - 프로토콜: 요청/응답 모두 JSON 한 줄
+#   요청 {"file": "...", "scene": "...", "quality": "l", "output": null, "dry_run": false}
+#   응답 {"ok": true, "movie": "...", "wall": 3.2} 또는 {"ok": false, "error": "..."}
+# - 소켓은 권한 0600 으로 만든다(씬 파일을 실행하므로 본인 계정 전용).
+#
+# 환경변수
+#   RENDER_DAEMON_SOCKET : 소켓 경로 (기본 /tmp/manim-render-<uid>.sock)
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from manim import *
+
+from dry_run import dry_run
+from render_common import apply_quality, load_scene_class, load_scene_classes
+from segment_cache import CachingRenderer
+
+DEFAULT_SOCKET = os.environ.get(
+    "RENDER_DAEMON_SOCKET", "/tmp/manim-render-{}.sock".format(os.getuid())
+)
+
+_base_config = None  # 서버 시작 시점 config (자식마다 이 값으로 복원)
+
+
+# ===== 작업 실행 (자식 프로세스) =====
+def run_job(job):
+    t0 = time.perf_counter()
+    config.update(_base_config)
+    apply_quality(job.get("quality", "l"))
+    cls = load_scene_class(job["file"], job["scene"], reload=True)
+    if job.get("dry_run"):
+        return {"ok": True, "report": dry_run(cls), "wall": round(time.perf_counter() - t0, 2)}
+    if job.get("output"):
+        config.output_file = job["output"]
+    scene = cls(renderer=CachingRenderer())
+    scene.render()
+    return {
+        "ok": True,
+        "movie": str(scene.renderer.file_writer.movie_file_path),
+        "wall": round(time.perf_counter() - t0, 2),
+    }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            result = run_job(json.loads(self.rfile.readline()))
+        except Exception:
+            result = {"ok": False, "error": traceback.format_exc(limit=5)}
+        self.wfile.write((json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+class RenderServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    max_children = os.cpu_count() or 1  # 넘으면 앞선 작업이 끝날 때까지 대기
+
+
+# ===== 서버 =====
+def warm_up(paths):
+    # 씬 파일마다 드라이런 한 번: 폰트/Pango 초기화 + Text 캐시 채우기
+    for path in paths:
+        try:
+            for cls in load_scene_classes(path):
+                t0 = time.perf_counter()
+                dry_run(cls)
+                logger.info("예열: %s %s (%.1fs)", Path(path).name, cls.__name__, time.perf_counter() - t0)
+        except Exception:
+            logger.warning("예열 실패: %s\n%s", path, traceback.format_exc(limit=3))
+    config.update(_base_config)
+
+
+def serve(sock_path, preload):
+    global _base_config
+    _base_config = config.copy()
+    warm_up(preload)
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)
+    old_umask = os.umask(0o177)
+    try:
+        server = RenderServer(sock_path, _Handler)
+    finally:
+        os.umask(old_umask)
+    logger.info("렌더 서버 대기 중: %s", sock_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(sock_path)
+
+
+# ===== 클라이언트 =====
+def submit(sock_path, job):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(sock_path)
+        s.sendall((json.dumps(job, ensure_ascii=False) + "\n").encode("utf-8"))
+        with s.makefile("r", encoding="utf-8") as fp:
+            return json.loads(fp.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상주 렌더 서버")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix 소켓 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_serve = sub.add_parser("serve", help="서버 시작")
+    p_serve.add_argument("--preload", nargs="*", default=[], help="미리 드라이런할 씬 파일")
+    p_submit = sub.add_parser("submit", help="렌더 요청")
+    p_submit.add_argument("file")
+    p_submit.add_argument("scene")
+    p_submit.add_argument("-q", "--quality", default="l")
+    p_submit.add_argument("-o", "--output", help="출력 파일 이름")
+    p_submit.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.preload)
+        return 0
+    result = submit(args.socket, {
+        "file": str(Path(args.file).resolve()),
+        "scene": args.scene,
+        "quality": args.quality,
+        "output": args.output,
+        "dry_run": args.dry_run,
+    })
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0 if result.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 렌더 트레이스: Chrome trace event(JSON) 로 씬/play/프레임 단계/이어 붙이기 구간을 기록
+# 사용 예:
+#   python render.py onb_6.py -q h --parallel --trace out/onb6.trace.json
+#   python batch_render.py render_manifest.json --trace out/batch.trace.json
+#   -> chrome://tracing 또는 https://ui.perfetto.dev 에서 파일 열기
+#
+# - 프로세스마다 <트레이스>.parts/<pid>.jsonl 에 이벤트를 한 줄씩 덧붙이고, 끝나면 merge() 가 하나로 합친다.
+#   섹션 병렬/일괄 렌더의 워커는 환경변수로 켜짐 상태를 물려받아 각자 자기 트랙(pid)에 기록한다.
+# - 시각은 벽시계 기준 마이크로초라 프로세스끼리 같은 축에 놓인다. 스레드(tid)도 구분
+#   (인코딩은 파일 쓰기 스레드 트랙에 나옴).
+# - 켜져 있지 않으면 모든 호출이 바로 반환된다.
+#
+# 환경변수
+#   RENDER_TRACE_DIR : 이벤트 조각을 쓸 폴더 (enable() 이 설정)
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+_ENV = "RENDER_TRACE_DIR"
+_tracer = None
+
+
+class Tracer:
+    def __init__(self, directory):
+        self.pid = os.getpid()
+        self.path = Path(directory) / "{}.jsonl".format(self.pid)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.events = []
+        self._lock = threading.Lock()
+        self._offset = time.time() - time.perf_counter()  # perf_counter -> 벽시계
+        self._threads = set()
+
+    def _us(self, t):
+        return int((t + self._offset) * 1e6)
+
+    def _add(self, event):
+        tid = threading.get_ident()
+        event["pid"] = self.pid
+        event["tid"] = tid
+        with self._lock:
+            if tid not in self._threads:
+                self._threads.add(tid)
+                self.events.append({"ph": "M", "name": "thread_name", "pid": self.pid, "tid": tid,
+                                    "args": {"name": threading.current_thread().name}})
+            self.events.append(event)
+
+    def complete(self, name, t0, t1, cat="render", args=None):
+        # perf_counter 기준 t0~t1 구간
+        event = {"ph": "X", "name": name, "cat": cat, "ts": self._us(t0), "dur": max(self._us(t1) - self._us(t0), 0)}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def name_process(self, name):
+        self._add({"ph": "M", "name": "process_name", "args": {"name": name}})
+
+    def flush(self):
+        with self._lock:
+            events, self.events = self.events, []
+        if events:
+            with open(self.path, "a", encoding="utf-8") as fp:
+                for event in events:
+                    fp.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+
+# ===== 전역 =====
+def enable(directory):
+    # 이 프로세스와 이후 만드는 자식 프로세스 모두 기록
+    global _tracer
+    os.environ[_ENV] = str(Path(directory).resolve())
+    _tracer = None
+
+
+def get_tracer():
+    # 꺼져 있으면 None. fork 로 물려받은 부모 버퍼는 버리고 새로 만든다
+    global _tracer
+    directory = os.environ.get(_ENV)
+    if not directory:
+        return None
+    if _tracer is None or _tracer.pid != os.getpid():
+        _tracer = Tracer(directory)
+    return _tracer
+
+
+def name_process(name):
+    tracer = get_tracer()
+    if tracer is not None:
+        tracer.name_process(name)
+
+
+@contextmanager
+def span(name, cat="render", flush=False, **args):
+    tracer = get_tracer()
+    if tracer is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.complete(name, t0, time.perf_counter(), cat, args)
+        if flush:
+            tracer.flush()
+
+
+def flush():
+    tracer = get_tracer()
+    if tracer is not None:
+        tracer.flush()
+
+
+# ===== 합치기 =====
+def parts_dir(output):
+    return Path(str(output) + ".parts")
+
+
+def start(output):
+    # output 에 합칠 트레이스 기록 시작 (이전 조각은 지움)
+    directory = parts_dir(output)
+    if directory.exists():
+        for part in directory.glob("*.jsonl"):
+            part.unlink()
+    enable(directory)
+
+
+def merge(output, keep_parts=False):
+    # 모든 조각을 output 하나로 합치고 기록을 끈다
+    global _tracer
+    flush()
+    os.environ.pop(_ENV, None)
+    _tracer = None
+    directory = parts_dir(output)
+    events = []
+    for part in sorted(directory.glob("*.jsonl")):
+        with open(part, encoding="utf-8") as fp:
+            events.extend(json.loads(line) for line in fp if line.strip())
+        if not keep_parts:
+            part.unlink()
+    if not keep_parts:
+        try:
+            directory.rmdir()
+        except OSError:
+            pass
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as fp:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp, ensure_ascii=False)
+    return output
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 섹션 병렬 렌더: next_section 단위로 프로세스를 나눠 렌더한 뒤 무손실로 이어 붙임
+# 사용 예:
+#   python render.py onb_6.py OnboardingFlow -q h --parallel 5
+#
+# 1) 드라이런으로 섹션별 play 번호 범위를 구한다 (dry_run.py)
+# 2) 섹션마다 워커 프로세스가 construct() 를 처음부터 다시 실행하되,
+#    자기 섹션 이전 play 는 건너뛰고(래스터 없음) 섹션이 끝나면 바로 멈춘다
+#    (config.from_animation_number / upto_animation_number 와 동일한 방식)
+# 3) 각 워커가 만든 partial 영상을 순서대로 스트림 복사(concat)해 최종 영상 생성
+#
+# Scene 객체(렌더러/파일 쓰기 스레드 포함)는 프로세스 사이로 옮길 수 없으므로
+# "섹션 시작 시점 상태"는 결정적인 construct() 재실행으로 만든다.
+# 재실행 비용은 드라이런 수준이며, Text 는 text_cache/text_store 에서 재사용된다.
+# partial 영상은 세그먼트 캐시(segment_cache.py)에 쓰므로 다시 돌리면 바뀐 play 만 렌더된다.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import av
+import manim
+from manim import *
+
+import render_trace
+from dry_run import dry_run
+from render_common import load_scene_class
+from segment_cache import CachingFileWriter, CachingRenderer
+
+
+# ===== 워커 =====
+class SectionFileWriter(CachingFileWriter):
+    def finish(self):
+        pass  # 합치기는 부모 프로세스에서
+
+
+class SectionRenderer(CachingRenderer):
+    def __init__(self, **kwargs):
+        super().__init__(file_writer_class=SectionFileWriter, **kwargs)
+
+
+# 부모에서 씬 파일까지 적용된 최종 값 (fork 면 모듈 재실행이 없으므로 직접 맞춰 줌)
+_SHARED_CONFIG = ("media_dir", "pixel_width", "pixel_height", "frame_rate", "frame_width", "frame_height")
+
+
+def _render_section(path, scene_name, settings, first_play, last_play, options):
+    render_trace.name_process("{} {} play {}..{}".format(Path(path).name, scene_name, first_play, last_play))
+    cls = load_scene_class(path, scene_name)
+    for key, value in settings.items():
+        config[key] = value
+    config.from_animation_number = first_play
+    config.upto_animation_number = last_play
+    t0 = time.perf_counter()
+    scene = cls(renderer=SectionRenderer(**options))
+    scene.render()
+    writer = scene.renderer.file_writer
+    return {
+        "files": [str(p) for p in writer.partial_movie_files if p is not None],
+        "movie": str(writer.movie_file_path),
+        "wall": time.perf_counter() - t0,
+    }
+
+
+# ===== 이어 붙이기 =====
+def concat_movies(files, output):
+    # 재인코딩 없이 패킷만 복사 (SceneFileWriter.combine_files 와 같은 방식)
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    file_list = output.with_suffix(".concat.txt")
+    with open(file_list, "w", encoding="utf-8") as fp:
+        for f in files:
+            fp.write("file 'file:{}'\n".format(Path(f).as_posix()))
+    src = av.open(str(file_list), options={"safe": "0", "an": "1"}, format="concat")
+    try:
+        in_stream = src.streams.video[0]
+        with av.open(str(output), mode="w") as dst:
+            dst.metadata["comment"] = "Rendered with Manim Community v{}".format(manim.__version__)
+            out_stream = dst.add_stream(template=in_stream)
+            for packet in src.demux(in_stream):
+                if packet.dts is None:
+                    continue
+                packet.dts = None
+                packet.stream = out_stream
+                dst.mux(packet)
+    finally:
+        src.close()
+        file_list.unlink()
+    return output
+
+
+# ===== 실행 =====
+def section_ranges(sections):
+    # 드라이런 섹션 -> 워커별 (섹션 번호, 첫 play, 마지막 play)
+    # play 가 없는 섹션은 워커를 띄우지 않음 (last = first - 1 이 -1 이면 "끝까지"로 읽혀 전체를 다시 렌더함)
+    # 마지막 범위는 -1(끝까지)로 두어 실제 렌더의 play 수가 드라이런과 달라도 빠지는 play 가 없게 함
+    ranges = [
+        (i, sec["first_play"], sec["first_play"] + sec["plays"] - 1)
+        for i, sec in enumerate(sections) if sec["plays"]
+    ]
+    if not ranges:
+        return [(0, 0, -1)]
+    i, first, _ = ranges[-1]
+    ranges[-1] = (i, first, -1)
+    return ranges
+
+
+def render_sections_parallel(path, scene_name, workers=None, **options):
+    # 품질은 씬 파일 import 전에 apply_quality 로 정해 둘 것 (render.py 참고)
+    # options 는 워커 렌더러(FastRenderer) 옵션: composite_fades, affine_sprites, profile, batch_plays
+    cls = load_scene_class(path, scene_name)
+    settings = {key: config[key] for key in _SHARED_CONFIG}
+    sections = dry_run(cls)["sections"]
+    jobs = [(i, sections[i], first, last) for i, first, last in section_ranges(sections)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    logger.info("%s: 섹션 %d개를 프로세스 %d개로 렌더", scene_name, len(jobs), workers)
+
+    t0 = time.perf_counter()
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # 긴 섹션부터 넣어야 마지막에 긴 작업 하나만 남는 일이 줄어든다
+        order = sorted(range(len(jobs)), key=lambda n: -jobs[n][1]["duration"])
+        futures = {
+            n: pool.submit(_render_section, str(path), scene_name, settings, jobs[n][2], jobs[n][3], options)
+            for n in order
+        }
+        for n, future in futures.items():
+            results[n] = future.result()
+
+    files = [f for r in results for f in r["files"]]
+    with render_trace.span("concat", "io", flush=True, files=len(files)):
+        output = concat_movies(files, results[0]["movie"])
+    for (i, sec, _, _), r in zip(jobs, results):
+        logger.info("  [%s] %.2fs 분량 -> %.1fs", sec["name"], sec["duration"], r["wall"])
+    logger.info("%s 완료 (%.1fs): %s", scene_name, time.perf_counter() - t0, output)
+    return output
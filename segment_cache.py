@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 내용 기반 partial 영상(세그먼트) 캐시 (여러 씬/프로세스가 공유, 용량 상한 + LRU)
+# 사용 예:
+#   from segment_cache import CachingRenderer
+#   OnboardingFlow(renderer=CachingRenderer()).render()
+#   (render.py / batch_render.py / render_daemon.py / onb_template.py 기본값, render.py --no-cache 로 끔)
+#
+# - 키  : play()/wait() 마다
+#         애니메이션 종류와 인자(run_time, rate_func, shift 등) + 대상/목표 도형 상태 해시
+#         + 화면의 모든 도형 상태 해시(문자열·색·폰트 결과가 모두 포인트/색 배열에 반영됨)
+#         + 해상도/프레임레이트/배경색 + 렌더러 옵션(render_variant, 예: 페이드 합성)
+#         Manim 기본 해시(JSON 직렬화)보다 싸고, 씬 파일/클래스 이름과 무관하다.
+#         HR_DATA["cta"] 만 바꾸면 CTA 이후 play 만 키가 바뀌어 다시 렌더된다.
+# - 값  : partial 영상 파일. 최종 영상은 평소처럼 partial 들을 스트림 복사로 이어 붙여 만든다.
+# - updater 가 붙은 도형이 있거나 인자를 해시할 수 없으면 그 play 는 캐시하지 않는다.
+# - 용량 정리(LRU)는 최근 SEGMENT_CACHE_GRACE_MIN 분 안에 쓰였거나 적중한 파일은 지우지 않는다.
+#   같은 폴더를 쓰는 다른 프로세스(onb_template -j, batch_render 워커, --parallel 섹션)가 아직
+#   이어 붙이지 않은 partial 을 서로 지우지 않게 하기 위함 (이 씬의 파일은 keep 으로 따로 보호).
+#
+# 환경변수
+#   SEGMENT_CACHE_DIR    : 저장 위치 (기본: <media_dir>/segment_cache)
+#   SEGMENT_CACHE_MAX_MB : 용량 상한 (기본 4096)
+#   SEGMENT_CACHE_GRACE_MIN : 이 시간(분) 안에 사용한 파일은 정리하지 않음 (기본 120)
+
+import hashlib
+import os
+import time
+import types
+from pathlib import Path
+
+import manim
+import numpy as np
+from manim import *
+from manim.utils.file_ops import write_to_movie
+
+from fast_renderer import ElidingFileWriter, FastRenderer, mobject_state_digest
+
+# ===== 설정 =====
+SEGMENT_CACHE_MAX_BYTES = int(os.environ.get("SEGMENT_CACHE_MAX_MB", "4096")) * 1024 * 1024
+SEGMENT_CACHE_GRACE = float(os.environ.get("SEGMENT_CACHE_GRACE_MIN", "120")) * 60
+
+_PREFIX = "seg_"
+_KEY_VERSION = 1
+_approx_bytes = None
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def cache_dir():
+    custom = os.environ.get("SEGMENT_CACHE_DIR")
+    path = Path(custom) if custom else Path(config.media_dir) / "segment_cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _entry_path(key):
+    return cache_dir() / key[len(_PREFIX):len(_PREFIX) + 2] / (key + config.movie_file_extension)
+
+
+# ===== 키 계산 =====
+def _function_key(fn):
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return getattr(fn, "__qualname__", type(fn).__name__)
+    # lambda 끼리 이름이 같아도 구분되도록 바이트코드/상수/기본값/클로저 값까지 포함
+    cells = tuple(_value_key(c.cell_contents) for c in (fn.__closure__ or ()))
+    return (fn.__qualname__, code.co_code, repr(code.co_consts), _value_key(fn.__defaults__), cells)
+
+
+def _value_key(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Mobject):
+        digest = mobject_state_digest([value], images=True)
+        if digest is None:
+            raise _Uncacheable(type(value).__name__)
+        return digest
+    if isinstance(value, Animation):
+        return _animation_key(value)
+    if isinstance(value, np.ndarray):
+        if value.size > 64:
+            return hashlib.blake2b(np.ascontiguousarray(value).data, digest_size=16).digest()
+        return (value.shape, value.tolist())
+    if isinstance(value, (list, tuple)):
+        return tuple(_value_key(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _value_key(v)) for k, v in value.items()))
+    if isinstance(value, types.MethodType):
+        return (_function_key(value.__func__), type(value.__self__).__name__)
+    if callable(value) and hasattr(value, "__code__"):
+        return _function_key(value)
+    text = repr(value)
+    if " at 0x" in text:
+        raise _Uncacheable(type(value).__name__)
+    return text
+
+
+def _animation_key(anim):
+    return (type(anim).__name__,) + tuple(
+        (name, _value_key(value)) for name, value in sorted(vars(anim).items())
+    )
+
+
+def segment_key(scene, camera, variant=()):
+    # 캐시할 수 없으면 None
+    if scene.updaters or any(m.updaters for top in scene.mobjects for m in top.get_family()):
+        return None
+    try:
+        anims = tuple(_animation_key(a) for a in scene.animations)
+    except _Uncacheable:
+        return None
+    state = mobject_state_digest(list(scene.mobjects) + list(scene.foreground_mobjects), images=True)
+    if state is None:
+        return None
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr((
+        _KEY_VERSION, manim.__version__,
+        config.pixel_width, config.pixel_height, config.frame_rate,
+        config.frame_width, config.frame_height, config.movie_file_extension, config.transparent,
+        str(camera.background_color), camera.background_opacity, config.background_image, variant,
+        getattr(camera.background, "filename", None),  # hero_cache.py 배경 (파일 이름에 내용 키 포함)
+    )).encode("utf-8"))
+    h.update(repr(anims).encode("utf-8"))
+    h.update(state)
+    return _PREFIX + h.hexdigest()
+
+
+# ===== 파일 쓰기 =====
+class CachingFileWriter(ElidingFileWriter):
+    def _cache_enabled(self):
+        return hasattr(self, "partial_movie_directory") and write_to_movie()
+
+    def is_already_cached(self, hash_invocation):
+        if not (hash_invocation or "").startswith(_PREFIX) or not self._cache_enabled():
+            return super().is_already_cached(hash_invocation)
+        path = _entry_path(hash_invocation)
+        if not path.exists():
+            return False
+        try:
+            os.utime(path)  # LRU 판단용 사용 시각 갱신
+        except OSError:
+            pass
+        return True
+
+    def _partial_path(self, key):
+        # add_partial_movie_file 가 key 에 쓰는 경로
+        if key.startswith(_PREFIX) and self._cache_enabled():
+            return _entry_path(key)
+        return self.partial_movie_directory / "{}{}".format(key, config.movie_file_extension)
+
+    def add_partial_movie_file(self, hash_animation):
+        if not (hash_animation or "").startswith(_PREFIX) or not self._cache_enabled():
+            return super().add_partial_movie_file(hash_animation)
+        path = _entry_path(hash_animation)
+        path.parent.mkdir(exist_ok=True)
+        self.partial_movie_files.append(str(path))
+        self.sections[-1].partial_movie_files.append(str(path))
+
+    def close_partial_movie_stream(self):
+        global _approx_bytes
+        super().close_partial_movie_stream()
+        if not str(self._final_partial.name).startswith(_PREFIX):
+            return
+        if _approx_bytes is None:
+            _approx_bytes = _scan()[1]
+        else:
+            _approx_bytes += self._final_partial.stat().st_size
+        if _approx_bytes > SEGMENT_CACHE_MAX_BYTES:
+            _approx_bytes = evict(int(SEGMENT_CACHE_MAX_BYTES * 0.9), self._cache_keep())
+
+    def _cache_keep(self):
+        # 이 씬이 아직 이어 붙여야 하는 파일 (용량 정리에서 제외)
+        return {str(p) for p in self.partial_movie_files if p is not None}
+
+
+class CachingRenderer(FastRenderer):
+    def __init__(self, file_writer_class=CachingFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+
+    def segment_key(self, scene):
+        key = None if config["disable_caching"] else segment_key(scene, self.camera, self.render_variant())
+        return key or "uncached_{:05}".format(self.num_plays)
+
+
+# ===== 용량 관리 =====
+def _scan():
+    entries = []
+    total = 0
+    for sub in os.scandir(cache_dir()):
+        if not sub.is_dir():
+            continue
+        for f in os.scandir(sub.path):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            if f.name.count(".") == 1:
+                entries.append((st.st_mtime, st.st_size, f.path))
+                total += st.st_size
+            elif st.st_mtime < time.time() - 3600:
+                # 중간에 죽은 프로세스가 남긴 임시 파일 (<키>.<pid>.mp4)
+                try:
+                    os.unlink(f.path)
+                except OSError:
+                    pass
+    return entries, total
+
+
+def evict(target_bytes, keep=(), grace=None):
+    # 사용 시각이 오래된 순으로 target_bytes 이하가 될 때까지 삭제. 남은 크기 반환
+    # keep 과 최근 grace 초 안에 사용한 파일(다른 프로세스가 쓰는 중일 수 있음)은 제외
+    grace = SEGMENT_CACHE_GRACE if grace is None else grace
+    recent = time.time() - grace
+    entries, total = _scan()
+    for mtime, size, path in sorted(entries):
+        if total <= target_bytes or mtime >= recent:
+            break  # 오래된 순이므로 이후는 모두 최근 파일
+        if path in keep:
+            continue
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+    return total
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 공유 메모리 링 버퍼 + 인코더 프로세스: 카메라가 그린 공유 메모리 슬롯을 인코더 프로세스가 그 자리에서 읽음
+# 사용 예:
+#   python render.py onb_5.py -q h --shm-encoder
+#   from shm_ring import SharedRingRenderer
+#   OnboardingFlow(renderer=SharedRingRenderer()).render()
+#
+# - 프레임 버퍼 풀(frame_pool.py)의 버퍼를 multiprocessing.shared_memory 한 덩어리의 슬롯으로 잡는다.
+#   렌더러는 슬롯에 바로 그리고(fast_renderer.py _draw_frame), 인코더 프로세스에는 슬롯 번호만 보낸다
+#   (프레임 직렬화/파이프 복사 없음). 인코더는 슬롯에서 AVFrame 을 만들자마자 슬롯을 돌려준다.
+# - 같은 프레임이 이어지면(정지 구간 생략) "repeat" 만 보내고 인코더가 변환해 둔 YUV 평면을 다시 쓴다.
+# - 인코딩(RGBA->YUV 변환 + libx264)이 별도 프로세스라 렌더와 GIL 을 나눠 쓰지 않는다.
+# - 인코더 프로세스는 씬마다 하나 (spawn, partial 영상마다 열고 닫기만 함), 씬이 끝나면 종료.
+# - 슬롯 참조 수는 부모 프로세스의 풀이 관리 (인코더가 "done" 을 보내면 release).
+# - 코덱 선택은 SceneFileWriter.open_partial_movie_stream 과 동일 (mp4: libx264 yuv420p, webm/투명 포함).
+#   세그먼트 캐시(segment_cache.py)와 함께 동작.
+
+import multiprocessing
+import threading
+import time
+import traceback
+from fractions import Fraction
+from multiprocessing.shared_memory import SharedMemory
+
+import av
+import numpy as np
+from manim import *
+from manim.scene.scene_file_writer import to_av_frame_rate
+
+from frame_pool import FramePool
+from segment_cache import CachingFileWriter, CachingRenderer
+
+RING_SLOTS = 8
+
+
+def stream_settings():
+    codec, pix_fmt = "libx264", "yuv420p"
+    options = {"an": "1", "crf": "23"}
+    if config.movie_file_extension == ".webm":
+        codec = "libvpx-vp9"
+        options["-auto-alt-ref"] = "1"
+        if config.transparent:
+            pix_fmt = "yuva420p"
+    elif config.transparent:
+        codec, pix_fmt = "qtrle", "argb"
+    rate = to_av_frame_rate(config.frame_rate)
+    return {"codec": codec, "pix_fmt": pix_fmt, "options": options,
+            "width": config.pixel_width, "height": config.pixel_height,
+            "rate": (rate.numerator, rate.denominator)}
+
+
+# ===== 링 버퍼 =====
+class SharedFrameRing(FramePool):
+    def __init__(self, size=RING_SLOTS):
+        self.shm = None
+        self._slots = {}    # id(버퍼) -> 슬롯 번호
+        self._by_slot = []
+        super().__init__(size)
+
+    def _buffers(self, shape, dtype):
+        self._unlink()
+        frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        self.shm = SharedMemory(create=True, size=frame_bytes * self.size)
+        frames = np.ndarray((self.size,) + tuple(shape), np.dtype(dtype), buffer=self.shm.buf)
+        self._by_slot = [frames[i] for i in range(self.size)]
+        self._slots = {id(buf): i for i, buf in enumerate(self._by_slot)}
+        return list(self._by_slot)
+
+    def layout(self):
+        shape, dtype = self._layout
+        return self.shm.name, shape, dtype.str, self.size
+
+    def slot(self, buf):
+        return self._slots[id(buf)] if self.owns(buf) else None
+
+    def buffer(self, slot):
+        return self._by_slot[slot]
+
+    def close(self):
+        self._unlink()
+        self._layout = None
+
+    def _unlink(self):
+        # 이름은 바로 지우고, 아직 남은 배열 참조(카메라 Cairo 컨텍스트 등)가 있으면 메모리는 그때 해제
+        if self.shm is None:
+            return
+        shm, self.shm = self.shm, None
+        shm.unlink()
+        try:
+            shm.close()
+        except BufferError:
+            pass
+
+
+# ===== 인코더 프로세스 =====
+def _encode(container, stream, plane, fmt, num_frames):
+    for _ in range(num_frames):
+        for packet in stream.encode(av.VideoFrame.from_ndarray(plane, format=fmt)):
+            container.mux(packet)
+
+
+def _encoder_main(requests, replies):
+    import render_trace
+    render_trace.name_process("encoder")
+    tracer = render_trace.get_tracer()
+    shm = frames = None
+    container = stream = plane = None
+    fmt = "yuv420p"
+    try:
+        while True:
+            msg = requests.recv()
+            kind = msg[0]
+            if kind == "attach":
+                _, name, shape, dtype, size = msg
+                frames = None
+                if shm is not None:
+                    shm.close()
+                shm = SharedMemory(name=name)
+                frames = np.ndarray((size,) + tuple(shape), np.dtype(dtype), buffer=shm.buf)
+            elif kind == "open":
+                _, path, s = msg
+                container = av.open(path, mode="w")
+                stream = container.add_stream(s["codec"], rate=Fraction(*s["rate"]), options=s["options"])
+                stream.pix_fmt = s["pix_fmt"]
+                stream.width = s["width"]
+                stream.height = s["height"]
+                fmt = "yuv420p" if s["pix_fmt"] == "yuv420p" else "rgba"
+                plane = None
+            elif kind in ("frame", "repeat"):
+                t0 = time.perf_counter()
+                if kind == "frame":
+                    _, slot, num_frames = msg
+                    rgba = av.VideoFrame.from_ndarray(frames[slot], format="rgba")
+                    replies.send(("done", slot))
+                    plane = rgba.reformat(format="yuv420p").to_ndarray() if fmt == "yuv420p" else rgba.to_ndarray()
+                else:
+                    num_frames = msg[1]
+                _encode(container, stream, plane, fmt, num_frames)
+                t1 = time.perf_counter()
+                replies.send(("encoded", t1 - t0))
+                if tracer is not None:
+                    tracer.complete("encode", t0, t1, "frame", {"frames": num_frames})
+            elif kind == "close":
+                for packet in stream.encode():
+                    container.mux(packet)
+                container.close()
+                container = stream = plane = None
+                render_trace.flush()
+                replies.send(("closed",))
+            elif kind == "exit":
+                break
+    except Exception:
+        replies.send(("error", traceback.format_exc()))
+    finally:
+        frames = None
+        if shm is not None:
+            shm.close()
+
+
+class EncoderProcess:
+    def __init__(self, ring, on_encoded=None):
+        self.ring = ring
+        self.on_encoded = on_encoded
+        self.process = None
+        self.error = None
+        self._attached = None
+        self._closed = threading.Event()
+
+    def _start(self):
+        ctx = multiprocessing.get_context("spawn")
+        child_requests, self._requests = ctx.Pipe(duplex=False)
+        self._replies, child_replies = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(target=_encoder_main, args=(child_requests, child_replies), daemon=True)
+        self.process.start()
+        child_requests.close()
+        child_replies.close()
+        self._attached = None
+        self.error = None
+        threading.Thread(target=self._read_replies, args=(self._replies,), name="encoder-replies", daemon=True).start()
+
+    def _read_replies(self, conn):
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                break
+            kind = msg[0]
+            if kind == "done":
+                self.ring.release(self.ring.buffer(msg[1]))
+            elif kind == "encoded":
+                if self.on_encoded is not None:
+                    self.on_encoded(msg[1])
+            elif kind == "closed":
+                self._closed.set()
+            elif kind == "error":
+                self.error = msg[1]
+                break
+        if conn is not self._replies:
+            return  # 이전 프로세스 (stop 뒤 다시 시작한 경우)
+        if self.error is None:
+            self.error = "인코더 프로세스가 종료됨"
+        self._closed.set()
+
+    def open(self, path, settings):
+        if self.process is None or not self.process.is_alive():
+            self._start()
+        layout = self.ring.layout()
+        if self._attached != layout:
+            self._requests.send(("attach",) + layout)
+            self._attached = layout
+        self._closed.clear()
+        self._requests.send(("open", str(path), settings))
+
+    def check(self):
+        # 링 슬롯을 기다리는 중: 인코더가 죽었으면 슬롯이 돌아오지 않으므로 실패
+        if self.error is not None:
+            raise RuntimeError(self.error)
+        if self.process is None or not self.process.is_alive():
+            raise RuntimeError("인코더 프로세스가 종료되어 링 슬롯을 돌려받을 수 없음")
+
+    def frame(self, buf, num_frames):
+        self._requests.send(("frame", self.ring.slot(buf), num_frames))
+
+    def repeat(self, num_frames):
+        self._requests.send(("repeat", num_frames))
+
+    def close(self):
+        self._requests.send(("close",))
+        self._closed.wait()
+        if self.error is not None:
+            raise RuntimeError(self.error)
+
+    def stop(self):
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self._requests.send(("exit",))
+        self.process.join(10)
+        self._requests.close()
+        self.process = None
+
+
+# ===== 파일 쓰기 =====
+class SharedRingFileWriter(CachingFileWriter):
+    def _open_stream(self, file_path):
+        self.partial_movie_file_path = file_path
+        self.renderer.frame_pool.reserve((config.pixel_height, config.pixel_width, 4), np.uint8)
+        self._sent = None
+        self.renderer.encoder.open(file_path, stream_settings())
+
+    def _close_stream(self):
+        self.renderer.encoder.close()
+        logger.info("Animation %d : Partial movie file written in %s", self.renderer.num_plays,
+                    self.partial_movie_file_path)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if not write_to_movie():
+            return super().write_frame(frame_or_renderer, num_frames)
+        ring = self.renderer.frame_pool
+        encoder = self.renderer.encoder
+        if self.renderer.profiler is not None:
+            self.renderer.profiler.queued()  # 인코더는 frame/repeat 마다 "encoded" 를 하나씩 보냄
+        frame = frame_or_renderer
+        stamp = ring.stamp(frame)
+        if stamp is not None and stamp == self._sent:
+            encoder.repeat(num_frames)
+            return
+        if stamp is None:
+            # 링 밖의 배열은 슬롯에 복사 (그 참조는 인코더 몫)
+            frame = ring.acquire(frame)
+            stamp = ring.stamp(frame)
+        else:
+            ring.retain(frame)
+        self._sent = stamp
+        encoder.frame(frame, num_frames)
+
+
+class SharedRingRenderer(CachingRenderer):
+    def __init__(self, file_writer_class=SharedRingFileWriter, ring_slots=RING_SLOTS, **kwargs):
+        kwargs["frame_pool"] = 0
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+        self.frame_pool = SharedFrameRing(ring_slots)
+        self.encoder = EncoderProcess(self.frame_pool, on_encoded=self._record_encode)
+        self.frame_pool.check = self.encoder.check
+
+    def _record_encode(self, seconds):
+        if self.profiler is not None:
+            self.profiler.encoded(seconds)
+
+    def scene_finished(self, scene):
+        try:
+            super().scene_finished(scene)
+        finally:
+            self.encoder.stop()
+            self.frame_pool.close()
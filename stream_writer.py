@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 씬 하나를 인코더 하나로: play 마다 partial 영상을 만들지 않고 한 스트림에 이어서 인코딩
+# 사용 예:
+#   python render.py h_2.py -q h --stream
+#   from stream_writer import StreamRenderer
+#   OnboardingFlow(renderer=StreamRenderer()).render()
+#
+# - 첫 프레임에서 인코더를 한 번 열고 씬이 끝날 때 닫는다. 결과 파일이 곧 최종 영상이라
+#   이어 붙이기(concat) 단계가 없다 (gif 는 스트림을 partial 폴더에 쓰고 변환만 함).
+# - play 경계는 <영상>.index.json 에만 남긴다: play 번호, 세그먼트 키, 섹션, 시작 프레임, 프레임 수.
+# - 섹션 첫 프레임은 키프레임으로 강제 인코딩 -> 섹션 영상(--save_sections)은 재인코딩 없이
+#   그 구간 패킷만 복사해 자른다 (cut_frames).
+# - play 별 세그먼트 캐시는 쓰지 않는다 (캐시된 partial 을 열린 인코더 중간에 끼워 넣을 수 없음).
+#   키는 인덱스에 남는다.
+# - fast_renderer.py 의 프레임 생략/정지 레이어/페이드 합성 등 렌더러 옵션은 그대로 쓸 수 있다.
+
+import json
+import os
+from pathlib import Path
+
+import av
+import manim
+from manim import *
+
+from fast_renderer import ElidingFileWriter, FastRenderer
+
+
+class StreamFileWriter(ElidingFileWriter):
+    def __init__(self, renderer, scene_name, **kwargs):
+        self.plays = []           # [{"play", "key", "section", "first_frame", "frames"}]
+        self.frames_written = 0   # 큐에 넣은 프레임 수 (본 스레드)
+        self._frames_encoded = 0  # 인코딩한 프레임 수 (파일 쓰기 스레드)
+        self._keyframes = set()   # 키프레임으로 강제할 프레임 번호
+        self._section_of = []     # plays 와 같은 순서의 Section 객체
+        self._stream_path = None
+        self._stream_open = False
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def stream_path(self):
+        if is_gif_format():
+            return self.partial_movie_directory / "{}.stream{}".format(self.output_name, config.movie_file_extension)
+        return Path(self.movie_file_path)
+
+    def index_path(self):
+        return Path(self.movie_file_path).with_suffix(".index.json")
+
+    # ===== play 경계 =====
+    def add_partial_movie_file(self, hash_animation):
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return
+        # num_plays 와 번호를 맞추기 위해 파일 없이 None 만 추가
+        self.partial_movie_files.append(None)
+        self.sections[-1].partial_movie_files.append(None)
+        section = self.sections[-1]
+        if not self._section_of or self._section_of[-1] is not section:
+            self._keyframes.add(self.frames_written)
+        self._close_play()
+        self.plays.append({"play": self.renderer.num_plays, "key": hash_animation,
+                           "first_frame": self.frames_written})
+        self._section_of.append(section)
+
+    def _close_play(self):
+        if self.plays:
+            last = self.plays[-1]
+            last["frames"] = self.frames_written - last["first_frame"]
+
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def _open_stream(self, file_path):
+        super()._open_stream(file_path)
+        # B 프레임 없이 인코딩: 디코딩 순서 = 표시 순서라 섹션 키프레임에서 자른 영상의 dts 가 0 부터 시작
+        ctx = self.video_stream.codec_context
+        ctx.options = dict(ctx.options or {}, bf="0")
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write and not self._stream_open:
+            self._stream_path = self.stream_path()
+            self.open_partial_movie_stream(file_path=self._stream_path)
+            self._stream_open = True
+
+    def end_animation(self, allow_write=False):
+        pass  # 씬이 끝날 때 한 번만 닫음
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if write_to_movie():
+            self.frames_written += num_frames
+        super().write_frame(frame_or_renderer, num_frames)
+
+    def _mux_frame(self, av_frame):
+        if self._frames_encoded in self._keyframes:
+            av_frame.pict_type = av.video.frame.PictureType.I
+        self._frames_encoded += 1
+        super()._mux_frame(av_frame)
+
+    # ===== 마무리 =====
+    def combine_to_movie(self):
+        if self._stream_open:
+            self.close_partial_movie_stream()
+            self._stream_open = False
+        self._close_play()
+        if self._stream_path is None:
+            logger.info("No animations are contained in this scene.")
+            return
+        self._write_index()
+        # 부모의 소리 합치기/gif 변환은 그대로 쓰되 입력은 스트림 파일 하나
+        files = self.partial_movie_files
+        self.partial_movie_files = [str(self._stream_path)]
+        try:
+            super().combine_to_movie()
+        finally:
+            self.partial_movie_files = files
+
+    def combine_files(self, input_files, output_file, create_gif=False, includes_sound=False):
+        if [str(Path(f)) for f in input_files] == [str(Path(output_file))]:
+            return  # 스트림이 곧 최종 영상
+        super().combine_files(input_files, output_file, create_gif, includes_sound)
+
+    def _section_ranges(self):
+        ranges = []
+        for section in self.sections:
+            plays = [p for p, s in zip(self.plays, self._section_of) if s is section]
+            first = plays[0]["first_frame"] if plays else self.frames_written
+            ranges.append((section, first, sum(p.get("frames", 0) for p in plays)))
+        return ranges
+
+    def _write_index(self):
+        index = {
+            "movie": str(self.movie_file_path),
+            "stream": str(self._stream_path),
+            "frame_rate": config.frame_rate,
+            "frames": self.frames_written,
+            "keyframes": sorted(self._keyframes),
+            "plays": [dict(p, section=s.name) for p, s in zip(self.plays, self._section_of)],
+            "sections": [{"name": s.name, "first_frame": first, "frames": frames, "skip": s.skip_animations}
+                         for s, first, frames in self._section_ranges()],
+        }
+        with open(self.index_path(), "w", encoding="utf-8") as fp:
+            json.dump(index, fp, ensure_ascii=False, indent=2)
+
+    def combine_to_section_videos(self):
+        self.finish_last_section()
+        sections_index = []
+        for section, first, frames in self._section_ranges():
+            if section.video is None or not frames:
+                continue
+            logger.info("Cutting section '%s' (frames %d..%d)", section.name, first, first + frames - 1)
+            cut_frames(self._stream_path, first, frames, self.sections_output_dir / section.video)
+            sections_index.append(section.get_dict(self.sections_output_dir))
+        with (self.sections_output_dir / "{}.json".format(self.output_name)).open("w") as fp:
+            json.dump(sections_index, fp, indent=4)
+
+
+# ===== 자르기 =====
+def cut_frames(source, first, count, output):
+    # first 프레임(키프레임)부터 count 프레임을 패킷 복사로 잘라 저장
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name("{}.{}{}".format(output.stem, os.getpid(), output.suffix))
+    with av.open(str(source)) as src:
+        in_stream = src.streams.video[0]
+        per_frame = 1 / (in_stream.average_rate * in_stream.time_base)
+        start = int(round(first * per_frame))
+        end = int(round((first + count) * per_frame))
+        with av.open(str(tmp), mode="w") as dst:
+            dst.metadata["comment"] = "Rendered with Manim Community v{}".format(manim.__version__)
+            out_stream = dst.add_stream(template=in_stream)
+            offset = None
+            for packet in src.demux(in_stream):
+                if packet.dts is None or packet.pts is None or not start <= packet.pts < end:
+                    continue
+                if offset is None:
+                    # B 프레임이 있으면 키프레임의 dts 가 pts 보다 앞선다 (dts 는 이후 증가만 함)
+                    # start 만 빼면 dts 가 음수가 되므로 첫 패킷 dts 기준으로 옮김
+                    offset = min(start, packet.dts)
+                packet.pts -= offset
+                packet.dts -= offset
+                packet.stream = out_stream
+                dst.mux(packet)
+    os.replace(tmp, output)
+    return output
+
+
+def cut_section(movie, name, output):
+    # 인덱스가 있는 영상에서 섹션 하나를 잘라 냄
+    with open(Path(movie).with_suffix(".index.json"), encoding="utf-8") as fp:
+        index = json.load(fp)
+    for section in index["sections"]:
+        if section["name"] == name and section["frames"]:
+            return cut_frames(index["stream"], section["first_frame"], section["frames"], output)
+    raise KeyError(name)
+
+
+# ===== 렌더러 =====
+class StreamRenderer(FastRenderer):
+    def __init__(self, file_writer_class=StreamFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
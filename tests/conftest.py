@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+# 테스트 공용: 저장소 루트의 모듈(fast_renderer.py 등)을 그대로 import
+# 실행: python -m pytest -q tests
+# manim 이 없는 환경에서는 manim 이 필요한 테스트 파일이 건너뛰어진다 (frame_pool 테스트만 실행).
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# batch_render.estimate_costs: 지난 시간 / timeline / 씬 파일 호출 수로 긴 작업부터
+
+import pytest
+
+pytest.importorskip("manim")
+
+from batch_render import estimate_costs, static_cost  # noqa: E402
+
+
+def _scene(path, calls):
+    body = "".join("        self.play(FadeIn(Square()))\n" if i % 2 else "        self.wait(1)\n" for i in range(calls))
+    path.write_text("class S(Scene):\n    def construct(self):\n" + body, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHECKPOINT_DIR", str(tmp_path / "checkpoints"))  # 저장된 timeline 없음
+    return {name: _scene(tmp_path / "{}.py".format(name), calls) for name, calls in
+            (("short", 2), ("long", 12), ("mid", 6))}
+
+
+def _jobs(files, *names):
+    return [{"key": name, "file": files[name], "scene": "S"} for name in names]
+
+
+def test_static_cost_counts_play_and_wait_calls(files, tmp_path):
+    assert static_cost(files["long"]) == 12
+    assert static_cost(tmp_path / "missing.py") == 0
+
+
+def test_cold_run_orders_by_static_cost(files):
+    ordered = estimate_costs(_jobs(files, "short", "long", "mid"), {})
+    assert [j["key"] for j in ordered] == ["long", "mid", "short"]
+    assert all(j["estimate"] is None for j in ordered)
+
+
+def test_static_cost_is_scaled_by_previous_runs(files):
+    # 지난 실행: mid 는 호출 6개에 30초 -> 호출당 5초
+    previous = {"mid": {"key": "mid", "file": files["mid"], "wall": 30.0}}
+    ordered = estimate_costs(_jobs(files, "short", "mid", "long"), previous)
+    assert [j["key"] for j in ordered] == ["long", "mid", "short"]
+    assert [j["estimate"] for j in ordered] == [60.0, 30.0, 10.0]
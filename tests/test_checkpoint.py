@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# checkpoint: timeline 키(파일/폴더 내용), 섹션 이름/시각으로 play 찾기
+
+import pytest
+
+pytest.importorskip("manim")
+
+import checkpoint  # noqa: E402
+from checkpoint import find_play, source_key  # noqa: E402
+
+SCENE = "class OnboardingFlow(Scene):\n    def construct(self):\n        self.wait({})\n"
+
+
+@pytest.fixture
+def scenes(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    a, b = tmp_path / "h_1.py", tmp_path / "h_5.py"
+    a.write_text(SCENE.format(1), encoding="utf-8")
+    b.write_text(SCENE.format(2), encoding="utf-8")
+    return a, b
+
+
+def test_same_class_in_different_files_gets_different_keys(scenes):
+    a, b = scenes
+    key_a, key_b = source_key(a, "OnboardingFlow"), source_key(b, "OnboardingFlow")
+    assert key_a != key_b
+    assert checkpoint._timeline_path(a, "OnboardingFlow", key_a) != checkpoint._timeline_path(b, "OnboardingFlow", key_b)
+
+
+def test_key_is_stable_and_follows_folder_contents(scenes):
+    a, _ = scenes
+    key = source_key(a, "OnboardingFlow")
+    assert source_key(str(a), "OnboardingFlow") == key
+    (a.parent / "companies.jsonl").write_text('{"company_name": "ACME"}\n', encoding="utf-8")
+    assert source_key(a, "OnboardingFlow") != key
+
+
+@pytest.fixture
+def index():
+    return {
+        "scene": "S",
+        "duration": 10.0,
+        "plays": 4,
+        "sections": [
+            {"name": "Intro", "first_play": 0, "plays": 2, "start": 0.0, "duration": 6.0},
+            {"name": "Start Here", "first_play": 2, "plays": 2, "start": 6.0, "duration": 4.0},
+            {"name": "empty", "first_play": 4, "plays": 0, "start": 10.0, "duration": 0.0},
+        ],
+        "timeline": [
+            {"play": 0, "section": "Intro", "start": 0.0, "duration": 3.0},
+            {"play": 1, "section": "Intro", "start": 3.0, "duration": 3.0},
+            {"play": 2, "section": "Start Here", "start": 6.0, "duration": 2.0},
+            {"play": 3, "section": "Start Here", "start": 8.0, "duration": 2.0},
+        ],
+    }
+
+
+def test_find_play_by_section(index):
+    assert find_play(index, section="Start Here")["play"] == 2
+    assert find_play(index, section="start")["play"] == 2  # 대소문자 무시 부분 일치
+
+
+def test_find_play_rejects_unknown_or_empty_section(index):
+    with pytest.raises(ValueError):
+        find_play(index, section="CTA")
+    with pytest.raises(ValueError):
+        find_play(index, section="empty")
+
+
+def test_find_play_by_time_rounds_down_to_play_start(index):
+    assert find_play(index, time=0.0)["play"] == 0
+    assert find_play(index, time=7.9)["play"] == 2
+    assert find_play(index, time=8.0)["play"] == 3
+    with pytest.raises(ValueError):
+        find_play(index, time=10.0)
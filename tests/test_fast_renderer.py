@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# fast_renderer._affine_fit: 스프라이트 변형(--affine-sprites)용 아핀 근사
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from fast_renderer import _affine_fit  # noqa: E402
+
+
+def _rotation(deg, scale=1.0):
+    t = math.radians(deg)
+    return scale * np.array([[math.cos(t), -math.sin(t)], [math.sin(t), math.cos(t)]])
+
+
+def test_affine_fit_recovers_transform():
+    rng = np.random.default_rng(0)
+    ref = rng.uniform(-2, 2, (40, 2))
+    A, b = _rotation(20, 1.3), np.array([0.5, -1.0])
+    fit = _affine_fit(ref, ref @ A.T + b, px_per_unit=100)
+    assert fit is not None
+    assert np.allclose(fit[0], A) and np.allclose(fit[1], b)
+
+
+def test_affine_fit_rejects_non_affine_motion():
+    rng = np.random.default_rng(1)
+    ref = rng.uniform(-2, 2, (40, 2))
+    assert _affine_fit(ref, ref + rng.normal(0, 0.05, ref.shape), px_per_unit=100) is None
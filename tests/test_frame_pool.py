@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# frame_pool.FramePool: 참조 수, 순번(stamp), 빈 버퍼 대기와 check 훅
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import frame_pool
+from frame_pool import FramePool
+
+
+@pytest.fixture
+def frame():
+    return np.arange(4 * 4 * 4, dtype=np.uint8).reshape(4, 4, 4)
+
+
+def test_acquire_copies_and_release_returns_buffer(frame):
+    pool = FramePool(3)
+    buf = pool.acquire(frame)
+    assert pool.owns(buf)
+    assert buf is not frame and np.array_equal(buf, frame)
+    pool.release(buf)
+    assert pool._free.qsize() == 3
+
+
+def test_retain_keeps_buffer_until_last_release(frame):
+    pool = FramePool(3)
+    buf = pool.acquire(frame)
+    pool.retain(buf)
+    pool.release(buf)
+    assert pool._free.qsize() == 2
+    pool.release(buf)
+    assert pool._free.qsize() == 3
+
+
+def test_foreign_arrays_are_ignored(frame):
+    pool = FramePool(3)
+    pool.retain(frame)
+    pool.release(frame)
+    pool.release(None)
+    assert pool.stamp(frame) is None
+    assert pool._free.qsize() == 0  # 아직 할당 전
+
+
+def test_stamp_changes_per_acquisition(frame):
+    pool = FramePool(3)
+    buf = pool.acquire(frame)
+    first = pool.stamp(buf)
+    pool.release(buf)
+    reused = [pool.acquire(frame) for _ in range(3)]
+    assert any(b is buf for b in reused)
+    assert pool.stamp(buf) != first
+
+
+def test_minimum_size():
+    assert FramePool(1).size == 3
+
+
+def test_layout_change_reallocates(frame):
+    pool = FramePool(3)
+    old = pool.acquire(frame)
+    new = pool.acquire(np.zeros((2, 2, 4), np.uint8))
+    assert new.shape == (2, 2, 4)
+    assert not pool.owns(old)
+
+
+def test_acquire_waits_for_release(frame, monkeypatch):
+    monkeypatch.setattr(frame_pool, "FRAME_WAIT_POLL", 0.02)
+    pool = FramePool(3)
+    held = [pool.acquire(frame) for _ in range(3)]
+
+    def release_later():
+        time.sleep(0.1)
+        pool.release(held[0])
+
+    threading.Thread(target=release_later).start()
+    assert pool.acquire(frame) is held[0]
+    assert pool.waits == 1 and pool.wait_time > 0
+
+
+def test_acquire_raises_when_check_fails(frame, monkeypatch):
+    monkeypatch.setattr(frame_pool, "FRAME_WAIT_POLL", 0.02)
+    pool = FramePool(3)
+    for _ in range(3):
+        pool.acquire(frame)
+
+    def check():
+        raise RuntimeError("writer died")
+
+    pool.check = check
+    with pytest.raises(RuntimeError, match="writer died"):
+        pool.acquire(frame)
+
+
+def test_acquire_times_out_without_check(frame, monkeypatch):
+    monkeypatch.setattr(frame_pool, "FRAME_WAIT_POLL", 0.02)
+    monkeypatch.setattr(frame_pool, "FRAME_WAIT_TIMEOUT", 0.05)
+    pool = FramePool(3)
+    for _ in range(3):
+        pool.acquire(frame)
+    with pytest.raises(RuntimeError):
+        pool.acquire(frame)
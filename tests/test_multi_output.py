@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# multi_output: 출력 크기/경로, "높이[:코덱]" 출력 지정
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import tempconfig  # noqa: E402
+
+from multi_output import MultiOutputRenderer, output_path, output_size, parse_outputs  # noqa: E402
+
+
+def test_output_size_keeps_aspect_and_even_dimensions():
+    with tempconfig({"pixel_width": 1400, "pixel_height": 800}):
+        assert output_size(270) == (472, 270)
+        assert output_size(271) == (472, 270)
+        assert output_size(720) == (1260, 720)
+
+
+def test_output_path():
+    assert output_path("media/OnboardingFlow.mp4", 720).name == "OnboardingFlow_720p.mp4"
+    assert output_path("media/OnboardingFlow.mp4", 720, "libvpx-vp9").name == "OnboardingFlow_720p_vp9.webm"
+    # 같은 컨테이너라도 코덱이 다르면 다른 파일 (세그먼트 캐시에서 섞이지 않게)
+    assert output_path("seg_ab.mp4", 480, "libx264") != output_path("seg_ab.mp4", 480, "libx265")
+    assert output_path("seg_ab.mp4", 480, "libx264") != output_path("seg_ab.mp4", 480)
+
+
+def test_parse_outputs():
+    assert parse_outputs("720,270") == ((720, None), (270, None))
+    assert parse_outputs("1080:libvpx-vp9, 480:libx264,") == ((1080, "libvpx-vp9"), (480, "libx264"))
+    assert parse_outputs("720,720:libvpx-vp9") == ((720, None), (720, "libvpx-vp9"))
+
+
+@pytest.mark.parametrize("text", ["720p", "480:h264", "480,480", "480:libx264,480:libx264"])
+def test_parse_outputs_rejects(text):
+    with pytest.raises(ValueError):
+        parse_outputs(text)
+
+
+def test_renderer_accepts_heights_and_codec_pairs():
+    renderer = MultiOutputRenderer(outputs=(720, (270, "libvpx-vp9")))
+    assert renderer.outputs == ((720, None), (270, "libvpx-vp9"))
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# onb_template: 레코드 정규화(JSON/CSV), 일괄 렌더의 레코드별 실패 처리
+
+import json
+
+import pytest
+
+pytest.importorskip("manim")
+
+import onb_template  # noqa: E402
+from onb_template import BRAND, _csv_record, normalize_record  # noqa: E402
+
+
+def test_normalize_record_defaults_and_aliases(tmp_path):
+    rec = normalize_record({
+        "company_name": "ACME",
+        "onboarding_flow": [{"id": "입사", "desc": "환영"}],
+        "slug": "acme inc/2025",
+        "hero": "hero.png",
+        "brand": {"bg": "#000000"},
+    }, 0, tmp_path)
+    assert rec["flow"] == [{"id": "입사", "desc": "환영"}] and "onboarding_flow" not in rec
+    assert rec["slug"] == "acme_inc_2025"
+    assert rec["values"] == [] and rec["sections"] == [] and rec["cta"] == ""
+    assert rec["brand"] == {**BRAND, "bg": "#000000"}
+    assert rec["hero"] == str(tmp_path / "hero.png")
+
+
+def test_normalize_record_without_flow_gets_empty_flow():
+    rec = normalize_record({"company_name": "ACME"}, 4)
+    assert rec["flow"] == [] and rec["slug"] == "company_005"
+
+
+def test_csv_record_parses_lists_and_flow():
+    rec = _csv_record({"company_name": "ACME", "values": "안전| 품질 |", "flow": "입사:첫날 환영|교육:안전 교육",
+                       "brand": '{"bg": "#111111"}', "cta": ""})
+    assert rec["values"] == ["안전", "품질"]
+    assert rec["flow"] == [{"id": "입사", "desc": "첫날 환영"}, {"id": "교육", "desc": "안전 교육"}]
+    assert rec["brand"] == {"bg": "#111111"}
+    assert "cta" not in rec
+
+
+def test_main_keeps_going_after_a_failed_record(tmp_path, monkeypatch, capsys):
+    records = tmp_path / "companies.jsonl"
+    records.write_text("".join(json.dumps({"company_name": name, "slug": name}) + "\n"
+                               for name in ("a", "bad", "c")), encoding="utf-8")
+
+    def fake_render(record, quality, dry):
+        if record["slug"] == "bad":
+            raise RuntimeError("broken record")
+        return {"slug": record["slug"], "movie": record["slug"] + ".mp4"}
+
+    monkeypatch.setattr(onb_template, "_render_record", fake_render)
+    assert onb_template.main([str(records)]) == 1
+    out, err = capsys.readouterr()
+    assert "[완료] a -> a.mp4" in out and "[완료] c -> c.mp4" in out
+    assert "[실패] bad" in err and "broken record" in err
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# FastRenderer 프레임이 원래 CairoRenderer 프레임과 같은지 (작은 해상도의 짧은 씬)
+# - 기본 옵션(프레임 생략 + 정지 레이어 재사용 + 프레임 버퍼 풀)은 픽셀 단위로 동일해야 함
+# - 페이드 합성/스프라이트 변형은 근사이므로 평균 오차만 확인
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import *  # noqa: E402,F403
+
+from fast_renderer import FastRenderer  # noqa: E402
+
+
+class SampleScene(Scene):
+    def construct(self):
+        panel = Rectangle(width=6, height=3, color=GRAY, fill_opacity=0.3)
+        label = Text("A", font_size=48).to_corner(UL)
+        square = Square(side_length=1.5, color=BLUE, fill_opacity=0.6)
+        self.add(panel, label)
+        self.play(FadeIn(square), run_time=0.5)
+        self.play(square.animate.shift(RIGHT * 1.5), run_time=0.5)
+        self.wait(0.5)
+        self.play(Create(Circle(radius=0.6, color=YELLOW).shift(LEFT * 2)), run_time=0.5)
+        self.wait(0.3)
+        self.play(FadeOut(square), run_time=0.5)
+
+
+def _recording(base):
+    class Recording(base):
+        def add_frame(self, frame, num_frames=1):
+            copy = np.array(frame)  # 풀 버퍼는 바로 재사용되므로 복사
+            self.recorded.extend([copy] * num_frames)
+            super().add_frame(frame, num_frames)
+
+    return Recording
+
+
+def _frames(renderer_cls, tmp_path, **kwargs):
+    settings = {
+        "media_dir": str(tmp_path), "write_to_movie": False, "disable_caching": True,
+        "pixel_width": 192, "pixel_height": 108, "frame_rate": 15,
+    }
+    with tempconfig(settings):
+        renderer = _recording(renderer_cls)(**kwargs)
+        renderer.recorded = []
+        SampleScene(renderer=renderer).render()
+    return renderer.recorded
+
+
+@pytest.fixture
+def reference(tmp_path):
+    return _frames(CairoRenderer, tmp_path / "cairo")
+
+
+def test_fast_renderer_matches_cairo_exactly(reference, tmp_path):
+    frames = _frames(FastRenderer, tmp_path / "fast")
+    assert len(frames) == len(reference)
+    for i, (a, b) in enumerate(zip(frames, reference)):
+        assert np.array_equal(a, b), "frame {}".format(i)
+
+
+def test_fast_renderer_without_pool_matches_cairo(reference, tmp_path):
+    frames = _frames(FastRenderer, tmp_path / "nopool", frame_pool=0)
+    assert len(frames) == len(reference)
+    assert all(np.array_equal(a, b) for a, b in zip(frames, reference))
+
+
+def test_approximate_options_stay_close(reference, tmp_path):
+    frames = _frames(FastRenderer, tmp_path / "approx", composite_fades=True, affine_sprites=True)
+    assert len(frames) == len(reference)
+    for i, (a, b) in enumerate(zip(frames, reference)):
+        diff = np.abs(a.astype(np.int16) - b.astype(np.int16))
+        assert diff.mean() < 1.0, "frame {}: mean {:.3f}".format(i, diff.mean())
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# sections.section_ranges: 드라이런 섹션을 워커별 play 범위로 나누기
+
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("av")
+
+from sections import section_ranges  # noqa: E402
+
+
+def _sections(*plays):
+    out, first = [], 0
+    for n in plays:
+        out.append({"name": "s{}".format(len(out)), "first_play": first, "plays": n, "duration": float(n)})
+        first += n
+    return out
+
+
+def test_ranges_cover_every_play_and_last_runs_to_end():
+    assert section_ranges(_sections(3, 2, 4)) == [(0, 0, 2), (1, 3, 4), (2, 5, -1)]
+
+
+def test_single_section_renders_everything():
+    assert section_ranges(_sections(5)) == [(0, 0, -1)]
+
+
+def test_empty_sections_get_no_worker():
+    # 앞쪽 빈 섹션(0..-1)이 "끝까지"로 읽혀 전체를 다시 렌더하면 안 됨
+    assert section_ranges(_sections(0, 2, 0, 3, 0)) == [(1, 0, 1), (3, 2, -1)]
+
+
+def test_scene_without_plays():
+    assert section_ranges(_sections(0)) == [(0, 0, -1)]
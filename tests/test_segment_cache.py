@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# segment_cache: 도형 상태가 키에 반영되는지, 용량 정리의 keep/최근 사용 보호
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import BLUE, RED, FadeIn, Scene, Square, tempconfig  # noqa: E402
+
+import segment_cache  # noqa: E402
+
+
+def _key(build):
+    with tempconfig({"disable_caching": False}):
+        scene = Scene()
+        square = Square(color=BLUE)
+        build(scene, square)
+        scene.animations = [FadeIn(square)]
+        return segment_cache.segment_key(scene, scene.renderer.camera)
+
+
+def test_key_is_stable():
+    assert _key(lambda s, m: s.add(m)) == _key(lambda s, m: s.add(m))
+
+
+def test_changed_mobject_changes_key():
+    base = _key(lambda s, m: s.add(m))
+    assert base != _key(lambda s, m: s.add(m.set_color(RED)))
+    assert base != _key(lambda s, m: s.add(m.shift([1, 0, 0])))
+
+
+def test_variant_changes_key():
+    with tempconfig({"disable_caching": False}):
+        scene = Scene()
+        scene.animations = [FadeIn(Square())]
+        camera = scene.renderer.camera
+        assert segment_cache.segment_key(scene, camera) != segment_cache.segment_key(scene, camera, ("fades",))
+
+
+def test_updater_makes_play_uncacheable():
+    assert _key(lambda s, m: s.add(m.add_updater(lambda mob: None))) is None
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEGMENT_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _fake_entries(root, mtimes, size=1000):
+    sub = root / "ab"
+    sub.mkdir(exist_ok=True)
+    paths = []
+    for i, mtime in enumerate(mtimes):
+        path = sub / "seg_ab{:02d}.mp4".format(i)
+        path.write_bytes(b"\0" * size)
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+    return paths
+
+
+def test_evict_removes_oldest_first(store):
+    paths = _fake_entries(store, [1000, 1001, 1002, 1003])
+    assert segment_cache.evict(2000, grace=0) == 2000
+    assert [p.exists() for p in paths] == [False, False, True, True]
+
+
+def test_evict_skips_kept_files(store):
+    paths = _fake_entries(store, [1000, 1001, 1002])
+    assert segment_cache.evict(2000, keep={str(paths[0])}, grace=0) == 2000
+    assert [p.exists() for p in paths] == [True, False, True]
+
+
+def test_evict_leaves_recently_used_files(store):
+    now = time.time()
+    paths = _fake_entries(store, [1000, now - 60, now - 30])
+    # 상한을 넘어도 grace 안에 쓰인 파일은 다른 프로세스가 이어 붙이는 중일 수 있음
+    assert segment_cache.evict(0, grace=600) == 2000
+    assert [p.exists() for p in paths] == [False, True, True]
+    assert segment_cache.evict(0, grace=0) == 0
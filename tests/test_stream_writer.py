@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# stream_writer.cut_frames: 키프레임부터 패킷 복사로 자르기
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+av = pytest.importorskip("av")
+
+from stream_writer import cut_frames  # noqa: E402
+
+FRAMES = 30
+KEYFRAME = 10
+
+
+def _write_movie(path, b_frames):
+    with av.open(str(path), mode="w") as out:
+        stream = out.add_stream("libx264", rate=15, options={"bf": str(b_frames)})
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+        for i in range(FRAMES):
+            frame = av.VideoFrame.from_ndarray(np.full((48, 64, 3), i * 8, np.uint8), format="rgb24")
+            if i == KEYFRAME:
+                frame.pict_type = av.video.frame.PictureType.I  # StreamFileWriter 의 섹션 경계와 같음
+            for packet in stream.encode(frame):
+                out.mux(packet)
+        for packet in stream.encode():
+            out.mux(packet)
+    return path
+
+
+def _read(path):
+    with av.open(str(path)) as src:
+        packets = [(p.pts, p.dts) for p in src.demux(video=0) if p.dts is not None]
+    with av.open(str(path)) as src:
+        # 밝기가 프레임 번호를 따름
+        levels = [int(round(f.to_ndarray(format="gray")[0, 0] / 8)) for f in src.decode(video=0)]
+    return packets, levels
+
+
+def test_cut_stream_without_b_frames(tmp_path):
+    # StreamFileWriter 는 B 프레임 없이 인코딩
+    source = _write_movie(tmp_path / "stream.mp4", 0)
+    packets, levels = _read(cut_frames(source, KEYFRAME, 10, tmp_path / "cut.mp4"))
+    assert levels == list(range(KEYFRAME, KEYFRAME + 10))
+    assert packets[0] == (0, 0)
+    assert all(pts >= dts >= 0 for pts, dts in packets)
+
+
+@pytest.mark.parametrize("first, count", [(0, 5), (KEYFRAME, 10), (KEYFRAME, 20)])
+def test_cut_stream_with_b_frames_keeps_frames_in_order(tmp_path, first, count):
+    source = _write_movie(tmp_path / "stream.mp4", 2)
+    packets, levels = _read(cut_frames(source, first, count, tmp_path / "cut.mp4"))
+    assert levels == list(range(first, first + count))
+    dts = [d for _, d in packets]
+    assert dts == sorted(dts)
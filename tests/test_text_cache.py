@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# text_cache: 키 구성, 메모리 상한(LRU), 복사본 반환
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Square  # noqa: E402
+
+import text_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    text_cache.clear_text_cache()
+    monkeypatch.setattr(text_cache, "_stats", dict.fromkeys(text_cache._stats, 0))
+    made = []
+
+    def fake_text(text, **kwargs):
+        made.append((text, kwargs))
+        return Square()
+
+    # 조판(Pango)과 디스크 저장소 없이 캐시 동작만 확인
+    monkeypatch.setattr(text_cache, "Text", fake_text)
+    monkeypatch.setattr(text_cache, "load_text", lambda key, kwargs: None)
+    monkeypatch.setattr(text_cache, "save_text", lambda key, kwargs, mobj: None)
+    yield made
+    text_cache.clear_text_cache()
+
+
+def test_key_depends_on_kwargs():
+    base = text_cache.text_key("가", {"font": "A", "weight": "BOLD"})
+    assert base == text_cache.text_key("가", {"weight": "BOLD", "font": "A"})
+    assert base != text_cache.text_key("가", {"font": "A", "weight": "NORMAL"})
+    assert base != text_cache.text_key("가", {"font": "B", "weight": "BOLD"})
+    assert text_cache.text_key("가", {"t2c": {"가": "#FF0000"}}) != text_cache.text_key("가", {"t2c": {"가": "#00FF00"}})
+
+
+def test_hit_returns_independent_copy(fresh_cache):
+    first = text_cache.cached_text("가", font="A")
+    first.shift([3, 0, 0])
+    second = text_cache.cached_text("가", font="A")
+    assert len(fresh_cache) == 1
+    assert second is not first
+    assert abs(second.get_center()[0]) < 1e-9
+    assert text_cache.text_cache_info()["hits"] == 1
+
+
+def test_different_kwargs_typeset_again(fresh_cache):
+    text_cache.cached_text("가", font="A")
+    text_cache.cached_text("가", font="A", weight="BOLD")
+    assert len(fresh_cache) == 2
+
+
+def test_lru_cap_evicts_least_recently_used(fresh_cache, monkeypatch):
+    size = text_cache._mobject_nbytes(Square())
+    monkeypatch.setattr(text_cache, "TEXT_CACHE_MAX_BYTES", size * 2)
+    text_cache.cached_text("a")
+    text_cache.cached_text("b")
+    text_cache.cached_text("a")  # a 를 최근 사용으로
+    text_cache.cached_text("c")  # 가장 오래 안 쓴 b 가 빠짐
+    info = text_cache.text_cache_info()
+    assert info["entries"] == 2 and info["bytes"] <= size * 2
+    assert info["evictions"] == 1
+    text_cache.cached_text("a")
+    assert len(fresh_cache) == 3  # a 는 남아 있음
+    text_cache.cached_text("b")
+    assert len(fresh_cache) == 4  # b 는 다시 조판
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# text_store: 저장/읽기 왕복, 용량 정리(LRU)와 지울 수 없는 파일
+
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Square  # noqa: E402
+
+import text_store  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEXT_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(text_store, "TEXT_STORE_ENABLED", True)
+    monkeypatch.setattr(text_store, "_approx_bytes", None)
+    return tmp_path
+
+
+def _fake_entries(root, count, size=1000):
+    paths = []
+    sub = root / "ab"
+    sub.mkdir(exist_ok=True)
+    for i in range(count):
+        path = sub / "{:02d}.txs".format(i)
+        path.write_bytes(b"\0" * size)
+        os.utime(path, (1000 + i, 1000 + i))  # 번호가 작을수록 오래됨
+        paths.append(path)
+    return paths
+
+
+def test_round_trip(store):
+    key = ("가나다", (("font", ""),), "cairo", 1400, 800)
+    square = Square().shift([1, 2, 0])
+    assert text_store.load_text(key, {}) is None
+    text_store.save_text(key, {}, square)
+    loaded = text_store.load_text(key, {})
+    assert loaded is not None
+    assert np.allclose(loaded.points, square.points)
+    assert np.allclose(loaded.fill_rgbas, square.fill_rgbas)
+
+
+def test_different_keys_do_not_collide(store):
+    text_store.save_text(("a",), {}, Square())
+    assert text_store.load_text(("b",), {}) is None
+
+
+def test_evict_removes_oldest_first(store):
+    paths = _fake_entries(store, 5)
+    remaining = text_store.evict(3000)
+    assert remaining == 3000
+    assert [p.exists() for p in paths] == [False, False, True, True, True]
+
+
+def test_evict_skips_files_that_cannot_be_removed(store, monkeypatch):
+    paths = _fake_entries(store, 3)
+    unlink = os.unlink
+
+    def locked(path):
+        if str(path) == str(paths[0]):
+            raise PermissionError(path)  # Windows 에서 mmap 중인 파일
+        unlink(path)
+
+    monkeypatch.setattr(text_store.os, "unlink", locked)
+    remaining = text_store.evict(1000)
+    assert paths[0].exists()
+    assert not paths[1].exists() and not paths[2].exists()
+    assert remaining == 1000  # 남은 파일 크기는 그대로 계산
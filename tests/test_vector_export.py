@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# vector_export: 아핀 분해(SVG transform), 키프레임 정리, 회전 각도 이어 붙이기
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from vector_export import _decompose, _linear_keys, _unwrap  # noqa: E402
+
+
+# ===== 아핀 분해 =====
+def _rotation(deg, scale=1.0):
+    t = math.radians(deg)
+    return scale * np.array([[math.cos(t), -math.sin(t)], [math.sin(t), math.cos(t)]])
+
+
+def test_decompose_flips_rotation_into_pixel_space():
+    pixel = np.array([[100.0, 0.0, 0.0], [0.0, -100.0, 0.0], [0.0, 0.0, 1.0]])
+    tx, ty, rot, skew, sx, sy = _decompose(_rotation(30, 2.0), np.array([1.0, 0.0]), pixel)
+    assert (tx, ty) == (100.0, 0.0)
+    assert rot == -30.0 and skew == 0.0
+    assert sx == 2.0 and sy == 2.0
+
+
+def test_decompose_identity():
+    pixel = np.array([[50.0, 0.0, 320.0], [0.0, -50.0, 180.0], [0.0, 0.0, 1.0]])
+    assert _decompose(np.eye(2), np.zeros(2), pixel) == (0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
+
+
+# ===== SVG 키 =====
+def test_linear_keys_drops_points_on_a_line():
+    series = [(f, (float(f),)) for f in range(11)]
+    assert _linear_keys(series, 10, 0.01) == [(0, (0.0,)), (10, (10.0,))]
+
+
+def test_linear_keys_holds_value_before_a_change():
+    keys = _linear_keys([(0, (0.0,)), (10, (10.0,))], 20, 0.01)
+    assert keys == [(0, (0.0,)), (9, (0.0,)), (10, (10.0,)), (20, (10.0,))]
+
+
+def test_unwrap_keeps_rotation_continuous():
+    assert _unwrap([170.0, -170.0, 175.0]) == [170.0, 190.0, 175.0]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# Text 조판 결과 재사용 캐시 (프로세스 내 LRU)
+# 사용 예:
+#   from text_cache import cached_text
+#   title = cached_text("핵심가치", font=FONT, weight="BOLD", color=BRAND_TEXT)
+#
+# 같은 (문자열, 폰트, 굵기, 색, t2c, ...) 조합은 Pango/SVG 파싱을 한 번만 거치고
+# 이후에는 이미 조판된 윤곽선의 복사본을 돌려준다. 반환값은 항상 독립된 복사본이므로
+# scale/set_color/move_to 등으로 자유롭게 수정해도 캐시 원본은 바뀌지 않는다.
+# 메모리에 없으면 디스크 저장소(text_store.py)를 먼저 확인한 뒤에 새로 조판한다.
+
+from collections import OrderedDict
+
+from manim import *
+
+from text_store import load_text, save_text
+
+# ===== 캐시 설정 =====
+TEXT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 포인트/색 배열 기준 메모리 상한
+
+_cache = OrderedDict()
+_cache_bytes = 0
+_stats = {"hits": 0, "misses": 0, "store_hits": 0, "evictions": 0}
+
+
+# ===== 키/크기 계산 =====
+def _freeze(value):
+    # dict/list 인자(t2c 등)를 해시 가능한 형태로 고정
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def text_key(text, kwargs):
+    # 조판 결과에 영향을 주는 전역 설정(렌더러 종류, 캔버스 크기)도 키에 포함
+    return (
+        text,
+        _freeze(kwargs),
+        str(config.renderer),
+        config.pixel_width,
+        config.pixel_height,
+    )
+
+
+def _mobject_nbytes(mobj):
+    total = 0
+    for m in mobj.family_members_with_points():
+        total += m.points.nbytes
+        for name in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            arr = getattr(m, name, None)
+            if arr is not None:
+                total += arr.nbytes
+    return total
+
+
+# ===== 캐시 본체 =====
+def _remember(key, mobj):
+    global _cache_bytes
+    size = _mobject_nbytes(mobj)
+    if size > TEXT_CACHE_MAX_BYTES:
+        return
+    _cache[key] = (mobj, size)
+    _cache_bytes += size
+    while _cache_bytes > TEXT_CACHE_MAX_BYTES and _cache:
+        _, (_, old_size) = _cache.popitem(last=False)
+        _cache_bytes -= old_size
+        _stats["evictions"] += 1
+
+
+def cached_text(text, **kwargs):
+    key = text_key(text, kwargs)
+    entry = _cache.get(key)
+    if entry is None:
+        _stats["misses"] += 1
+        mobj = load_text(key, kwargs)
+        if mobj is None:
+            mobj = Text(text, **kwargs)
+            save_text(key, kwargs, mobj)
+        else:
+            _stats["store_hits"] += 1
+        _remember(key, mobj)
+    else:
+        _stats["hits"] += 1
+        _cache.move_to_end(key)
+        mobj = entry[0]
+    return mobj.copy()
+
+
+def text_cache_info():
+    return {
+        **_stats,
+        "entries": len(_cache),
+        "bytes": _cache_bytes,
+        "max_bytes": TEXT_CACHE_MAX_BYTES,
+    }
+
+
+def clear_text_cache():
+    global _cache_bytes
+    _cache.clear()
+    _cache_bytes = 0
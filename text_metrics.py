@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 조판 없이 문자열 폭/높이를 계산하는 측정 API (레이아웃 사전 계산용)
+# 사용 예:
+#   from text_metrics import measure_text, wrap_text, fit_scale
+#   w, h = measure_text(HR_DATA["cta"], font=FONT, weight="BOLD", scale=0.6)
+#   lines = wrap_text(HR_DATA["cta"], 5.2, font=FONT, weight="BOLD", scale=0.6)
+#
+# 글자별 advance 는 폰트 파일(fontconfig 조회)에서 PIL 로 읽어 캐시하고,
+# (폰트, 굵기, 크기)마다 기준 문자열 한 번만 실제 조판해 Manim 단위로 환산한다.
+# 폰트 파일을 찾지 못하면 "가{ch}가" 와 "가가" 의 폭 차이로 advance 를 구한다(역시 캐시됨).
+# 폭은 advance 합이므로 실제 잉크 폭보다 약간 크게(보수적으로) 나온다.
+
+from functools import lru_cache
+
+from PIL import ImageFont
+from manim import *
+
+from text_cache import cached_text
+from text_store import font_file
+
+_REF_PX = 256
+_SAMPLE = "가나다라마바사 ABCDEFG abcdefg 0123456789"
+_LINE_SAMPLE = "가Ag"
+_PROBE = "가"
+
+# 줄 첫머리에 오면 안 되는 문장부호(앞 글자에 붙임)
+_NO_LINE_START = set(",.!?:;%)]}>·、。，．：；！？」』）】")
+
+
+def _is_breakable_cjk(ch):
+    # 한자/가나는 글자 단위 줄바꿈 허용. 한글은 어절 단위 유지(keep-all)
+    code = ord(ch)
+    return (
+        0x3040 <= code <= 0x30FF      # 히라가나/가타카나
+        or 0x3400 <= code <= 0x4DBF   # CJK 확장 A
+        or 0x4E00 <= code <= 0x9FFF   # CJK 통합 한자
+        or 0xF900 <= code <= 0xFAFF   # CJK 호환 한자
+    )
+
+
+# ===== 폰트/보정 =====
+@lru_cache(maxsize=None)
+def _pil_font(font, weight):
+    found = font_file(font, weight)
+    if found is None:
+        return None
+    try:
+        return ImageFont.truetype(found[0], size=_REF_PX, index=found[1])
+    except OSError:
+        return None
+
+
+def _probe_width(font, weight, font_size, s):
+    return cached_text(_PROBE + s + _PROBE, font=font, weight=weight, font_size=font_size).width
+
+
+@lru_cache(maxsize=None)
+def _calibration(font, weight, font_size):
+    # (폰트, 굵기, 크기)당 1회만 실제 조판
+    one = cached_text(_LINE_SAMPLE, font=font, weight=weight, font_size=font_size).height
+    two = cached_text(_LINE_SAMPLE + "\n" + _LINE_SAMPLE, font=font, weight=weight, font_size=font_size).height
+    unit = None
+    pil = _pil_font(font, weight)
+    if pil is not None:
+        ref = cached_text(_SAMPLE, font=font, weight=weight, font_size=font_size)
+        unit = ref.width / pil.getlength(_SAMPLE)
+    return {"unit": unit, "line_height": one, "line_pitch": two - one}
+
+
+@lru_cache(maxsize=65536)
+def _advance(font, weight, font_size, ch):
+    cal = _calibration(font, weight, font_size)
+    if cal["unit"] is not None:
+        return _pil_font(font, weight).getlength(ch) * cal["unit"]
+    return _probe_width(font, weight, font_size, ch) - _probe_width(font, weight, font_size, "")
+
+
+def _width(s, font, weight, font_size):
+    return sum(_advance(font, weight, font_size, ch) for ch in s)
+
+
+# ===== 측정 =====
+def measure_text(text, font="", weight=NORMAL, scale=1.0, font_size=DEFAULT_FONT_SIZE):
+    # Text(text, font=..., weight=...).scale(scale) 의 (width, height) 근사치
+    cal = _calibration(font, weight, font_size)
+    lines = text.split("\n")
+    width = max(_width(line.strip(), font, weight, font_size) for line in lines)
+    height = cal["line_height"] + (len(lines) - 1) * cal["line_pitch"]
+    return width * scale, height * scale
+
+
+def fit_scale(text, max_width, font="", weight=NORMAL, scale=1.0, font_size=DEFAULT_FONT_SIZE):
+    # 폭이 max_width 를 넘지 않도록 하는 최종 scale 값
+    width, _ = measure_text(text, font=font, weight=weight, scale=scale, font_size=font_size)
+    if width <= max_width:
+        return scale
+    return scale * max_width / width
+
+
+# ===== 줄바꿈 =====
+def _split_word(word):
+    if not any(_is_breakable_cjk(ch) for ch in word):
+        return [word]
+    pieces = []
+    for ch in word:
+        glue = pieces and (
+            ch in _NO_LINE_START
+            or (not _is_breakable_cjk(ch) and not _is_breakable_cjk(pieces[-1][-1]))
+        )
+        if glue:
+            pieces[-1] += ch
+        else:
+            pieces.append(ch)
+    return pieces
+
+
+def _units(paragraph):
+    # (조각, 앞에 공백 여부) 목록
+    units = []
+    for i, word in enumerate(paragraph.split()):
+        for j, piece in enumerate(_split_word(word)):
+            units.append((piece, i > 0 and j == 0))
+    return units
+
+
+def wrap_text(text, max_width, font="", weight=NORMAL, scale=1.0, font_size=DEFAULT_FONT_SIZE):
+    # max_width(Manim 단위, scale 적용 후 기준)에 맞춰 줄 목록 반환
+    limit = max_width / scale
+    space = _advance(font, weight, font_size, " ")
+    lines = []
+    for paragraph in text.split("\n"):
+        cur, cur_w = "", 0.0
+        for piece, spaced in _units(paragraph):
+            gap = space if (cur and spaced) else 0.0
+            w = _width(piece, font, weight, font_size)
+            if cur and cur_w + gap + w > limit:
+                lines.append(cur)
+                cur, cur_w, gap = "", 0.0, 0.0
+            if w <= limit:
+                cur += (" " if gap else "") + piece
+                cur_w += gap + w
+                continue
+            # 한 어절이 한 줄보다 길면 글자 단위로 자름
+            for ch in piece:
+                cw = _advance(font, weight, font_size, ch)
+                if cur and ch not in _NO_LINE_START and cur_w + gap + cw > limit:
+                    lines.append(cur)
+                    cur, cur_w, gap = "", 0.0, 0.0
+                cur += (" " if gap else "") + ch
+                cur_w += gap + cw
+                gap = 0.0
+        lines.append(cur)
+    return lines
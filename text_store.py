@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# Text 윤곽선 디스크 저장소 (동시에 도는 렌더 프로세스끼리 공유)
+#
+# - 키  : 폰트 파일 해시 + 조판 인자(text_cache.text_key) + Manim 버전
+# - 값  : pickle(protocol 5) 본문 + 포인트/색 배열 버퍼
+#         읽을 때는 파일을 mmap 으로 열고 배열이 그 메모리를 그대로 참조(복사 없음)
+# - 쓰기: 임시 파일에 쓴 뒤 os.replace 로 교체 -> 여러 프로세스가 같은 키를 써도 안전
+# - 상한: TEXT_STORE_MAX_MB 초과 시 가장 오래 안 쓴 항목부터 삭제
+#
+# 환경변수
+#   TEXT_STORE_DIR    : 저장 위치 (기본: <media_dir>/text_store)
+#   TEXT_STORE_MAX_MB : 용량 상한 (기본 512)
+#   TEXT_STORE=0      : 디스크 저장소 끄기
+# 주의: 로컬 캐시 전용. 다른 사용자가 쓸 수 있는 디렉터리를 지정하지 말 것(pickle).
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import subprocess
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import manim
+from manim import *
+
+# ===== 설정 =====
+TEXT_STORE_ENABLED = os.environ.get("TEXT_STORE", "1") != "0"
+TEXT_STORE_MAX_BYTES = int(os.environ.get("TEXT_STORE_MAX_MB", "512")) * 1024 * 1024
+
+_MAGIC = b"TXS1"
+_ALIGN = 64
+_approx_bytes = None  # 마지막 전체 스캔 이후 누적 크기(추정)
+
+
+def _aligned(n):
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+# ===== 폰트 파일 조회 =====
+@lru_cache(maxsize=None)
+def font_file(font, weight=NORMAL):
+    # fontconfig 로 실제 폰트 파일 (경로, 컬렉션 인덱스) 조회. 찾지 못하면 None
+    w = str(weight).lower()
+    pattern = "{}:weight={}".format(font or "sans", "black" if w == "ultraheavy" else w)
+    try:
+        out = subprocess.run(
+            ["fc-match", "-f", "%{file}\n%{index}", pattern],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = out.stdout.splitlines()
+    if out.returncode != 0 or not lines or not os.path.isfile(lines[0]):
+        return None
+    index = int(lines[1]) if len(lines) > 1 and lines[1].isdigit() else 0
+    return lines[0], index
+
+
+@lru_cache(maxsize=None)
+def font_digest(font, weight=NORMAL):
+    found = font_file(font, weight)
+    if found is None:
+        # fontconfig 가 없는 환경(Windows 등)은 폰트 이름으로 대신함
+        return "name:{}:{}".format(font, weight)
+    h = hashlib.sha256()
+    with open(found[0], "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            h.update(chunk)
+    return "{}:{}".format(h.hexdigest(), found[1])
+
+
+# ===== 경로 =====
+def store_dir():
+    custom = os.environ.get("TEXT_STORE_DIR")
+    path = Path(custom) if custom else Path(config.media_dir) / "text_store"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _entry_path(key, kwargs):
+    digest = font_digest(kwargs.get("font", ""), kwargs.get("weight", NORMAL))
+    name = hashlib.sha256(repr((digest, manim.__version__, key)).encode("utf-8")).hexdigest()
+    return store_dir() / name[:2] / (name + ".txs")
+
+
+# ===== 읽기/쓰기 =====
+def load_text(key, kwargs):
+    if not TEXT_STORE_ENABLED:
+        return None
+    path = _entry_path(key, kwargs)
+    try:
+        with open(path, "rb") as fp:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        if mm[:4] != _MAGIC:
+            return None
+        (header_len,) = struct.unpack("<I", mm[4:8])
+        header = json.loads(mm[8:8 + header_len])
+        start = _aligned(8 + header_len)
+        view = memoryview(mm)
+        body = view[start:start + header["body"]]
+        buffers = [view[start + off:start + off + size] for off, size in header["buffers"]]
+        mobj = pickle.loads(body, buffers=buffers)
+    except Exception:
+        return None
+    try:
+        os.utime(path)  # LRU 판단용 사용 시각 갱신
+    except OSError:
+        pass
+    return mobj
+
+
+def save_text(key, kwargs, mobj):
+    global _approx_bytes
+    if not TEXT_STORE_ENABLED:
+        return
+    path = _entry_path(key, kwargs)
+    if path.exists():
+        return
+    buffers = []
+    try:
+        body = pickle.dumps(mobj, protocol=5, buffer_callback=buffers.append)
+        raws = [b.raw() for b in buffers]
+    except Exception:
+        return
+
+    spans = []
+    pos = len(body)
+    for raw in raws:
+        pos = _aligned(pos)
+        spans.append([pos, raw.nbytes])
+        pos += raw.nbytes
+    header = json.dumps({"body": len(body), "buffers": spans}).encode("ascii")
+
+    path.parent.mkdir(exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(_MAGIC + struct.pack("<I", len(header)) + header)
+            start = _aligned(fp.tell())
+            fp.write(b"\0" * (start - fp.tell()))
+            fp.write(body)
+            for (off, _), raw in zip(spans, raws):
+                fp.write(b"\0" * (start + off - fp.tell()))
+                fp.write(raw)
+            size = fp.tell()
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return
+
+    if _approx_bytes is None:
+        _approx_bytes = _scan()[1]
+    else:
+        _approx_bytes += size
+    if _approx_bytes > TEXT_STORE_MAX_BYTES:
+        _approx_bytes = evict(int(TEXT_STORE_MAX_BYTES * 0.9))
+
+
+# ===== 용량 관리 =====
+def _scan():
+    entries = []
+    total = 0
+    for sub in os.scandir(store_dir()):
+        if not sub.is_dir():
+            continue
+        for f in os.scandir(sub.path):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            if f.name.endswith(".txs"):
+                entries.append((st.st_mtime, st.st_size, f.path))
+                total += st.st_size
+            elif f.name.endswith(".tmp") and st.st_mtime < time.time() - 3600:
+                # 중간에 죽은 프로세스가 남긴 임시 파일
+                try:
+                    os.unlink(f.path)
+                except OSError:
+                    pass
+    return entries, total
+
+
+def evict(target_bytes):
+    # 사용 시각이 오래된 순으로 target_bytes 이하가 될 때까지 삭제. 남은 크기 반환
+    entries, total = _scan()
+    for _, size, path in sorted(entries):
+        if total <= target_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass  # 다른 프로세스가 먼저 지움
+        except OSError:
+            continue  # Windows: 다른 렌더가 mmap 으로 열어 둔 파일은 지울 수 없음 (크기 그대로)
+        total -= size
+    return total
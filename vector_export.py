@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+# Manim Community 0.19.x
+# 벡터 내보내기: 씬 타임라인을 SMIL 애니메이션 SVG 한 파일로 저장 (래스터/인코딩 없음, 브라우저가 그림)
+# 사용 예:
+#   python render.py onb_5.py OnboardingFlow --svg out/svg        # -> out/svg/OnboardingFlow.svg
+#   from vector_export import export_svg
+#   export_svg(OnboardingFlow, "out/OnboardingFlow.svg")
+#
+# - 드라이런처럼 Cairo 없이 construct() 와 보간을 돌리고, 프레임마다 화면의 VMobject 상태를 표본으로 뜬다.
+# - 도형 하나 = <path> 하나. 바뀌지 않는 속성은 정적 속성으로 한 번만 쓰고, 바뀌는 속성만 키프레임:
+#     fill / fill-opacity / stroke / stroke-opacity / stroke-width : <animate> (linear)
+#     아핀 이동(Wiggle, shift, scale, rotate)                       : <animateTransform> translate/rotate/skewX/scale
+#     모양 자체 변화(Create, Transform 등)                          : <animate attributeName="d"> (프레임 단위 discrete)
+#     등장/퇴장                                                     : visibility (discrete)
+#   연속 키가 직선 보간으로 충분하면 줄여서 씀 (_TOL).
+# - 지원하지 않음: 이미지(ImageMobject, 히어로 배경 배열), 그라디언트(첫 색만), 배경 선(background stroke),
+#   선 끝/이음 모양. 이런 도형이 있으면 개수만 경고로 남김.
+
+import math
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+from manim import *
+
+from dry_run import NullCamera
+from fast_renderer import _affine_fit, _pixel_matrix
+
+_TOL = {"opacity": 0.004, "color": 1.0, "px": 0.25, "deg": 0.1, "scale": 0.002}
+
+
+# ===== 표본 =====
+def _hex(rgba):
+    return "#{:02x}{:02x}{:02x}".format(*(int(round(float(c) * 255)) for c in rgba[:3]))
+
+
+def _path_d(mobject, pixel):
+    # Camera.set_cairo_context_path 와 같은 순서로 픽셀 좌표 SVG path
+    points = mobject.points
+    if not len(points):
+        return ""
+    parts = []
+    for subpath in mobject.gen_subpaths_from_points_2d(points):
+        xy = subpath[:, :2] @ pixel[:2, :2].T + pixel[:2, 2]
+        parts.append("M{:.2f} {:.2f}".format(*xy[0]))
+        for i in range(0, len(xy) - 3, 4):
+            parts.append("C{:.2f} {:.2f} {:.2f} {:.2f} {:.2f} {:.2f}".format(*xy[i + 1], *xy[i + 2], *xy[i + 3]))
+        if mobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            parts.append("Z")
+    return "".join(parts)
+
+
+def _decompose(A, b, pixel):
+    # 프레임 좌표 아핀 (A, b) -> 픽셀 좌표 translate/rotate/skewX/scale
+    affine = np.eye(3)
+    affine[:2, :2] = A
+    affine[:2, 2] = b
+    M = pixel @ affine @ np.linalg.inv(pixel)
+    a, c, e = M[0]
+    bb, d, f = M[1]
+    sx = math.hypot(a, bb)
+    sy = (a * d - bb * c) / sx
+    rot = math.degrees(math.atan2(bb, a))
+    skew = math.degrees(math.atan((a * c + bb * d) / (sx * sy)))
+    return (round(e, 2), round(f, 2), round(rot, 2), round(skew, 2), round(sx, 4), round(sy, 4))
+
+
+_IDENTITY = (0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
+
+
+class _Track:
+    def __init__(self, mobject, order):
+        self.mobject = mobject  # 참조를 잡아 두어 id 재사용 방지
+        self.order = order
+        self.shapes = []        # 모양이 바뀔 때마다 path d
+        self.keys = []          # [(프레임, 상태 또는 None=안 보임)] 바뀔 때만
+        self._ref = None
+        self._points = None
+        self._transform = _IDENTITY
+
+    def sample(self, frame, m, pixel, px_per_unit, line_px):
+        points = m.points[:, :2]
+        if self._points is None or not np.array_equal(points, self._points):
+            fit = None
+            if self._ref is not None and self._ref.shape == points.shape:
+                fit = _affine_fit(self._ref, points, px_per_unit)
+            if fit is None:
+                self.shapes.append(_path_d(m, pixel))
+                self._ref = points.copy()
+                self._transform = _IDENTITY
+            else:
+                self._transform = _decompose(fit[0], fit[1], pixel)
+            self._points = points.copy()
+        fill = m.get_fill_rgbas()[0]
+        stroke = m.get_stroke_rgbas()[0]
+        state = (
+            len(self.shapes) - 1, self._transform,
+            _hex(fill), round(float(fill[3]), 3),
+            _hex(stroke), round(float(stroke[3]), 3),
+            round(float(m.get_stroke_width()) * line_px, 2),
+        )
+        if not self.keys or self.keys[-1][1] != state:
+            self.keys.append((frame, state))
+
+    def hide(self, frame):
+        if self.keys and self.keys[-1][1] is not None:
+            self.keys.append((frame, None))
+
+
+# ===== 렌더러 =====
+class VectorRenderer(CairoRenderer):
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=NullCamera, **kwargs)
+        self.frames = 0
+        self.tracks = {}
+        self.skipped = 0
+        self._scene = None
+
+    def play(self, scene, *args, **kwargs):
+        self._scene = scene
+        super().play(scene, *args, **kwargs)
+
+    def get_frame(self):
+        return self.camera.pixel_array  # 그리지 않으므로 복사할 필요 없음
+
+    def render(self, scene, time, moving_mobjects):
+        self._sample(scene, 1)
+
+    def freeze_current_frame(self, duration):
+        self._sample(self._scene, int(duration / (1 / self.camera.frame_rate)))
+
+    def _sample(self, scene, num_frames):
+        if self.skip_animations or num_frames <= 0:
+            return
+        cam = self.camera
+        pixel = _pixel_matrix(cam, 1)
+        px_per_unit = cam.pixel_width / cam.frame_width
+        line_px = cam.cairo_line_width_multiple * px_per_unit
+        seen = set()
+        for m in cam.get_mobjects_to_display(scene.mobjects):
+            if not isinstance(m, VMobject):
+                if isinstance(m, AbstractImageMobject) and id(m) not in self.tracks:
+                    self.tracks[id(m)] = None
+                    self.skipped += 1
+                continue
+            if not len(m.points):
+                continue
+            track = self.tracks.get(id(m))
+            if track is None or track.mobject is not m:
+                track = self.tracks[id(m)] = _Track(m, len(self.tracks))
+            track.sample(self.frames, m, pixel, px_per_unit, line_px)
+            seen.add(id(m))
+        for key, track in self.tracks.items():
+            if track is not None and key not in seen:
+                track.hide(self.frames)
+        self.frames += num_frames
+        self.time += num_frames / self.camera.frame_rate
+
+
+# ===== SVG =====
+def _series(keys, get):
+    # [(프레임, 값)] 값이 바뀌는 지점만 (안 보이는 구간은 직전 값 유지)
+    out = []
+    for frame, state in keys:
+        if state is None:
+            continue
+        value = get(state)
+        if not out or out[-1][1] != value:
+            out.append((frame, value))
+    return out
+
+
+def _linear_keys(series, total, tol):
+    # 바뀌기 직전 프레임에 직전 값을 다시 넣어 정지 구간이 보간되지 않게 한 뒤, 직선으로 충분한 키는 뺌
+    points = [(0, series[0][1])]
+    for frame, value in series[1:]:
+        if frame - 1 > points[-1][0]:
+            points.append((frame - 1, points[-1][1]))
+        points.append((frame, value))
+    if points[-1][0] < total:
+        points.append((total, points[-1][1]))
+    kept = [points[0]]
+    for i in range(1, len(points) - 1):
+        t0, v0 = kept[-1]
+        t1, v1 = points[i]
+        t2, v2 = points[i + 1]
+        u = (t1 - t0) / (t2 - t0)
+        if max(abs(a + (c - a) * u - b) for a, b, c in zip(v0, v1, v2)) > tol:
+            kept.append(points[i])
+    kept.append(points[-1])
+    return kept
+
+
+def _key_times(frames, total):
+    return ";".join("{:.5f}".format(f / total).rstrip("0").rstrip(".") or "0" for f in frames)
+
+
+def _animate(tag, attr, frames, values, total, dur, mode, extra=""):
+    return '<{} attributeName="{}"{} dur="{:.3f}s" fill="freeze" calcMode="{}" keyTimes="{}" values={}/>'.format(
+        tag, attr, extra, dur, mode, _key_times(frames, total), quoteattr(";".join(values)))
+
+
+def _unwrap(values):
+    out = []
+    for v in values:
+        if out:
+            while v - out[-1] > 180:
+                v -= 360
+            while v - out[-1] < -180:
+                v += 360
+        out.append(v)
+    return out
+
+
+def _track_svg(track, total, dur):
+    keys = track.keys
+    if not any(state is not None for _, state in keys):
+        return ""
+    first = next(state for _, state in keys if state is not None)
+    attrs = {"d": track.shapes[first[0]]}
+    anims = []
+
+    visible = []
+    if keys[0][0] > 0:
+        visible.append((0, "hidden"))
+    for frame, state in keys:
+        value = "hidden" if state is None else "visible"
+        if not visible or visible[-1][1] != value:
+            visible.append((frame, value))
+    if len(visible) > 1:
+        attrs["visibility"] = visible[0][1]
+        anims.append(_animate("animate", "visibility", [f for f, _ in visible],
+                              [v for _, v in visible], total, dur, "discrete"))
+
+    shapes = _series(keys, lambda s: s[0])
+    if len(shapes) > 1:
+        shapes[0] = (0, shapes[0][1])
+        anims.append(_animate("animate", "d", [f for f, _ in shapes], [track.shapes[i] for _, i in shapes],
+                              total, dur, "discrete"))
+
+    # 색/불투명도/선 두께
+    for attr, index, kind in (("fill", 2, "color"), ("fill-opacity", 3, "opacity"),
+                              ("stroke", 4, "color"), ("stroke-opacity", 5, "opacity"),
+                              ("stroke-width", 6, "px")):
+        series = _series(keys, lambda s: s[index])
+        attrs[attr] = series[0][1]
+        if len(series) < 2:
+            continue
+        if kind == "color":
+            rgb = [(f, tuple(int(v[i:i + 2], 16) for i in (1, 3, 5))) for f, v in series]
+            points = _linear_keys(rgb, total, _TOL["color"])
+            values = ["#{:02x}{:02x}{:02x}".format(*v) for _, v in points]
+        else:
+            points = _linear_keys([(f, (v,)) for f, v in series], total, _TOL[kind])
+            values = ["{:g}".format(v[0]) for _, v in points]
+        anims.append(_animate("animate", attr, [f for f, _ in points], values, total, dur, "linear"))
+
+    # 아핀 이동
+    transforms = _series(keys, lambda s: s[1])
+    if any(t != _IDENTITY for _, t in transforms):
+        rot = _unwrap([t[2] for _, t in transforms])
+        parts = (
+            ("translate", [(f, (t[0], t[1])) for f, t in transforms], _TOL["px"]),
+            ("rotate", [(f, (r,)) for (f, _), r in zip(transforms, rot)], _TOL["deg"]),
+            ("skewX", [(f, (t[3],)) for f, t in transforms], _TOL["deg"]),
+            ("scale", [(f, (t[4], t[5])) for f, t in transforms], _TOL["scale"]),
+        )
+        for kind, series, tol in parts:
+            points = _linear_keys(series, total, tol)
+            values = [" ".join("{:g}".format(x) for x in v) for _, v in points]
+            anims.append(_animate("animateTransform", "transform", [f for f, _ in points], values, total, dur,
+                                  "linear", ' type="{}" additive="sum"'.format(kind)))
+
+    if attrs["fill-opacity"] == 0 and len(_series(keys, lambda s: s[3])) == 1:
+        attrs["fill"] = "none"
+        del attrs["fill-opacity"]
+    head = "<path " + " ".join("{}={}".format(k, quoteattr(str(v))) for k, v in attrs.items())
+    if not anims:
+        return head + "/>"
+    return head + ">" + "".join(anims) + "</path>"
+
+
+def build_svg(renderer):
+    cam = renderer.camera
+    total = max(renderer.frames, 1)
+    dur = total / cam.frame_rate
+    width, height = cam.pixel_width, cam.pixel_height
+    lines = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{1}" viewBox="0 0 {0} {1}">'.format(width, height),
+        '<rect width="100%" height="100%" fill="{}"/>'.format(ManimColor(config.background_color).to_hex()),
+    ]
+    tracks = sorted((t for t in renderer.tracks.values() if t is not None), key=lambda t: t.order)
+    for track in tracks:
+        element = _track_svg(track, total, dur)
+        if element:
+            lines.append(element)
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
+
+
+def export_svg(scene_cls, output):
+    with tempconfig({"dry_run": True, "disable_caching": True}):
+        renderer = VectorRenderer()
+        scene_cls(renderer=renderer).render()
+        svg = build_svg(renderer)
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(svg, encoding="utf-8")
+    if renderer.skipped:
+        logger.warning("%s: 이미지 %d개는 SVG 에 넣지 않음", scene_cls.__name__, renderer.skipped)
+    logger.info("%s: %.2fs, 도형 %d개 -> %s (%.1fKB)", scene_cls.__name__, renderer.frames / renderer.camera.frame_rate,
+                len(renderer.tracks) - renderer.skipped, output, output.stat().st_size / 1024)
+    return output